@@ -50,8 +50,9 @@ import contextlib
 import tkinter as tk
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
-from modules import carga_archivos, analisis_basico, habilidades
+from modules import carga_archivos, analisis_basico, habilidades, motor
 from modules.analisis_basico import contiene_lista_sospechosa
+from modules.contexto import ContextoAnalisis
 from modules.pdf_exporter import exportar_resultado_pdf
 from modules.donacion import mostrar_popup_donacion
 
@@ -255,11 +256,8 @@ def mostrar_menu():
 # FLUJO PRINCIPAL DEL SISTEMA
 # ----------------------------
 def main():
-    # Carga inicial del diccionario de lemas (incluye skills_custom.json si existe)
-    try:
-        habilidades.construir_diccionario_lemas()
-    except Exception as e:
-        print(f"ℹ️ Aviso: no se pudo construir el diccionario de lemas al inicio ({e}). Continuando...")
+    # El modelo y el diccionario de lemas (incluye skills_custom.json) se construyen
+    # en el primer análisis (motor perezoso): el menú aparece de inmediato.
 
     # Ruta al archivo del CV para esta sesión (preferimos el recordado)
     ruta_cv = _get_last_cv_path() or None
@@ -351,9 +349,22 @@ def main():
                 input("Presione Enter para continuar...")
                 continue
 
+            # Inicialización del motor (modelo + vocabulario): solo en el primer análisis
+            if not motor.MOTOR.esta_listo():
+                print("⏳ Preparando el motor de análisis (solo la primera vez)...")
+                try:
+                    motor.warm_up()
+                except Exception as e:
+                    print(f"ℹ️ Aviso: no se pudo inicializar el motor ({e}). Continuando...")
+
+            # Contexto compartido: CV y oferta se analizan con spaCy una sola vez en todo el flujo
+            ctx = ContextoAnalisis(texto_cv, texto_oferta)
+            # Textos con vistas normalizadas cacheadas (siguen siendo str)
+            texto_cv, texto_oferta = ctx.texto_cv, ctx.texto_oferta
+
             # Advertencia ética (umbral ajustado en analisis_basico.contiene_lista_sospechosa)
             try:
-                sospechosa = contiene_lista_sospechosa(texto_cv)
+                sospechosa = contiene_lista_sospechosa(texto_cv, ctx=ctx)
 
                 if sospechosa:
                     print("⚠️ Advertencia ética: Se detectaron secciones con alta densidad de palabras clave; los ATS reales podrían penalizarlas.")
@@ -371,13 +382,13 @@ def main():
 
             # Categorizar y analizar (manejo robusto de errores)
             try:
-                cat_oferta = analisis_basico.categorizar_texto(texto_oferta)
-                cat_cv = analisis_basico.categorizar_texto(texto_cv)
+                cat_oferta = analisis_basico.categorizar_texto(texto_oferta, ctx=ctx)
+                cat_cv = analisis_basico.categorizar_texto(texto_cv, ctx=ctx)
 
                 buf = io.StringIO()
                 with contextlib.redirect_stdout(buf):
                     resultado_dict = analisis_basico.mostrar_resultados(
-                        cat_oferta, cat_cv, texto_cv, texto_oferta
+                        cat_oferta, cat_cv, texto_cv, texto_oferta, ctx=ctx
                     )
                 texto_resultado = buf.getvalue()
 
@@ -405,7 +416,7 @@ def main():
             # AUTOAPRENDIZAJE DE NUEVAS SKILLS (insights de mercado)
             # ----------------------------
             try:
-                nuevas_skills = habilidades.detectar_nuevas_habilidades(texto_oferta)
+                nuevas_skills = habilidades.detectar_nuevas_habilidades(texto_oferta, ctx=ctx)
                 nuevas_filtradas = [s for s in nuevas_skills if len(s) > 2]
             except Exception:
                 nuevas_filtradas = []
@@ -32,33 +32,43 @@
 # analisis_basico.py - Motor de análisis (baseline estable + reglas externas)
 # ==========================
 import re
+import hashlib
 import unicodedata
-import spacy
-
-from datetime import datetime
-from modules import requisitos
-from modules.requisitos import evaluate_requirements, learn_requirement
+import numpy as np
+from collections import OrderedDict
+
+from modules import requisitos, modelo_nlp, memo_requisitos
+from modules.modelo_nlp import procesar, procesar_lote
+from modules.contexto import ContextoAnalisis, doc_de
+from modules.frases import EscanerFrases, GruposEquivalencia, contiene_frase
+from modules.estructura_oferta import SECTION_HEADERS, estructura_de
+from modules.hechos import (
+    HARD_MARKERS, SOFT_MARKERS, SECTOR_EQUIV, EN_LEVELS, ACADEMIC_EQUIV,
+    hechos_oferta, hechos_cv, marcador_duro, marcador_blando
+)
+from modules.normalizacion import (
+    limpiar_texto, normalizar_para_nlp, LIGATURES, ALIAS_REGEX,
+    TextoNormalizado, vista_nlp, vista_plana, vista_plana_literal, vista_lineas,
+    vista_derivada, sustituir_alias
+)
+from modules.requisitos import (
+    evaluate_requirements, learn_requirement, version_evaluacion, repetir_aprendizaje
+)
 from modules.habilidades import (
     tech_skills, soft_skills, exp_terms,
-    LEMA_A_PALABRA, construir_diccionario_lemas,
+    LEMA_A_PALABRA, asegurar_vocabulario, version_vocabulario,
     VERBS_PERMITIDOS, _similarity_to_corpora as _sim_corpora,
     _skillness, _clean_chunk_text, HEAD_NOUNS,
-    GENERIC_NOUNS, ABSTRACT_TERMS
+    GENERIC_NOUNS, ABSTRACT_TERMS, similitudes_categorias, rasgos_palabra
 )
 
 # ----------------------------
 # CARGA DE MODELO
 # ----------------------------
 
-try:
-    nlp = spacy.load("es_core_news_lg")
-except Exception:
-    try:
-        nlp = spacy.load("es_core_news_md")
-        print("ℹ️ [analisis] Usando es_core_news_md (fallback).")
-    except Exception:
-        nlp = spacy.load("es_core_news_sm")
-        print("ℹ️ [analisis] Usando es_core_news_sm (fallback sin vectores).")
+# Mismo objeto que usa habilidades (registro compartido, fallback lg -> md -> sm).
+# Proxy perezoso: el modelo se carga en el primer análisis o con motor.warm_up().
+nlp = modelo_nlp.NLP
 
 # ----------------------------
 # CONSTANTES / PARÁMETROS
@@ -167,21 +177,29 @@ WHITELIST_TECH_PHRASES = {
 
 
 
-# Cabeceras/secciones típicas
-SECTION_HEADERS = (
-    "mision del cargo","misión del cargo", 
-    "responsabilidades principales","responsabilidades",
-    "requisitos","requerimientos","perfil","sobre nosotros",
-    "requisitos del cargo","requisitos del puesto", 
-    "competencias y habilidades","competencias", "habilidades", 
-    "diferenciales", "diferenciales del cargo", "diferenciales del puesto",
-    "formacion","formación", "educacion","educación", "estudios", "estudios requeridos",
-    "experiencia", "experiencia requerida", "experiencia deseable",
-    "lo que buscamos", "lo que buscamos en el candidato", 
-    "lo que buscamos en la candidata", "lo que buscamos en el perfil", 
-    "lo que buscamos en el postulante", "lo que buscamos en el aspirante", 
-    "lo que buscamos en el talento"
-    )
+# Tokens técnicos que se detectan literalmente como palabra (incluye alfanuméricos)
+TOKENS_TECNICOS_LITERALES = {"python", "sql", "aws", "azure", "gcp", "n8n", "salesforce", 
+                             "hubspot", "docker", "kubernetes", "react", "nodejs", "tableau", 
+                             "pandas","moodle", "tic", "tac", "tep", "lms", "e-learning", 
+                             "elearning", "blackboard", "canvas", "schoology",}
+
+# Escáner multi-frase (modules/frases.py) sobre tokens literales, whitelist y tech_skills.
+# tech_skills crece con lo aprendido: se reconstruye cuando cambia version_vocabulario().
+_ESCANER_TECNICO = {"version": None, "escaner": None}
+
+
+def _escaner_tecnico() -> EscanerFrases:
+    version = version_vocabulario()
+    if _ESCANER_TECNICO["version"] != version:
+        origenes = dict.fromkeys(tech_skills, "tecnica")
+        origenes.update(dict.fromkeys(WHITELIST_TECH_PHRASES, "whitelist"))
+        origenes.update(dict.fromkeys(TOKENS_TECNICOS_LITERALES, "literal"))
+        _ESCANER_TECNICO["escaner"] = EscanerFrases(origenes)
+        _ESCANER_TECNICO["version"] = version
+    return _ESCANER_TECNICO["escaner"]
+
+
+# Cabeceras/secciones típicas: SECTION_HEADERS vive en modules/estructura_oferta.py
 
 
 DEBUG_ATS = False
@@ -194,40 +212,59 @@ def _dbg(*args):
 # ----------------------------
 # LIMPIEZA / NORMALIZACIÓN
 # ----------------------------
-def limpiar_texto(texto):
-    texto = (texto or "").lower()
-    texto = ''.join(c for c in unicodedata.normalize('NFD', texto)
-                    if unicodedata.category(c) != 'Mn')
-    texto = re.sub(r'[^\w\s]', '', texto)
-    return texto
-
-def contiene_lista_sospechosa(texto):
+# (implementación en normalizacion.py; se reexportan aquí para los módulos que las importan)
+
+
+# Veredictos memorizados: (sha1 del texto, versión del vocabulario) -> bool
+_VEREDICTOS_LISTA = OrderedDict()
+_VEREDICTOS_LISTA_MAX = 64
+
+def contiene_lista_sospechosa(texto, ctx=None):
     """
     Dispara si:
     - Hay ≥2 líneas con viñeta y densidad ≥6 términos del diccionario, o
     - Hay ≥3 líneas consecutivas (aunque sin viñeta) con densidad ≥8.
+    El veredicto se memoriza por hash del texto y versión del vocabulario;
+    con ctx (ContextoAnalisis) además se reutiliza dentro del análisis.
     """
     if not texto:
         return False
-
-    lines = texto.splitlines()
+    if ctx is not None:
+        return ctx.memo(("lista_sospechosa", texto), lambda: contiene_lista_sospechosa(texto))
+    asegurar_vocabulario()
+
+    clave = (hashlib.sha1(texto.encode("utf-8")).hexdigest(), version_vocabulario())
+    if clave in _VEREDICTOS_LISTA:
+        _VEREDICTOS_LISTA.move_to_end(clave)
+        return _VEREDICTOS_LISTA[clave]
+
+    veredicto = _lista_sospechosa(texto)
+    _VEREDICTOS_LISTA[clave] = veredicto
+    while len(_VEREDICTOS_LISTA) > _VEREDICTOS_LISTA_MAX:
+        _VEREDICTOS_LISTA.popitem(last=False)
+    return veredicto
+
+def _lista_sospechosa(texto):
+    lines = [raw.strip() for raw in vista_lineas(texto)]
     bullet = tuple("•-*·")
 
+    # densidad por lemas: todas las líneas en un solo lote (nlp.pipe, perfil de lemas)
+    limpias = [limpiar_texto(ln) if ln else "" for ln in lines]
+    unicas = list(dict.fromkeys(l for l, ln in zip(limpias, lines) if ln))
+    densidad = {}
+    for limpia, doc in zip(unicas, procesar_lote(unicas, "lemas")):
+        densidad[limpia] = sum(1 for t in doc if t.is_alpha and t.lemma_.lower() in LEMA_A_PALABRA)
+
     # contadores
     bul_dense = 0
     consec_dense = 0
 
-    for raw in lines:
-        ln = raw.strip()
+    for ln, limpia in zip(lines, limpias):
         if not ln:
             consec_dense = 0
             continue
 
-        # densidad por lemas
-        tokens = [t.lemma_.lower() for t in nlp(limpiar_texto(ln)) if t.is_alpha]
-        dense = sum(1 for w in tokens if w in LEMA_A_PALABRA)
-
-
+        dense = densidad[limpia]
 
         # caso bullet
         if ln[:1] in bullet and dense >= 7:
@@ -245,122 +282,31 @@ def contiene_lista_sospechosa(texto):
 
     return False
 
-LIGATURES = {"\ufb01": "fi", "\ufb02": "fl"}
-ALIAS_REGEX = [
-    (r"(?i)fin[\-\s]?tech", "fintech"),
-    (r"(?i)ciber[\-\s]?seguridad", "ciberseguridad"),
-    (r"(?i)big[\-\s]?data", "big data"),
-    (r"(?i)machine[\-\s]?learning", "machine learning"),
-    (r"(?i)\bservicio\s+sla\b", "cumplimiento de sla"),
-    (r"(?i)\bacuerdos?\s+de\s+servicio\b", "cumplimiento de sla"),
-    (r"(?i)\bproject\s+management\b", "gestión de proyectos"),
-    (r"(?i)\bagile\b", "metodologías ágiles"),
-
-]
-def normalizar_para_nlp(texto: str) -> str:
-    """
-    Normaliza texto para análisis:
-    - NFKC (caracteres “raros” → normales)
-    - Sustituye NBSP/guiones suaves/zero-width por espacio
-    - Colapsa múltiple espacio
-    - Aplica alias (fin-tech → fintech, etc.)
-    """
-    texto = texto or ""
-    # Normalización de compatibilidad (acentos/ligaduras invisibles coherentes)
-    texto = unicodedata.normalize("NFKC", texto)
-
-    # Espacios y guiones invisibles → espacio normal
-    texto = (texto
-             .replace("\u00A0", " ")   # NBSP
-             .replace("\u2007", " ")   # Figure space
-             .replace("\u202F", " ")   # Narrow NBSP
-             .replace("\u200B", " ")   # Zero width space
-             .replace("\u200C", " ")
-             .replace("\u200D", " ")
-             .replace("\u2060", " ")
-             .replace("\u2011", "-")   # Non-breaking hyphen → hyphen normal
-             .replace("\u2013", "-")   # En dash → hyphen normal
-            .replace("\u2014", "-")   # Em dash → hyphen normal
-
-    )
-
-    # Slashes pegados → separar
-    texto = texto.replace("/", " / ")
-
-    # Aplicar alias específicos
-    for patron, repl in ALIAS_REGEX:
-        texto = re.sub(patron, repl, texto)
-
-    # Colapsar múltiple espacio
-    texto = re.sub(r"\s+", " ", texto).strip()
-    return texto
-
-
 def _contains_phrase(texto: str, frase: str) -> bool:
     """
     Busca una 'frase' dentro de 'texto' tolerando NBSP, saltos, guiones invisibles,
-    y puntuación intermedia. Convierte la frase en un patrón \W+ entre tokens.
+    y puntuación intermedia. El patrón \W+ entre tokens se compila una vez (modules/frases.py).
     """
-    if not texto or not frase:
-        return False
-    
-    tokens = [re.escape(t) for t in frase.strip().split()]
-    if not tokens:
-        return False
-    patron = r"\b" + r"\W+".join(tokens) + r"\b"
-    return re.search(patron, texto, flags=re.IGNORECASE) is not None
+    return contiene_frase(texto, frase)
 
 # ----------------------------
 # HELPERS: CONTEXTO "REQUISITO DURO", INGLÉS (A1-C2) Y MAESTRÍAS OBLIGATORIAS
 # ----------------------------
 
-HARD_MARKERS = {
-    "obligatorio", "obligatoria", "mandatorio", "mandatoria",
-    "indispensable", "imprescindible", "debe", "deberá", "debera",
-    "requisito excluyente", "excluyente", "mínimo", "minimo", "must",
-    "required","mandatory","essential","must have","required experience",
-    "mandatory requirement", "essential requirement", "must have experience",
-    "must have skill", "required skill", "mandatory skill", "essential skill"
-}
-
-SOFT_MARKERS = {
-    "preferiblemente", "deseable", "idealmente", "se valora", "se valorara",
-    "nice to have", "opcional", "plus", "sera un plus", "será un plus",
-    "valorable", "se aprecia", "se apreciara", "seria un plus", "sería un plus",
-    "se considerara", "se considerará", "considerar[áa]", "seria deseable", "sería deseable"
-}
-
+# HARD_MARKERS / SOFT_MARKERS viven en modules/hechos.py (los usa también el extractor de hechos)
 
 
 def _en_seccion_requisitos(core: str, oferta_txt: str) -> bool:
     """
     True si el core aparece dentro de una sección tipo:
     Requisitos / Conocimientos requeridos / Perfil requerido / Requisitos del cargo
+    (ventana calculada una vez por oferta en EstructuraOferta)
     """
     if not core or not oferta_txt:
         return False
 
-    o = normalizar_para_nlp(oferta_txt.lower())
     c = normalizar_para_nlp(core.lower())
-
-    # anclas típicas de secciones
-    m = re.search(
-        r"\b("
-        r"requisitos?|"
-        r"conocimientos\s+requeridos?|"
-        r"conocimientos\s+obligatorios?|"
-        r"estudios\s+requeridos?|"
-        r"perfil\s+requerido|"
-        r"requisitos\s+del\s+cargo"
-        r")\b",
-        o
-    )
-
-    if not m:
-        return False
-
-    ventana = o[m.start(): m.start() + 900]
-    return _contains_phrase(ventana, c)
+    return estructura_de(oferta_txt).en_seccion_requisitos(c)
 
 
 
@@ -375,7 +321,8 @@ def _contexto_requisito_duro(core: str, oferta_txt: str) -> bool:
     if not core or not oferta_txt:
         return False
 
-    o = normalizar_para_nlp(oferta_txt.lower())
+    estructura = estructura_de(oferta_txt)
+    o = estructura.nlp
     c = normalizar_para_nlp(core.lower())
 
     # Si no aparece, no puede ser duro
@@ -385,25 +332,21 @@ def _contexto_requisito_duro(core: str, oferta_txt: str) -> bool:
     # ✅ evaluar una vez
     en_req = _en_seccion_requisitos(core, oferta_txt)
 
-    # Evaluar por segmentos (líneas / frases)
-    segmentos = re.split(r"[\n\.\;\|]+", o)
-    for seg in segmentos:
-        if not _contains_phrase(seg, c):
-            continue
-
-        seg_soft = any(s in seg for s in SOFT_MARKERS)
+    # Evaluar por segmentos (líneas / frases) que contienen el core
+    for seg in estructura.segmentos_con(c):
+        seg_soft = marcador_blando(seg)
 
         # ✅ Si está dentro de la sección de requisitos, es DURO salvo que el MISMO segmento lo marque como deseable
         if en_req and not seg_soft:
             return True
 
         # si el segmento marca deseable/preferible → NO duro (si no hay evidencia dura)
-        if seg_soft and not any(h in seg for h in HARD_MARKERS):
+        if seg_soft and not marcador_duro(seg):
             continue
 
 
         # marcador duro explícito cerca
-        if any(h in seg for h in HARD_MARKERS):
+        if marcador_duro(seg):
             return True
 
         # duro por estar dentro de sección requisitos (sin soft markers)
@@ -434,7 +377,8 @@ def _extraer_bloque(oferta_txt: str, header: str, stops=None) -> str:
     Extrae el texto desde el encabezado `header` hasta antes de cualquiera de `stops`.
     Robusto a bullets y saltos.
     """
-    txt = _norm_txt(oferta_txt)
+    estructura = estructura_de(oferta_txt)
+    txt = estructura.memo("norm_txt", lambda: _norm_txt(estructura.texto))
     header_n = _norm_txt(header)
 
     if stops is None:
@@ -480,16 +424,11 @@ _CANON = {
     "reingenieria": ["reingenieria de procesos", "reingenieria"],
     "sistemas_gestion": ["sistemas de gestion", "iso", "sgc"],
 }
+# Alias ya pasados por _norm_txt en un escáner de subcadenas (una pasada por texto)
+_CANON_GRUPOS = GruposEquivalencia(_CANON, _norm_txt, literal=True)
 
 def _keywords_de_core(core: str) -> set:
-    c = _norm_txt(core)
-    found = set()
-    for k, aliases in _CANON.items():
-        for a in aliases:
-            if _norm_txt(a) in c:
-                found.add(k)
-                break
-    return found
+    return set(_CANON_GRUPOS.claves_en(_norm_txt(core)))
 
 def _en_seccion_conocimientos_requeridos(core: str, oferta_txt: str) -> bool:
     req = _extraer_bloque(oferta_txt, "conocimientos requeridos",
@@ -504,11 +443,7 @@ def _en_seccion_conocimientos_requeridos(core: str, oferta_txt: str) -> bool:
         return bool(c and c in req)
 
     # si cualquier keyword del core aparece en el bloque requeridos => True
-    for k in core_k:
-        for a in _CANON.get(k, []):
-            if _norm_txt(a) in req:
-                return True
-    return False
+    return not core_k.isdisjoint(_CANON_GRUPOS.claves_en(req))
 
 def _en_seccion_conocimientos_deseables(core: str, oferta_txt: str) -> bool:
     des = _extraer_bloque(
@@ -524,12 +459,7 @@ def _en_seccion_conocimientos_deseables(core: str, oferta_txt: str) -> bool:
         c = _norm_txt(core)
         return bool(c and c in des)
 
-    for k in core_k:
-        for a in _CANON.get(k, []):
-            if _norm_txt(a) in des:
-                return True
-
-    return False
+    return not core_k.isdisjoint(_CANON_GRUPOS.claves_en(des))
 
 
 
@@ -539,229 +469,50 @@ def _detectar_maestria_obligatoria(oferta_txt: str):
     Captura patrones tipo:
         - 'Obligatorio tener maestría en pedagogía'
         - 'obligatorio: maestria en X'
-        Devuelve lista de 'maestria en <campo>'.
+        Devuelve lista de 'maestria en <campo>' (HechosOferta.maestrias).
     """
     if not oferta_txt:
         return []
-
-    o = normalizar_para_nlp(oferta_txt.lower())
-    tags = []
-
-    # patrón 1: obligatorio + maestria en <campo>
-    for m in re.finditer(r"\bobligatori[oa]\b.{0,80}\bmaestr[ií]a\b.{0,20}\ben\b\s+([a-z0-9áéíóúñü\s]{3,60})", o):
-        campo = m.group(1).strip()
-        # recortar campo a máximo 6 palabras para evitar capturas largas
-        campo = " ".join(campo.split()[:6]).strip()
-        if campo:
-            tags.append(f"Formación requerida: maestría en {campo}")
-
-    # patrón 2: 'maestria en X' + (obligatorio/mandatorio/excluyente) en el mismo segmento
-    segmentos = re.split(r"[\n\.\;\|]+", o)
-    for seg in segmentos:
-        if any(h in seg for h in HARD_MARKERS) and "maestr" in seg and " en " in seg:
-            m2 = re.search(r"\bmaestr[ií]a\b.{0,20}\ben\b\s+([a-z0-9áéíóúñü\s]{3,60})", seg)
-            if m2:
-                campo = " ".join(m2.group(1).strip().split()[:6]).strip()
-                if campo:
-                    tags.append(f"Formación requerida: maestría en {campo}")
-
-    # dedupe preservando orden
-    out, seen = [], set()
-    for t in tags:
-        if t not in seen:
-            out.append(t)
-            seen.add(t)
-    return out
+    return list(hechos_oferta(oferta_txt).maestrias)
 
 
 # ----------------------------
 # HELPERS: AÑOS DE EXPERIENCIA (mínimos) Y SECTOR/ÁREA (hard only by contexto)
 # ----------------------------
 
-SECTOR_EQUIV = {
-    "financiero": {"financiero", "banca", "banco", "banking", "pagos", "switch", "transaccional", "tarjetas"},
-    "infraestructura": {"infraestructura", "obras", "obra", "construccion", "construcción", "transporte masivo", "civil"},
-    "educativo": {"educativo", "educación", "educacion", "universidad", "docencia", "moodle", "lms"},
-    "tecnologia": {"tecnologia", "tecnología", "ti", "it", "software", "saas", "cloud", "digital"},
-    "manufactura": {"manufactura", "planta", "produccion", "producción", "fabrica", "fábrica", "consumo masivo"},
-    "salud": {"salud", "hospital", "clinica", "clínica", "medico", "médico", "farmaceutica", "farmacéutica", "biotecnologia", "biotecnología"},
-    "logistica": {"logistica", "logística", "supply chain", "cadena de suministro"},
-    "comercial": {"comercial", "ventas", "marketing", "negocios", "cliente"},
-    "publico": {"público", "publico", "gobierno", "estado", "administración pública", "administracion publica"},
-    "energia": {"energía", "energia", "petroleo", "petróleo", "gas", "eléctrico", "electrico", "mineria", "minería"},
-    "turismo": {"turismo", "hotel", "hospitalidad", "viajes", "agencia de viajes"},
-    "legal": {"legal", "abogacia", "abogacía", "juridico", "jurídico", "derecho"},
-    "retail": {"retail", "comercio", "minorista", "mayorista", "cadena de tiendas"},
-    "agroindustria": {"agroindustria", "agricola", "agrícola", "ganaderia", "ganadería", "campo"},
-    "medios y entretenimiento": {"medios", "entretenimiento", "audiovisual", "publicidad", "cine", "musica", "música"},
-    "telecomunicaciones": {"telecomunicaciones", "telecom", "telefonia", "telefonía", "internet", "redes"},
-    "consultoria": {"consultoria", "consultoría", "asesoria", "asesoría", "consulting"},
-    "logistica y transporte": {"logistica", "logística", "transporte", "envios", "envíos", "cadena de suministro"},
-    "sector publico": {"público", "publico", "gobierno", "estado", "administración pública", "administracion publica"},
-    "farmaceutico y biotecnología": {"farmaceutico", "farmacéutico", "biotecnologia", "biotecnología", "salud"},
-    "produccion": {"produccion", "producción", "manufactura", "planta", "fabrica", "fábrica", "industrial"},
-    "textil": {"textil", "confeccion", "moda", "ropa", "vestimenta"},
-    "alimentacion y bebidas": {"alimentacion", "alimentación", "bebidas", "food and beverage", "food & beverage", "restauracion", "restauración"},
-    "consumo masivo": {"consumo masivo", "retail", "comercio", "minorista", "mayorista", "cadena de tiendas"},
-    "servicios profesionales": {"servicios profesionales", "consultoria", "consultoría", "asesoria", "asesoría", "consulting"},
-    "servicios": {"servicios", "atencion al cliente", "atención al cliente", "customer service"},
-    "BPO": {"bpo", "business process outsourcing", "tercerizacion de procesos", "tercerización de procesos"},
-    "cajas de compensacion": {"cajas de compensacion", "cajas de compensación", "beneficios sociales"},
-    "gobierno y administracion publica": {"gobierno", "administracion publica", "administración pública", "estado"}
-    
-    
-}
-
-
+# SECTOR_EQUIV y EN_LEVELS viven en modules/hechos.py, junto al extractor de hechos de la oferta
 
 
 def _extract_min_years_from_offer(oferta_txt: str):
     """
     Detecta mínimo de años en oferta:
         - "mínimo 5 años", "mas de 3 años", "+5 años", "experiencia mínima de 3 a 5 años"
-        Devuelve int mínimo, o None.
+        Devuelve int mínimo, o None (HechosOferta.anios_minimos).
     """
     if not oferta_txt:
         return None
-    o = limpiar_texto(normalizar_para_nlp(oferta_txt.lower()))
-
-
-    # --- Guardarraíl: NO se debe confundir antigüedad de la empresa con experiencia requerida ---
-    
-    if re.search(r"\b(\d{1,2})\s+anos\s+en\s+(el\s+)?(mercado|industria|sector)\b", o):
-        # eliminamos esos casos antes de extraer años mínimos
-        o = re.sub(r"\b\d{1,2}\s+anos\s+en\s+(el\s+)?(mercado|industria|sector)\b", " ", o)
-
-    # Si hay "años" pero NO hay señales de experiencia/candidato cerca, no extraer requisito
-    # (evita falsos por "años en el mercado", "trayectoria", "existencia")
-    if ("anos" in o) and not re.search(r"\b(experiencia|minim|minimo|anos\s+de\s+experiencia|roles?\s+similares?|cargos?\s+similares?)\b", o):
-        return None
-
-
-    # Patrones comunes
-    patrones = [
-        r"\bminim[oa]\s+(\d{1,2})\s+anos\b",
-        r"\bmas\s+de\s+(\d{1,2})\s+anos\b",
-        r"\b\d{1,2}\s*\+\s*anos\b",
-        r"\b\+(\d{1,2})\s+anos\b",
-        r"\bexperiencia\s+minim[oa]\s+de\s+(\d{1,2})\s+a\s+(\d{1,2})\s+anos\b",
-        r"\bminimo\s+(\d{1,2})\s+a\s+(\d{1,2})\s+anos\b",
-        r"\b(\d{1,2})\s+anos\s+de\s+experiencia\b",
-        r"\bexperiencia\s+de\s+(\d{1,2})\s+anos\b",
-        r"\bexperiencia\s+superior\s+a\s+(\d{1,2})\s+anos\b",
-        r"\bal\s+menos\s+(\d{1,2})\s+anos\b",
-        r"\b(\d{1,2})\s*[\-–]\s*(\d{1,2})\s+anos\b",
-        r"\bminim[oa]\s+de\s+(\d{1,2})\s+anos\b"
-
-    ]
-
-    mins = []
-    for pat in patrones:
-        for m in re.finditer(pat, o):
-            g = [x for x in m.groups() if x]
-            # rango "3 a 5" -> tomamos 3
-            try:
-                v = int(g[0])
-                mins.append(v)
-            except Exception:
-                pass
-
-    if not mins:
-        return None
-    return min(mins)  # tomamos el mínimo real del requisito (3–5 => 3)
+    return hechos_oferta(oferta_txt).anios_minimos
 
 def _cv_years_estimate(texto_cv: str):
     """
     Estima años de experiencia desde el CV:
         1) Si aparece "X años" -> toma el mayor.
         2) Si no, usa rango de años YYYY..YYYY (min..max) como aproximación de trayectoria.
-        Devuelve float o int, o None.
+        Devuelve float o int, o None (HechosCV.anios_estimados).
     """
     if not texto_cv:
         return None
-
-    cv = normalizar_para_nlp(texto_cv.lower())
-
-    # 1) explícito: "15 años", "10 anos"
-    matches = re.findall(r"\b(\d{1,2})\s+anos\b", cv)
-    vals = []
-    for x in matches:
-        try:
-            vals.append(int(x))
-        except Exception:
-            pass
-    if vals:
-        return max(vals)
-
-    # 2) inferencia por años calendario (aprox trayectoria)
-    years = []
-    for y in re.findall(r"\b(19\d{2}|20\d{2})\b", cv):
-        try:
-            years.append(int(y))
-        except Exception:
-            pass
-    if len(years) >= 2:
-        y_min, y_max = min(years), max(years)
-        # cap razonable para evitar “saltos” raros
-        if 0 < (y_max - y_min) <= 60:
-            return (y_max - y_min)
-
-    # 3) fallback: si solo hay 1 año, usamos "hoy - año"
-    if len(years) == 1:
-        try:
-            return max(0, datetime.now().year - years[0])
-        except Exception:
-            return None
-
-    return None
+    return hechos_cv(texto_cv).anios_estimados()
 
 def _extract_sector_requirements(oferta_txt: str):
     """
     Devuelve lista de sectores requeridos explícitamente en oferta (como texto),
     priorizando cuando el segmento tenga HARD_MARKERS o palabras tipo 'sector'.
+    (HechosOferta.sectores)
     """
     if not oferta_txt:
         return []
-
-    o = normalizar_para_nlp(oferta_txt.lower())
-    sectores = []
-
-    # segmentamos para evaluar contexto (hard markers)
-    segmentos = re.split(r"[\n\.\;\|]+", o)
-    for seg in segmentos:
-        seg = seg.strip()
-        if not seg:
-            continue
-
-        # Solo nos interesa si menciona sector/industria o tiene hard markers
-        ctx_hard = any(h in seg for h in HARD_MARKERS)
-        ctx_sector = ("sector" in seg) or ("industria" in seg)
-
-        # Sector solo se evalúa si hay señal real de exigencia
-        # (evita excluir por menciones blandas tipo "experiencia en el sector")
-        #ctx_sector_fuerte = ctx_hard or bool(re.search(r"\b(indispensable|necesariament[ee]|requisito\s+excluyente|excluyente)\b", seg))
-        ctx_sector_fuerte = ctx_hard
-
-        if not (ctx_sector_fuerte or ctx_sector):
-            continue
-
-
-        for key, kws in SECTOR_EQUIV.items():
-            if any(re.search(rf"\b{re.escape(kw)}\b", seg) for kw in kws):
-                # si hay soft markers y NO hay hard markers => deseable
-                if (any(s in seg for s in SOFT_MARKERS) and not any(h in seg for h in HARD_MARKERS)):
-                    sectores.append(f"Sector deseable: {key}")
-                else:
-                    sectores.append(f"Sector requerido: {key}")
-
-
-    # dedupe preservando orden
-    out, seen = [], set()
-    for s in sectores:
-        if s not in seen:
-            out.append(s)
-            seen.add(s)
-    return out
+    return list(hechos_oferta(oferta_txt).sectores)
 
 def _cv_has_sector(texto_cv: str, sector_key: str) -> bool:
     """
@@ -769,11 +520,7 @@ def _cv_has_sector(texto_cv: str, sector_key: str) -> bool:
     """
     if not texto_cv or not sector_key:
         return False
-    cv = normalizar_para_nlp(texto_cv.lower())
-    kws = SECTOR_EQUIV.get(sector_key, set())
-    if not kws:
-        return False
-    return any(re.search(rf"\b{re.escape(kw)}\b", cv) for kw in kws)
+    return hechos_cv(texto_cv).tiene_sector(sector_key)
 
 
 def _extract_domain_years_requirements(oferta_txt: str):
@@ -785,109 +532,23 @@ def _extract_domain_years_requirements(oferta_txt: str):
         Retorna lista de dicts:
             {"years": int, "domain": str, "hard": bool, "raw": str}
             Domain se mapea a claves de SECTOR_EQUIV (si aplica).
+        (HechosOferta.anios_por_dominio)
     """
     if not oferta_txt:
         return []
-
-    o = normalizar_para_nlp(oferta_txt.lower())
-    segmentos = re.split(r"[\n\.\;\|]+", o)
-
-    out = []
-    for seg in segmentos:
-        seg = seg.strip()
-        if not seg:
-            continue
-
-        # requisito de años presente?
-        y = None
-
-        # patrones (incluye rango -> toma mínimo)
-        m = re.search(r"\bexperiencia\s+minim[oa]\s+de\s+(\d{1,2})\s+a\s+(\d{1,2})\s+anos\b", seg)
-        if m:
-            try:
-                y = int(m.group(1))
-            except Exception:
-                y = None
-
-        if y is None:
-            m = re.search(r"\bminim[oa]\s+(\d{1,2})\s+anos\b", seg)
-            if m:
-                y = int(m.group(1))
-
-        if y is None:
-            m = re.search(r"\bmas\s+de\s+(\d{1,2})\s+anos\b", seg)
-            if m:
-                y = int(m.group(1))
-
-        if y is None:
-            m = re.search(r"\b\+(\d{1,2})\s+anos\b", seg)
-            if m:
-                y = int(m.group(1))
-
-        if y is None:
-            continue
-
-        # buscamos “en <algo>” cercano (dominio)
-        # ejemplo: "... años en sector financiero", "... años en infraestructura"
-        dom = None
-
-        # Si menciona explícitamente "sector/industria", intentamos mapear a SECTOR_EQUIV
-        dom_candidates = []
-        if "sector" in seg or "industria" in seg:
-            for key, kws in SECTOR_EQUIV.items():
-                if any(re.search(rf"\b{re.escape(kw)}\b", seg) for kw in kws):
-                    dom_candidates.append(key)
-
-        # si no hay sector explícito, igual intentamos mapear por keywords
-        if not dom_candidates:
-            for key, kws in SECTOR_EQUIV.items():
-                if any(re.search(rf"\b{re.escape(kw)}\b", seg) for kw in kws):
-                    dom_candidates.append(key)
-
-        if dom_candidates:
-            dom = dom_candidates[0]  # priorizamos la primera coincidencia
-        else:
-            # fallback: tomamos texto después de “en” si existe (sin hacerlo demasiado largo)
-            m2 = re.search(r"\banos\s+en\s+([a-z0-9áéíóúñü\s\-]{3,50})\b", seg)
-            if m2:
-                dom = m2.group(1).strip()
-                # recorte por seguridad
-                if len(dom.split()) > 6:
-                    dom = " ".join(dom.split()[:6])
-
-        # hard si el segmento tiene marcadores duros
-        hard = any(h in seg for h in HARD_MARKERS)
-
-        out.append({
-            "years": y,
-            "domain": dom or "",
-            "hard": hard,
-            "raw": f"Experiencia requerida: mínimo {y} años en {dom}" if dom else f"Experiencia requerida: mínimo {y} años"
-        })
-
-    # dedupe
-    uniq, seen = [], set()
-    for d in out:
-        k = (d.get("years"), d.get("domain"), d.get("hard"))
-        if k not in seen:
-            uniq.append(d)
-            seen.add(k)
-    return uniq
+    return [dict(d) for d in hechos_oferta(oferta_txt).anios_por_dominio]
 
 
 def _requiere_derecho(oferta_txt: str) -> bool:
     if not oferta_txt:
         return False
-    o = normalizar_para_nlp(oferta_txt.lower())
-    return bool(re.search(r"\b(profesional\s+en\s+derecho|abogado|abogad[oa]|derecho)\b", o))
+    return hechos_oferta(oferta_txt).requiere_derecho
 
 
 
-EN_LEVELS = {"a1": 1, "a2": 2, "b1": 3, "b2": 4, "c1": 5, "c2": 6}
-
 def _extract_english_requirement(oferta_txt: str):
     """
-    Devuelve {"min_level": "c1", "hard": bool} o None.
+    Devuelve {"min_level": "c1", "hard": bool} o None (HechosOferta.ingles).
 
     HARD solo si:
         - En el MISMO segmento donde aparece inglés+nivel hay marcadores duros
@@ -896,83 +557,8 @@ def _extract_english_requirement(oferta_txt: str):
     """
     if not oferta_txt:
         return None
-
-    o = normalizar_para_nlp(oferta_txt.lower())
-    segmentos = re.split(r"[\n\.\;\|]+", o)
-
-    best = None  # {"min_level":..., "hard":...}
-
-    for i, seg in enumerate(segmentos):
-        seg = seg.strip()
-        if not seg:
-            continue
-
-        if not re.search(r"\b(ingles|ingl[eé]s|english)\b", seg):
-            continue
-
-        m = re.search(r"\b(a1|a2|b1|b2|c1|c2)\b", seg)
-        if not m:
-            continue
-
-        level = m.group(1).lower()
-
-        # --- Estabilización robusta: evaluar HARD/SOFT sin tildes (PDFs traen "mínimo" con unicode raro) ---
-        seg_plain = limpiar_texto(seg)
-
-        # helpers locales (evitan fallos por tildes/ligaduras invisibles)
-        def _has_marker_plain(text_plain: str, markers: set) -> bool:
-            for m in (markers or set()):
-                mp = limpiar_texto(m)
-                if mp and mp in text_plain:
-                    return True
-            return False
-
-        seg_soft = _has_marker_plain(seg_plain, SOFT_MARKERS)
-        # "minimo" debe disparar hard aunque venga como "mínimo" con unicode raro
-        seg_hard = (
-            "minimo" in seg_plain
-            or "mandatorio" in seg_plain
-            or "obligatorio" in seg_plain
-            or _has_marker_plain(seg_plain, HARD_MARKERS)
-        )
-
-
-        # Contexto inmediato (línea anterior/siguiente) para casos: "Inglés C1. Obligatorio."
-        idx = i
-        prev_seg = segmentos[idx - 1].strip() if idx > 0 else ""
-        next_seg = segmentos[idx + 1].strip() if (idx >= 0 and idx + 1 < len(segmentos)) else ""
-
-        prev_plain = limpiar_texto(prev_seg)
-        next_plain = limpiar_texto(next_seg)
-
-        ctx_hard = ("minimo" in prev_plain) or ("minimo" in next_plain) or _has_marker_plain(prev_plain, HARD_MARKERS) or _has_marker_plain(next_plain, HARD_MARKERS)
-        ctx_soft = _has_marker_plain(prev_plain, SOFT_MARKERS) or _has_marker_plain(next_plain, SOFT_MARKERS)
-
-
-        # Regla final:
-        # - Si hay hard (en seg o contexto) => HARD, incluso si también hay "deseable"
-        # - Si NO hay hard y sí hay soft => SOFT
-        # - Si no hay señales => SOFT (conservador)
-        if seg_hard or ctx_hard:
-            hard = True
-        elif seg_soft or ctx_soft:
-            hard = False
-        else:
-            hard = False
-
-
-        cand = {"min_level": level, "hard": hard}
-
-        # elegimos el mayor nivel encontrado (por si aparece B2 y luego C1)
-        if best is None:
-            best = cand
-        else:
-            if EN_LEVELS.get(level, 0) > EN_LEVELS.get(best["min_level"], 0):
-                best = cand
-            elif EN_LEVELS.get(level, 0) == EN_LEVELS.get(best["min_level"], 0) and hard and not best["hard"]:
-                best = cand
-
-    return best
+    ingles = hechos_oferta(oferta_txt).ingles
+    return dict(ingles) if ingles else None
 
 
 def _cv_english_level(texto_cv: str):
@@ -982,22 +568,11 @@ def _cv_english_level(texto_cv: str):
         - "Inglés: C1"
         - "English B2"
         - "Nivel de inglés B2"
+    (HechosCV.ingles)
     """
     if not texto_cv:
         return None
-
-    cv = normalizar_para_nlp(texto_cv.lower())
-
-    # buscamos segmentos donde aparezca "ingles/english" y un nivel
-    for seg in re.split(r"[\n\.\;\|]+", cv):
-        if re.search(r"\b(ingles|ingl[eé]s|english)\b", seg):
-            m = re.search(r"\b(a1|a2|b1|b2|c1|c2)\b", seg)
-            if m:
-                return m.group(1).lower()
-
-    # fallback global: si aparece un nivel suelto (menos confiable)
-    m2 = re.search(r"\b(a1|a2|b1|b2|c1|c2)\b", cv)
-    return (m2.group(1).lower() if m2 else None)
+    return hechos_cv(texto_cv).ingles
 
 
 
@@ -1014,47 +589,67 @@ ACADEMIC_TRIGGER = {
     "medicina", "salud", "educacion", "educación"
 }
 
-# Equivalencias escalables: cada clave representa un "concepto" y lista variantes aceptables en CV
-ACADEMIC_EQUIV = {
-    
-    "ingenieria de sistemas": {
+# ACADEMIC_EQUIV (equivalencias de formación que se buscan en el CV) vive en modules/hechos.py
+
+def _norm_acad(x: str) -> str:
+    return normalizar_para_nlp((x or "").lower())
+
+def _norm_acad_plano(s: str) -> str:
+    # limpiar_texto() baja a minúsculas, quita tildes y signos.
+    return limpiar_texto(normalizar_para_nlp(s or ""))
+
+# Parche académico de detectar_requisitos_excluyentes_inteligente: equivalencias que NO
+# deben excluir si el CV las cumple (se buscan en la vista "academica": _norm_acad_plano)
+_EQUIV_ACADEMICA_CV = GruposEquivalencia({
+    "informatica": {
         "ingenieria de sistemas", "ingeniería de sistemas",
+        "ingenieria informatica", "ingeniería informática",
+        "ciencias de la computacion", "ciencias de la computación",
+        "computacion", "computación",
+        "sistemas de informacion", "sistemas de información",
+        "ingenieria de software", "ingeniería de software",
         "ingeniero de sistemas", "ingeniera de sistemas",
         "ingeniero sistemas", "ingeniera sistemas",
-        "ingenieria sistemas", "ingeniería sistemas",
         "ing de sistemas", "ing. de sistemas",
         "ing sistemas", "ing. sistemas",
         "ing en sistemas", "ing. en sistemas",
-        "sistemas"  # (lo dejamos porque en este caso lo usan como afín típico)
+        "sistemas","especialista", "especialización"
+
     },
+    "mba": {
+        "mba", "maestria", "maestría", "master en administracion", "máster en administración",
+        "maestria en administracion", "maestría en administración",
+        "master of business administration"
+    }
+}, _norm_acad_plano)
 
-    "informatica": {
-        "informatica", "informática",
-        # Afines que deben aceptar cuando piden "informática o afines"
-        "ingenieria de sistemas", "ingeniería de sistemas",
+# Profesiones equivalentes (si la oferta pide cualquiera del grupo, el CV cumple con cualquiera)
+PROF_EQUIV_GROUPS = [
+    {
+        # Carrera (como la pide la oferta)
+        "ingenieria de sistemas", "informatica", "ingenieria informatica", "ingenieria de software",
+        "ciencias de la computacion", "computacion", "sistemas de informacion", "telematica",
+
+        # Título (como aparece en el CV)
         "ingeniero de sistemas", "ingeniera de sistemas",
         "ingeniero sistemas", "ingeniera sistemas",
+
+        # Abreviaturas típicas
         "ing de sistemas", "ing. de sistemas",
         "ing sistemas", "ing. sistemas",
-        "sistemas",
-        # otros afines típicos
-        "ingenieria de software", "ingeniería de software",
-        "ingenieria informatica", "ingeniería informática"
-    },
-
-    "mba": {
-        "mba", "master en administracion", "máster en administración",
-        "maestria en administracion", "maestría en administración",
-        "master of business administration"
+        "ing en sistemas", "ing. en sistemas",
     },
-    "arquitectura empresarial": {"arquitectura empresarial"},
-    "transformacion digital": {"transformacion digital", "transformación digital"},
-    "gestion de proyectos": {"gestion de proyectos", "gestión de proyectos", "project management"},
-    "sistemas de informacion": {"sistemas de informacion", "sistemas de información"},
-}
-
-def _norm_acad(x: str) -> str:
-    return normalizar_para_nlp((x or "").lower())
+    {"derecho", "abogado", "abogada", "juridico", "jurídico"},
+    {"medicina", "medico", "médico"},
+    {"psicologia", "psicología"},
+    {"arquitectura"},
+    {"ingenieria civil", "ingeniería civil"},
+    {"ingenieria industrial", "ingeniería industrial"},
+    {"administracion de empresas", "administración de empresas"},
+]
+# Los grupos (por índice) compilados para la vista nlp y para la vista plana del CV
+_PROF_GRUPOS_NLP = GruposEquivalencia(dict(enumerate(PROF_EQUIV_GROUPS)), normalizar_para_nlp)
+_PROF_GRUPOS_PLANO = GruposEquivalencia(dict(enumerate(PROF_EQUIV_GROUPS)), limpiar_texto)
 
 def _split_academic_options(core: str) -> list:
     """
@@ -1089,17 +684,6 @@ def _split_academic_options(core: str) -> list:
     return out
 
 
-def _cv_has_any(cv_norm: str, patterns: set) -> bool:
-    """
-    Busca variantes en el CV normalizado. Usa contains_phrase para tolerancia a saltos/puntuación.
-    """
-    if not cv_norm:
-        return False
-    for p in patterns:
-        if _contains_phrase(cv_norm, _norm_acad(p)):
-            return True
-    return False
-
 def _cumple_requisito_academico(tag: str, texto_cv: str) -> bool:
     """
     Decide si un tag académico (duro) se cumple por formación en el CV,
@@ -1109,7 +693,8 @@ def _cumple_requisito_academico(tag: str, texto_cv: str) -> bool:
         return False
 
     tag_norm = _norm_acad(tag)
-    cv_norm  = _norm_acad(texto_cv)
+    hechos = hechos_cv(texto_cv)
+    cv_norm = hechos.nlp
 
     # Solo aplicar si parece académico
     if not any(k in tag_norm for k in ACADEMIC_TRIGGER):
@@ -1127,7 +712,7 @@ def _cumple_requisito_academico(tag: str, texto_cv: str) -> bool:
 
             # mapeo por equivalencias si existe
             if opt in ACADEMIC_EQUIV:
-                if _cv_has_any(cv_norm, ACADEMIC_EQUIV[opt]):
+                if hechos.formacion(opt):
                     return True
             else:
                 # búsqueda literal tolerante
@@ -1135,16 +720,16 @@ def _cumple_requisito_academico(tag: str, texto_cv: str) -> bool:
                     return True
 
         # fallback: si el core contiene una “clave” del diccionario
-        for key, variants in ACADEMIC_EQUIV.items():
-            if key in core and _cv_has_any(cv_norm, variants):
+        for key in ACADEMIC_EQUIV:
+            if key in core and hechos.formacion(key):
                 return True
 
         return False
 
     # Si no hay opciones, intentamos equivalencias por presencia de claves
-    for key, variants in ACADEMIC_EQUIV.items():
+    for key in ACADEMIC_EQUIV:
         if key in core:
-            return _cv_has_any(cv_norm, variants)
+            return hechos.formacion(key) is not None
 
     # fallback final literal
     return _contains_phrase(cv_norm, core)
@@ -1161,6 +746,7 @@ def _categoria_por_similitud(texto_skill: str):
     t = (texto_skill or "").strip().lower()
     if not t:
         return None
+    asegurar_vocabulario()
 
     if t in tech_skills:
         return "tecnicas"
@@ -1177,40 +763,35 @@ def _categoria_por_similitud(texto_skill: str):
         return None
 
 
-    docs = {
-        "tecnicas": " ".join(sorted(set(tech_skills))),
-        "blandas": " ".join(sorted(set(soft_skills))),
-        "experiencia": " ".join(sorted(set(exp_terms))),
-    }
+    # Centroides precalculados de las listas fusionadas (habilidades.matriz_categorias)
     best_cat, best_sim = None, 0.0
-    d = nlp(t)
+    d = procesar(t, "vectores")
     if not getattr(d, "vector_norm", 0.0):
         return None
-    for cat, corpus in docs.items():
-        cdoc = nlp(corpus)
-        if not getattr(cdoc, "vector_norm", 0.0):
-            continue
-        s = d.similarity(cdoc)
+    for cat, s in similitudes_categorias(d.vector, d.vector_norm).items():
         if s > best_sim:
             best_sim, best_cat = s, cat
     return best_cat
 
 def es_skill_valida_token(t):
-    if not t.is_alpha:
+    return _es_skill_valida(t.text, t.lemma_, t.pos_, t.is_alpha)
+
+def _es_skill_valida(texto, lemma, pos, is_alpha):
+    if not is_alpha:
         return False
-    lemma = t.lemma_.lower()
+    lemma = lemma.lower()
     if lemma in STOPWORDS:
         return False
-    if t.pos_ in {"PRON","DET","ADV","AUX","PART","SCONJ","CCONJ","INTJ","NUM","SYM","PUNCT","SPACE"}:
+    if pos in {"PRON","DET","ADV","AUX","PART","SCONJ","CCONJ","INTJ","NUM","SYM","PUNCT","SPACE"}:
         return False
-    if t.pos_ == "VERB":
+    if pos == "VERB":
         if lemma in VERBS_DESCARTADOS:
             return False
         if lemma not in VERBS_PERMITIDOS:
             return False
-    elif t.pos_ not in {"NOUN","PROPN"}:
+    elif pos not in {"NOUN","PROPN"}:
         return False
-    if len(t.text) < 3:
+    if len(texto) < 3:
         return False
     if lemma in GENERIC_NOUNS or lemma in ABSTRACT_TERMS:
         return False
@@ -1220,70 +801,43 @@ def es_skill_valida_string(s: str) -> bool:
     s = (s or "").strip()
     if not s:
         return False
-    d = nlp(s)
+    # Palabra suelta del vocabulario: rasgos ya precalculados (sin spaCy)
+    rasgos = rasgos_palabra(s)
+    if rasgos is not None:
+        return _es_skill_valida(s, *rasgos)
+    d = procesar(s, "lemas")
     if not d or len(d) == 0:
         return False
     return es_skill_valida_token(d[0])
 
 
 def expandir_siglas(texto: str) -> str:
-    t = texto or ""
-    # variantes comunes con comas y 'y'
-    t = re.sub(r"\btic\s*,\s*tac\s*y\s*tep\b", "tic tac tep", t, flags=re.IGNORECASE)
-    t = re.sub(r"\btic\s*,\s*tac\s*,\s*tep\b", "tic tac tep", t, flags=re.IGNORECASE)
-    t = re.sub(r"\btic\s+y\s+tac\s+y\s+tep\b", "tic tac tep", t, flags=re.IGNORECASE)
-    return t
+    # variantes comunes con comas y 'y' (ámbito "siglas" de la tabla única de alias)
+    return sustituir_alias(texto or "", "siglas")
 
 
 
-def categorizar_texto(texto):
+def categorizar_texto(texto, ctx=None):
+    asegurar_vocabulario()
     categorias = {"tecnicas": set(), "blandas": set(), "experiencia": set()}
     
     texto = expandir_siglas(texto or "")
     texto = normalizar_para_nlp(texto)
 
 
-    # Filtrar cabeceras que contaminan los chunks
-    lineas_filtradas = []
-    for l in (texto or "").splitlines():
-        low = (l or "").strip().lower()
-        if any(low.startswith(h) for h in SECTION_HEADERS):
-            if ":" in l:
-                pos = l.index(":")
-                resto = l[pos+1:].strip()
-                if resto:
-                    lineas_filtradas.append(resto)
-            continue
-        lineas_filtradas.append(l)
-    texto_filtrado = "\n".join(lineas_filtradas)
+    # Filtrar cabeceras que contaminan los chunks (EstructuraOferta.sin_cabeceras)
+    texto_filtrado = estructura_de(texto).sin_cabeceras
 
-    doc = nlp(texto_filtrado)
+    doc = doc_de(texto_filtrado, "chunks", ctx)
 
     # 0) Detección textual conservadora (solo FRASES whitelist) usando patrón tolerante
     scan_text = normalizar_para_nlp(texto_filtrado.lower())
     
-    # 0.b) Detección literal para tokens técnicos (incluye alfanuméricos)
-    TOKENS_TECNICOS_LITERALES = {"python", "sql", "aws", "azure", "gcp", "n8n", "salesforce", 
-                                 "hubspot", "docker", "kubernetes", "react", "nodejs", "tableau", 
-                                 "pandas","moodle", "tic", "tac", "tep", "lms", "e-learning", 
-                                 "elearning", "blackboard", "canvas", "schoology",}
-
-    for tok in TOKENS_TECNICOS_LITERALES:
-        # Moodle solo si aparece exactamente como palabra independiente
-        if tok == "moodle":
-            if re.search(r"\bmoodle\b", scan_text):
-                categorias["tecnicas"].add(tok)
-            continue
-
-        if re.search(rf"\b{re.escape(tok)}\b", scan_text, flags=re.IGNORECASE):
-                categorias["tecnicas"].add(tok)
-
-
-
-    
-    for fr in WHITELIST_TECH_PHRASES:
-        if _contains_phrase(scan_text, fr):
-            categorias["tecnicas"].add(fr)
+    # 0.b) Tokens técnicos literales (incluye alfanuméricos) y frases whitelist:
+    # una sola pasada del escáner multi-frase en lugar de una búsqueda por entrada
+    for frase, _ini, _fin, origen in _escaner_tecnico().buscar(scan_text):
+        if origen != "tecnica":
+            categorias["tecnicas"].add(frase)
 
 
     # 1) FRASES COMPUESTAS (preferidas)
@@ -1342,11 +896,7 @@ def categorizar_texto(texto):
 
 
     # 2) TOKENS (controlado)
-    proto_docs = {
-        "tecnicas": nlp(" ".join(sorted(set(tech_skills)))) if tech_skills else None,
-        "blandas": nlp(" ".join(sorted(set(soft_skills)))) if soft_skills else None,
-        "experiencia": nlp(" ".join(sorted(set(exp_terms)))) if exp_terms else None,
-    }
+    # Similitud contra los centroides precalculados de cada categoría
 
     for token in doc:
         if not es_skill_valida_token(token):
@@ -1375,10 +925,7 @@ def categorizar_texto(texto):
 
         mejor_cat, mejor_score = None, 0.0
         segundo_mejor = 0.0
-        for cat, dref in proto_docs.items():
-            if dref is None or getattr(dref, "vector_norm", 0.0) == 0.0:
-                continue
-            s = token.similarity(dref)
+        for cat, s in similitudes_categorias(token.vector, token.vector_norm).items():
             if s > mejor_score:
                 segundo_mejor = mejor_score
                 mejor_score, mejor_cat = s, cat
@@ -1483,34 +1030,12 @@ def _extract_bullets_in_section(oferta_txt: str, header: str, stop_headers: tupl
     if not oferta_txt:
         return []
 
-    o = normalizar_para_nlp(oferta_txt.lower())
-
-    # buscar inicio de sección
-    m = re.search(rf"\b{re.escape(normalizar_para_nlp(header.lower()))}\b", o)
-    if not m:
+    # desde la cabecera hasta "lo que ofrecemos" o el siguiente header stop
+    # (EstructuraOferta la calcula una vez por oferta y cabecera)
+    tail = estructura_de(oferta_txt).seccion(header, stop_headers)
+    if not tail:
         return []
 
-    tail = o[m.end():]
-    
-    
-    # Corte fuerte: si la sección "lo que ofrecemos" aparece, parar extracción
-    # (Evita que beneficios/modalidad entren como requisitos)
-    stop_offer = re.search(r"\blo\s+que\s+ofrecemos\b", tail)
-    if stop_offer:
-        tail = tail[:stop_offer.start()]
-
-    
-
-    # cortar al siguiente header stop (si aparece)
-    cut = None
-    for h in stop_headers:
-        mh = re.search(rf"\b{re.escape(normalizar_para_nlp(h.lower()))}\b", tail)
-        if mh:
-            pos = mh.start()
-            cut = pos if cut is None else min(cut, pos)
-    if cut is not None:
-        tail = tail[:cut]
-
     # FIX: si los bullets vienen "pegados" en una misma línea (al pegar texto), los separamos
     # ejemplo: "• BI. • Excel. • BPMN." => líneas separadas
     tail = re.sub(r"\s*[•\u2022·]+\s*", "\n", tail)
@@ -1578,55 +1103,42 @@ def _extract_bullets_in_section(oferta_txt: str, header: str, stop_headers: tupl
 
 
 
-def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
+def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv, ctx=None):
     """
     Usa el motor de reglas JSON (requirements_rules.json).
     Además, registra aprendizaje ligero en requirements_learned.json.
     Incluye parches para falsos positivos de 'sector manufactura'
     y para requisitos libres demasiado verborrágicos.
+    Memoizado como evaluate_requirements (ver memo_requisitos).
     """
-    res = evaluate_requirements(texto_oferta, texto_cv)
+    return memo_requisitos.memoizado(
+        "detectar_requisitos_excluyentes", texto_oferta, texto_cv, version_evaluacion(),
+        lambda: _detectar_requisitos_excluyentes(texto_oferta, texto_cv, ctx), repetir_aprendizaje
+    )
+
+
+def _detectar_requisitos_excluyentes(texto_oferta, texto_cv, ctx=None):
+    # Vistas normalizadas (minúsculas, nlp, plano) calculadas una sola vez por texto
+    if ctx is not None:
+        texto_oferta, texto_cv = ctx.normalizado(texto_oferta), ctx.normalizado(texto_cv)
+    else:
+        texto_oferta, texto_cv = TextoNormalizado(texto_oferta), TextoNormalizado(texto_cv)
+    res = evaluate_requirements(texto_oferta, texto_cv, ctx=ctx)
     
     
     # --- Parche robusto: equivalencias académicas NO deben excluir si el CV las cumple ---
-    def _norm_acad(s: str) -> str:
-        # limpiar_texto() baja a minúsculas, quita tildes y signos.
-        return limpiar_texto(normalizar_para_nlp(s or ""))
-
-    ACADEMIC_EQUIV = {
-        "informatica": {
-            "ingenieria de sistemas", "ingeniería de sistemas",
-            "ingenieria informatica", "ingeniería informática",
-            "ciencias de la computacion", "ciencias de la computación",
-            "computacion", "computación",
-            "sistemas de informacion", "sistemas de información",
-            "ingenieria de software", "ingeniería de software",
-            "ingeniero de sistemas", "ingeniera de sistemas",
-            "ingeniero sistemas", "ingeniera sistemas",
-            "ing de sistemas", "ing. de sistemas",
-            "ing sistemas", "ing. sistemas",
-            "ing en sistemas", "ing. en sistemas",
-            "sistemas","especialista", "especialización"
-
-        },
-        "mba": {
-            "mba", "maestria", "maestría", "master en administracion", "máster en administración",
-            "maestria en administracion", "maestría en administración",
-            "master of business administration"
-        }
-    }
-
     def _cumple_academico_por_equivalencia(tag: str, cv_text: str) -> bool:
-        t = _norm_acad(tag)
-        cvn = _norm_acad(cv_text)
+        t = _norm_acad_plano(tag)
+        # grupos presentes en el CV: una pasada del escáner, reutilizada entre tags
+        claves = _EQUIV_ACADEMICA_CV.claves_en(vista_derivada(cv_text, "academica", _norm_acad_plano))
 
         core = t.split(":", 1)[1].strip() if ":" in t else t
 
         if "informat" in core:
-            return any(_contains_phrase(cvn, _norm_acad(v)) for v in ACADEMIC_EQUIV["informatica"])
+            return "informatica" in claves
 
         if "mba" in core:
-            return any(_contains_phrase(cvn, _norm_acad(v)) for v in ACADEMIC_EQUIV["mba"])
+            return "mba" in claves
 
         return False
 
@@ -1677,8 +1189,8 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
         for tag in _detectar_maestria_obligatoria(texto_oferta or ""):
             # tag = "Formación requerida: maestría en <campo>"
             core = tag.split(":", 1)[1].strip() if ":" in tag else tag
-            cv_norm = _norm_acad(texto_cv or "")
-            core_norm = _norm_acad(core)
+            cv_norm = vista_derivada(texto_cv, "academica", _norm_acad_plano)
+            core_norm = _norm_acad_plano(core)
             # Si el CV NO contiene esa maestría (tolerante), se excluye
             if not _contains_phrase(cv_norm, core_norm):
                 res["no_cumple"] = list(res.get("no_cumple") or [])
@@ -1735,8 +1247,8 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
         des_items = _dedupe_preserve(des_items)
 
 
-        cv_norm = limpiar_texto(normalizar_para_nlp((texto_cv or "").lower()))
-        oferta_norm_plain = limpiar_texto(normalizar_para_nlp((texto_oferta or "").lower()))
+        cv_norm = vista_plana(texto_cv)
+        oferta_norm_plain = vista_plana(texto_oferta)
 
         def _cv_has(item: str) -> bool:
             it = limpiar_texto(normalizar_para_nlp((item or "").lower()))
@@ -1887,7 +1399,7 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
 
     # 2) Formación base: Derecho / Abogado (si la oferta lo exige)
     if _requiere_derecho(texto_oferta or ""):
-        cv_norm = _norm_acad(texto_cv or "")
+        cv_norm = vista_derivada(texto_cv, "academica", _norm_acad_plano)
         if not re.search(r"\b(derecho|abogado|abogad[oa])\b", cv_norm):
             res["no_cumple"] = list(res.get("no_cumple") or [])
             res["no_cumple"].append("Formación requerida: Derecho / Abogado")
@@ -1899,11 +1411,11 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
         if res is None:
             res = {"alerta": False, "no_cumple": [], "no_cumple_soft": []}
 
-        oferta_plain = limpiar_texto((texto_oferta or "").lower())
-        cv_plain = limpiar_texto((texto_cv or "").lower())
+        oferta_plain = vista_plana_literal(texto_oferta)
+        cv_plain = vista_plana_literal(texto_cv)
         
-        cv_norm_prof = normalizar_para_nlp((texto_cv or "").lower())
-        cv_norm_prof_plain = limpiar_texto(cv_norm_prof)
+        cv_norm_prof = vista_nlp(texto_cv)
+        cv_norm_prof_plain = vista_plana(texto_cv)
 
         # --- Certificaciones regulatorias obligatorias (salud / ingeniería / etc.) ---
         certificaciones_clave = ["rethus", "tarjeta profesional", "matricula profesional", "matrícula profesional"]
@@ -1936,40 +1448,18 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
 
             # Si no detectamos nada, no excluimos por profesión (conservador)
         if tramos_detectados:
-            # Grupos equivalentes (si la oferta pide cualquiera del grupo, el CV cumple con cualquiera)
-            PROF_EQUIV_GROUPS = [
-                {
-                    # Carrera (como la pide la oferta)
-                    "ingenieria de sistemas", "informatica", "ingenieria informatica", "ingenieria de software",
-                    "ciencias de la computacion", "computacion", "sistemas de informacion", "telematica",
-
-                    # Título (como aparece en el CV)
-                    "ingeniero de sistemas", "ingeniera de sistemas",
-                    "ingeniero sistemas", "ingeniera sistemas",
-
-                    # Abreviaturas típicas
-                    "ing de sistemas", "ing. de sistemas",
-                    "ing sistemas", "ing. sistemas",
-                    "ing en sistemas", "ing. en sistemas",
-                },
-                {"derecho", "abogado", "abogada", "juridico", "jurídico"},
-                {"medicina", "medico", "médico"},
-                {"psicologia", "psicología"},
-                {"arquitectura"},
-                {"ingenieria civil", "ingeniería civil"},
-                {"ingenieria industrial", "ingeniería industrial"},
-                {"administracion de empresas", "administración de empresas"},
-            ]
+            # Grupos equivalentes (PROF_EQUIV_GROUPS) presentes en el CV, en sus dos vistas
+            grupos_cv = _PROF_GRUPOS_NLP.claves_en(cv_norm_prof) | _PROF_GRUPOS_PLANO.claves_en(cv_norm_prof_plain)
 
             for tramo_prof in tramos_detectados:
                 grupos_requeridos = []
-                for g in PROF_EQUIV_GROUPS:
+                for i, g in enumerate(PROF_EQUIV_GROUPS):
                     if any(x in tramo_prof for x in g):
-                        grupos_requeridos.append(g)
+                        grupos_requeridos.append((i, g))
 
                 # Si el tramo no menciona un grupo conocido, no excluimos por profesión (conservador)
-                for g in grupos_requeridos:
-                    if not any(_contains_phrase(cv_norm_prof, normalizar_para_nlp(x)) for x in g) and not any(_contains_phrase(cv_norm_prof_plain, limpiar_texto(x)) for x in g):
+                for i, g in grupos_requeridos:
+                    if i not in grupos_cv:
 
                         etiqueta = None
                         for x in g:
@@ -1999,17 +1489,8 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
         # 1) Años mínimos de experiencia
         req_years = _extract_min_years_from_offer(texto_oferta or "")
         if req_years:
-            oferta_norm = limpiar_texto(normalizar_para_nlp((texto_oferta or "").lower()))
-            segmentos = re.split(r"[\n\.\;\|]+", oferta_norm)
-
-
             # hard si un segmento con años también trae HARD_MARKERS
-            is_hard_years = False
-            for seg in segmentos:
-                if (("anos" in seg or "años" in seg) and re.search(r"\b\d{1,2}\b", seg)):
-                    if any(h in seg for h in HARD_MARKERS):
-                        is_hard_years = True
-                        break
+            is_hard_years = hechos_oferta(texto_oferta).anios_minimos_duro
 
             cv_years = _cv_years_estimate(texto_cv or "")
 
@@ -2042,7 +1523,7 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
                 if dom in SECTOR_EQUIV:
                     has_dom_evidence = _cv_has_sector(texto_cv or "", dom)
                 else:
-                    cv_norm = normalizar_para_nlp((texto_cv or "").lower())
+                    cv_norm = vista_nlp(texto_cv)
                     has_dom_evidence = bool(dom) and _contains_phrase(cv_norm, dom)
 
                 # Heurística “barata y útil”:
@@ -2139,7 +1620,7 @@ def detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv):
     # FIX: comparar SIN tildes para evitar que "inglés" vs "ingles" baje a soft.
     try:
         if res and (res.get("no_cumple") or res.get("no_cumple_soft")):
-            oferta_plain = limpiar_texto(normalizar_para_nlp((texto_oferta or "").lower()))
+            oferta_plain = vista_plana(texto_oferta)
 
             def _core(txt: str) -> str:
                 t = (txt or "").strip()
@@ -2447,7 +1928,7 @@ def _evaluar_oferta_insuficiente(cat_oferta: dict, texto_oferta: str,
     generic_ratio = (generic_count / max(len(items_all), 1)) if items_all else 1.0
 
     # secciones típicas presentes (señal de requisitos estructurados)
-    offer_low = normalizar_para_nlp((texto_oferta or "").lower())
+    offer_low = vista_nlp(texto_oferta)
     # secciones típicas O señales “estructurales” aunque sea en un solo párrafo
     has_headers = (
         any(h in offer_low for h in SECTION_HEADERS)
@@ -2518,11 +1999,191 @@ def _build_equiv_bidir(equiv: dict) -> dict:
 EQUIV_BIDIR = _build_equiv_bidir(VERB_EQUIV)
 
 
+# Modo de _soft_match: "matriz" (vectorizado con NumPy) o "bucle" (implementación original,
+# se conserva como referencia para comparar resultados)
+SOFT_MATCH_MODO = "matriz"
+
+
 def _soft_match(oferta_items: set,
                 cv_items: set,
                 texto_cv: str = "",
                 texto_oferta: str = "",
-                sim_thresh: float = 0.82):
+                sim_thresh: float = 0.82,
+                modo: str = None,
+                ctx=None):
+    """
+    Matching suave entre skills de la oferta y del CV (ver _soft_match_bucle).
+    modo=None usa SOFT_MATCH_MODO; ambos modos devuelven el mismo resultado.
+    Con ctx, el CV se normaliza y analiza una sola vez para las tres categorías.
+    """
+    if (modo or SOFT_MATCH_MODO) == "bucle":
+        return _soft_match_bucle(oferta_items, cv_items, texto_cv, texto_oferta, sim_thresh, ctx=ctx)
+    return _soft_match_matriz(oferta_items, cv_items, texto_cv, texto_oferta, sim_thresh, ctx=ctx)
+
+
+def _vista_cv_lemas(texto_cv: str, ctx=None):
+    """(cv_norm, cv_doc, cv_lemmas) del CV en minúsculas; con ctx se reutilizan los del análisis."""
+    if ctx is not None and (texto_cv or "") == ctx.texto_cv:
+        return ctx.cv_minusculas, ctx.doc_cv_lemas(), ctx.lemas_cv()
+    cv_norm = vista_nlp(texto_cv)
+    cv_doc = procesar(cv_norm, "lemas") if cv_norm else None
+    cv_lemmas = set()
+    if cv_doc is not None:
+        cv_lemmas = {t.lemma_.lower() for t in cv_doc if t.is_alpha}
+    return cv_norm, cv_doc, cv_lemmas
+
+
+def _probe_lema_equiv(x_norm: str) -> str:
+    """Si la primera palabra es alfabética y su lema está en EQUIV_BIDIR, devuelve el lema."""
+    try:
+        # Palabra suelta del vocabulario: lema precalculado (sin spaCy)
+        rasgos = rasgos_palabra(x_norm)
+        if rasgos is not None:
+            lema, _, es_alfa = rasgos
+            if es_alfa and lema.lower() in EQUIV_BIDIR:
+                return lema.lower()
+            return x_norm
+        d = procesar(x_norm, "lemas")
+        if d and d[0].is_alpha:
+            lema = d[0].lemma_.lower()
+            if lema in EQUIV_BIDIR:
+                return lema
+    except Exception:
+        pass
+    return x_norm
+
+
+def _soft_match_matriz(oferta_items: set,
+                       cv_items: set,
+                       texto_cv: str = "",
+                       texto_oferta: str = "",
+                       sim_thresh: float = 0.82,
+                       ctx=None):
+    """
+    Misma lógica que _soft_match_bucle, pero:
+    - los items del CV se normalizan y se vectorizan una sola vez (no por cada item de oferta),
+    - igualdad exacta y lema-en-frase pasan a ser consultas a un set,
+    - la similitud de todos los pares pendientes se calcula en una sola
+      multiplicación de matrices (coseno, misma fórmula que Doc.similarity),
+      aplicando el bloqueo de WHITELIST_TECH_TOKENS como máscara.
+    """
+    reconocidas = set()
+    faltantes = set()
+
+    cv_norm, cv_doc, cv_lemmas = _vista_cv_lemas(texto_cv, ctx)
+
+    # --- Items del CV: una vez ---
+    c_norms = []
+    for c in (cv_items or set()):
+        c_norm = _probe_lema_equiv((c or "").strip().lower())
+        if c_norm:
+            c_norms.append(c_norm)
+    c_norms = list(dict.fromkeys(c_norms))
+    c_set = set(c_norms)
+
+    c_docs = procesar_lote(c_norms, "vectores") if c_norms else []
+    c_validos = [d for d in c_docs if getattr(d, "vector_norm", 0.0)]
+    if c_validos:
+        matriz_c = np.vstack([d.vector for d in c_validos]).astype(np.float32)
+        normas_c = np.array([d.vector_norm for d in c_validos], dtype=np.float32)
+        orths_c = {tuple(t.orth for t in d) for d in c_validos}
+    else:
+        matriz_c = normas_c = None
+        orths_c = set()
+
+    pendientes = []   # (item original, doc_o) que solo pueden resolverse por similitud
+
+    for o in (oferta_items or set()):
+        o_norm = _probe_lema_equiv((o or "").strip().lower())
+
+        # Guardarraíl: "moodle" solo puede ser reconocido si aparece literal en el CV
+        if re.search(r"\b(moodle|moodle\.org)\b", o_norm) and not re.search(r"\b(moodle|moodle\.org)\b", cv_norm):
+            faltantes.add(o)
+            continue
+
+        if not o_norm:
+            continue
+
+        # 1) Fallback textual GENERAL
+        if cv_norm and _contains_phrase(cv_norm, o_norm):
+            reconocidas.add(o)
+            continue
+
+        try:
+            doc_o = procesar(o_norm, "lemas")
+        except Exception:
+            doc_o = None
+
+        # 1.b) Lema y equivalencias
+        if (cv_doc is not None) and (len(o_norm.split()) <= 3) and doc_o is not None:
+            try:
+                if doc_o and doc_o[0].is_alpha:
+                    o_lemma = doc_o[0].lemma_.lower()
+                    if o_lemma in cv_lemmas:
+                        reconocidas.add(o)
+                        continue
+                    equivs = EQUIV_BIDIR.get(o_lemma, set())
+                    if any(e in cv_norm for e in equivs):
+                        reconocidas.add(o)
+                        continue
+            except Exception:
+                pass
+
+        if not c_set:
+            faltantes.add(o)
+            continue
+
+        # 2.a) Igualdad exacta
+        if o_norm in c_set:
+            reconocidas.add(o)
+            continue
+
+        if doc_o is None:
+            faltantes.add(o)
+            continue
+
+        # 2.b) Lema de la frase de la oferta igual a un item del CV
+        if any(tok.lemma_.lower() in c_set for tok in doc_o if tok.is_alpha):
+            reconocidas.add(o)
+            continue
+
+        # BLOQUEO FUERTE: tokens técnicos whitelist SOLO por match literal
+        if o_norm in WHITELIST_TECH_TOKENS and not re.search(rf"\b{re.escape(o_norm)}\b", cv_norm):
+            faltantes.add(o)
+            continue
+
+        if not getattr(doc_o, "vector_norm", 0.0) or matriz_c is None:
+            faltantes.add(o)
+            continue
+
+        # Doc.similarity devuelve 1.0 si ambos docs tienen exactamente los mismos tokens
+        if tuple(t.orth for t in doc_o) in orths_c:
+            reconocidas.add(o)
+            continue
+
+        pendientes.append((o, doc_o))
+
+    # 2.c) Similitud semántica: todos los pares pendientes en una sola operación
+    if pendientes:
+        matriz_o = np.vstack([d.vector for _, d in pendientes]).astype(np.float32)
+        normas_o = np.array([d.vector_norm for _, d in pendientes], dtype=np.float32)
+        sims = (matriz_o @ matriz_c.T) / (normas_o[:, None] * normas_c[None, :])
+        aciertos = (sims >= sim_thresh).any(axis=1)
+        for (o, _), ok in zip(pendientes, aciertos):
+            if ok:
+                reconocidas.add(o)
+            else:
+                faltantes.add(o)
+
+    return reconocidas, faltantes
+
+
+def _soft_match_bucle(oferta_items: set,
+                      cv_items: set,
+                      texto_cv: str = "",
+                      texto_oferta: str = "",
+                      sim_thresh: float = 0.82,
+                      ctx=None):
     """
     Matching suave entre skills de la oferta y del CV:
     1) Coincidencia exacta entre items de las categorías.
@@ -2535,28 +2196,16 @@ def _soft_match(oferta_items: set,
     faltantes = set()
 
     # Normalizamos el texto completo del CV una sola vez
-    cv_norm = normalizar_para_nlp((texto_cv or "").lower())
-
     # spaCy del CV una sola vez: lemas y texto
-    cv_doc = nlp(cv_norm) if cv_norm else None
-    cv_lemmas = set()
-    if cv_doc is not None:
-        cv_lemmas = {t.lemma_.lower() for t in cv_doc if t.is_alpha}
+    cv_norm, cv_doc, cv_lemmas = _vista_cv_lemas(texto_cv, ctx)
 
 
     for o in (oferta_items or set()):
         o_norm = (o or "").strip().lower()
         
         # Normalizar equivalencias: si el término de oferta es "liderazgo", lo pasamos a su forma lema si existe
-        try:
-            o_doc_tmp = nlp(o_norm)
-            if o_doc_tmp and o_doc_tmp[0].is_alpha:
-                o_lemma_tmp = o_doc_tmp[0].lemma_.lower()
-                # Si el lemma existe en nuestro mapa bidireccional, mantenemos lemma como llave de comparación
-                if o_lemma_tmp in EQUIV_BIDIR:
-                    o_norm = o_lemma_tmp
-        except Exception:
-            pass
+        # (si el lemma existe en nuestro mapa bidireccional, mantenemos lemma como llave de comparación)
+        o_norm = _probe_lema_equiv(o_norm)
 
         
         # Guardarraíl: "moodle" solo puede ser reconocido si aparece literal en el CV
@@ -2576,7 +2225,7 @@ def _soft_match(oferta_items: set,
         else:
             # 2) Matching contra las skills categorizadas del CV
             try:
-                doc_o = nlp(o_norm)
+                doc_o = procesar(o_norm, "lemas")
             except Exception:
                 doc_o = None
 
@@ -2584,7 +2233,7 @@ def _soft_match(oferta_items: set,
             # Si o_norm es una sola palabra (tipo "analizar") lo tratamos como posible verbo/acción.
             if (not matched) and (cv_doc is not None) and (len(o_norm.split()) <= 3):
                 try:
-                    o_doc = nlp(o_norm)
+                    o_doc = procesar(o_norm, "lemas")
                     if o_doc and o_doc[0].is_alpha:
                         o_lemma = o_doc[0].lemma_.lower()
 
@@ -2604,14 +2253,7 @@ def _soft_match(oferta_items: set,
             for c in (cv_items or set()):
                 c_norm = (c or "").strip().lower()
                 
-                try:
-                    c_doc_tmp = nlp(c_norm)
-                    if c_doc_tmp and c_doc_tmp[0].is_alpha:
-                        c_lemma_tmp = c_doc_tmp[0].lemma_.lower()
-                        if c_lemma_tmp in EQUIV_BIDIR:
-                            c_norm = c_lemma_tmp
-                except Exception:
-                    pass
+                c_norm = _probe_lema_equiv(c_norm)
 
                 
                 if not c_norm:
@@ -2638,7 +2280,7 @@ def _soft_match(oferta_items: set,
                         if not re.search(rf"\b{re.escape(o_norm)}\b", cv_norm):
                             continue
 
-                doc_c = nlp(c_norm)
+                doc_c = procesar(c_norm, "vectores")
                 if getattr(doc_o, "vector_norm", 0.0) and getattr(doc_c, "vector_norm", 0.0):
                     if doc_o.similarity(doc_c) >= sim_thresh:
                         matched = True
@@ -2657,7 +2299,11 @@ def _soft_match(oferta_items: set,
 # ----------------------------
 # MOSTRAR RESULTADOS
 # ----------------------------
-def mostrar_resultados(cat_oferta, cat_cv, texto_cv, texto_oferta=""):
+def mostrar_resultados(cat_oferta, cat_cv, texto_cv, texto_oferta="", ctx=None):
+    # Contexto del análisis: CV y oferta se analizan una sola vez aunque varias etapas los usen
+    if ctx is None:
+        ctx = ContextoAnalisis(texto_cv, texto_oferta)
+    texto_cv, texto_oferta = ctx.normalizado(texto_cv), ctx.normalizado(texto_oferta)
     pesos = {"tecnicas": 0.5, "experiencia": 0.3, "blandas": 0.2}
     sugerencias = []
     detalles_categorias = {}
@@ -2686,7 +2332,7 @@ def mostrar_resultados(cat_oferta, cat_cv, texto_cv, texto_oferta=""):
 
 
     # 1) Requisitos excluyentes (todavía sin imprimir, se ajustan después)
-    requisitos = detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv) if texto_oferta else None
+    requisitos = detectar_requisitos_excluyentes_inteligente(texto_oferta, texto_cv, ctx=ctx) if texto_oferta else None
 
     # --- Nota informativa: años requeridos en la oferta (aunque el CV no lo evidencie) ---
     try:
@@ -2723,7 +2369,8 @@ def mostrar_resultados(cat_oferta, cat_cv, texto_cv, texto_oferta=""):
                 cv_set,
                 texto_cv=texto_cv,
                 texto_oferta=texto_oferta,
-                sim_thresh=0.82
+                sim_thresh=0.82,
+                ctx=ctx
             )
             porcentaje = len(coincidencias) / den
             total_numerador += porcentaje * peso
@@ -2756,8 +2403,7 @@ def mostrar_resultados(cat_oferta, cat_cv, texto_cv, texto_oferta=""):
     # no tiene sentido seguir marcándola como "no cumplida" en requisitos.
     if requisitos:
         try:
-            oferta_norm = normalizar_para_nlp((texto_oferta or "").lower())
-            oferta_plain = limpiar_texto(oferta_norm)  # ✅ sin tildes / signos
+            oferta_plain = vista_plana(texto_oferta)  # ✅ sin tildes / signos
 
             # conjunto de todas skills reconocidas (normalizadas)
             reconocidas_all = set()
@@ -2929,7 +2575,7 @@ def mostrar_resultados(cat_oferta, cat_cv, texto_cv, texto_oferta=""):
     # 4) Advertencias y recomendaciones
     advertencia = None
     try:
-        if contiene_lista_sospechosa(texto_cv):
+        if contiene_lista_sospechosa(texto_cv, ctx=ctx):
             advertencia = "Tu CV contiene listas de palabras clave que podrían ser penalizadas."
     except Exception:
         pass
@@ -3085,6 +2731,3 @@ def mostrar_resultados(cat_oferta, cat_cv, texto_cv, texto_oferta=""):
             
     }
     
-
-# Inicializar mapeo de lemas al cargar
-construir_diccionario_lemas()
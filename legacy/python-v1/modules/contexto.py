@@ -0,0 +1,108 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# contexto.py - Contexto compartido de un análisis (CV + oferta analizados una sola vez)
+# ==========================
+from modules import modelo_nlp
+from modules.normalizacion import TextoNormalizado, vista_nlp
+
+
+class ContextoAnalisis:
+    """
+    Estado de UN análisis (opción 2 del menú): textos del CV y de la oferta,
+    Docs de spaCy ya analizados y vistas derivadas.
+    Se pasa como ctx= a categorizar_texto, contiene_lista_sospechosa, _soft_match,
+    mostrar_resultados, evaluate_requirements y detectar_nuevas_habilidades para
+    que cada vista de cada texto pase por spaCy una sola vez.
+    """
+
+    def __init__(self, texto_cv: str = "", texto_oferta: str = ""):
+        # TextoNormalizado: las vistas (minúsculas, nlp, plano...) se calculan una sola vez
+        self.texto_cv = TextoNormalizado(texto_cv)
+        self.texto_oferta = TextoNormalizado(texto_oferta)
+        self._docs = {}           # (texto, perfil) -> Doc (sin límite: vive lo que dura el análisis)
+        self._memo = {}           # clave -> valor derivado
+        self.stats = {"docs_analizados": 0, "docs_reutilizados": 0}
+
+    # ----------------------------
+    # Docs
+    # ----------------------------
+    def doc(self, texto: str, perfil: str):
+        """Doc de `texto` con el perfil dado; un Doc de perfil más completo también sirve."""
+        for p in modelo_nlp._PERFILES_COMPATIBLES[perfil]:
+            d = self._docs.get((texto, p))
+            if d is not None:
+                self.stats["docs_reutilizados"] += 1
+                return d
+        d = modelo_nlp.procesar(texto, perfil)
+        self._docs[(texto, perfil)] = d
+        self.stats["docs_analizados"] += 1
+        return d
+
+    # ----------------------------
+    # Vistas derivadas
+    # ----------------------------
+    def normalizado(self, texto) -> TextoNormalizado:
+        """El TextoNormalizado del contexto si `texto` es el CV o la oferta; si no, uno nuevo."""
+        if texto == self.texto_cv:
+            return self.texto_cv
+        if texto == self.texto_oferta:
+            return self.texto_oferta
+        return TextoNormalizado(texto)
+
+    def memo(self, clave, fabrica):
+        """Calcula fabrica() una sola vez por clave durante el análisis."""
+        if clave not in self._memo:
+            self._memo[clave] = fabrica()
+        return self._memo[clave]
+
+    @property
+    def cv_minusculas(self) -> str:
+        """CV en minúsculas normalizado para NLP (vista de _soft_match)."""
+        return vista_nlp(self.texto_cv)
+
+    def doc_cv_lemas(self):
+        return self.doc(self.cv_minusculas, "lemas") if self.cv_minusculas else None
+
+    def lemas_cv(self) -> set:
+        """Lemas (tokens alfabéticos) del CV en minúsculas."""
+        def _calc():
+            d = self.doc_cv_lemas()
+            return {t.lemma_.lower() for t in d if t.is_alpha} if d is not None else set()
+        return self.memo("lemas_cv", _calc)
+
+
+def doc_de(texto: str, perfil: str, ctx=None):
+    """procesar() normal, o el Doc ya analizado en el contexto del análisis si se pasa ctx."""
+    if ctx is not None:
+        return ctx.doc(texto, perfil)
+    return modelo_nlp.procesar(texto, perfil)
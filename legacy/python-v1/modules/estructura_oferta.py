@@ -0,0 +1,266 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# estructura_oferta.py - Oferta analizada una sola vez: líneas, cabeceras, secciones y segmentos
+# ==========================
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import cached_property
+
+from modules.frases import contiene_frase, palabras_frase, palabras_texto
+from modules.normalizacion import TextoNormalizado, normalizar_para_nlp, vista_nlp
+
+# ----------------------------
+# CABECERAS / ANCLAS
+# ----------------------------
+# Cabeceras/secciones típicas
+SECTION_HEADERS = (
+    "mision del cargo","misión del cargo", 
+    "responsabilidades principales","responsabilidades",
+    "requisitos","requerimientos","perfil","sobre nosotros",
+    "requisitos del cargo","requisitos del puesto", 
+    "competencias y habilidades","competencias", "habilidades", 
+    "diferenciales", "diferenciales del cargo", "diferenciales del puesto",
+    "formacion","formación", "educacion","educación", "estudios", "estudios requeridos",
+    "experiencia", "experiencia requerida", "experiencia deseable",
+    "lo que buscamos", "lo que buscamos en el candidato", 
+    "lo que buscamos en la candidata", "lo que buscamos en el perfil", 
+    "lo que buscamos en el postulante", "lo que buscamos en el aspirante", 
+    "lo que buscamos en el talento"
+    )
+
+# Anclas de la sección de requisitos (la ventana empieza en la primera)
+_RE_ANCLA_REQUISITOS = re.compile(
+    r"\b("
+    r"requisitos?|"
+    r"conocimientos\s+requeridos?|"
+    r"conocimientos\s+obligatorios?|"
+    r"estudios\s+requeridos?|"
+    r"perfil\s+requerido|"
+    r"requisitos\s+del\s+cargo"
+    r")\b"
+)
+VENTANA_REQUISITOS = 900
+
+_RE_SEGMENTO = re.compile(r"[\n\.\;\|]+")
+_RE_LO_QUE_OFRECEMOS = re.compile(r"\blo\s+que\s+ofrecemos\b")
+
+
+# ----------------------------
+# ESTRUCTURA
+# ----------------------------
+class EstructuraOferta:
+    """
+    Estructura de un texto de oferta, calculada una sola vez y consultada por los
+    helpers de secciones (analisis_basico, requisitos).
+    Sobre el texto tal como llega:
+    - lineas:     offsets (inicio, fin) de cada línea
+    - cabeceras:  [(nº de línea, cabecera)] de las líneas que empiezan por SECTION_HEADERS
+    Sobre la vista nlp:
+    - trozos:     vista nlp separada por salto / punto / ';' / '|'
+    - segmentos:  esos trozos con sus palabras
+    - ventana de la sección de requisitos (en_seccion_requisitos)
+    - seccion(cabecera, paradas): texto desde una cabecera hasta la primera parada
+    Las búsquedas de frase usan la tolerancia de contiene_frase() (\\W+ entre tokens).
+    """
+
+    def __init__(self, texto):
+        self.texto = TextoNormalizado(texto)
+        self._memo = {}
+
+    # ----------------------------
+    # Vistas y líneas
+    # ----------------------------
+    @cached_property
+    def nlp(self) -> str:
+        return vista_nlp(self.texto)
+
+    @cached_property
+    def lineas(self) -> list:
+        """Offsets (inicio, fin) de cada línea del texto (sin el salto de línea)."""
+        offsets, inicio = [], 0
+        for linea, con_salto in zip(self.texto.lineas, str.splitlines(self.texto, keepends=True)):
+            offsets.append((inicio, inicio + len(linea)))
+            inicio += len(con_salto)
+        return offsets
+
+    def linea_de(self, pos: int) -> int:
+        """Nº de línea que contiene el carácter `pos`."""
+        return max(0, bisect_right(self._inicios, pos) - 1)
+
+    @cached_property
+    def _inicios(self) -> list:
+        return [a for a, _ in self.lineas]
+
+    @cached_property
+    def lineas_minusculas(self) -> list:
+        """Líneas del texto tal como llega, en minúsculas (contexto de requisitos)."""
+        return self.texto.minusculas.splitlines()
+
+    @cached_property
+    def cabeceras(self) -> list:
+        out = []
+        for i, (a, b) in enumerate(self.lineas):
+            low = self.texto[a:b].strip().lower()
+            for h in SECTION_HEADERS:
+                if low.startswith(h):
+                    out.append((i, h))
+                    break
+        return out
+
+    @cached_property
+    def sin_cabeceras(self) -> str:
+        """
+        Texto sin las líneas de cabecera (de una cabecera con ':' se conserva lo
+        que va tras los dos puntos). Es el texto que categorizar_texto pasa a spaCy.
+        """
+        cabeceras = {i for i, _ in self.cabeceras}
+        lineas = []
+        for i, (a, b) in enumerate(self.lineas):
+            l = self.texto[a:b]
+            if i in cabeceras:
+                if ":" in l:
+                    resto = l[l.index(":") + 1:].strip()
+                    if resto:
+                        lineas.append(resto)
+                continue
+            lineas.append(l)
+        return "\n".join(lineas)
+
+    # ----------------------------
+    # Sección de requisitos
+    # ----------------------------
+    @cached_property
+    def ventana_requisitos(self) -> str:
+        m = _RE_ANCLA_REQUISITOS.search(self.nlp)
+        if not m:
+            return ""
+        return self.nlp[m.start(): m.start() + VENTANA_REQUISITOS]
+
+    def en_seccion_requisitos(self, frase: str) -> bool:
+        """True si `frase` (ya normalizada) aparece en la ventana de la sección de requisitos."""
+        return bool(self.ventana_requisitos) and contiene_frase(self.ventana_requisitos, frase)
+
+    # ----------------------------
+    # Segmentos
+    # ----------------------------
+    @cached_property
+    def trozos(self) -> list:
+        """Vista nlp partida por salto / punto / ';' / '|' (sin recortar; puede haber vacíos)."""
+        return _RE_SEGMENTO.split(self.nlp)
+
+    @cached_property
+    def segmentos(self) -> list:
+        """[(segmento, palabras)] en orden; palabras sirve de prefiltro en segmentos_con()."""
+        return [(seg, palabras_texto(seg)) for seg in self.trozos]
+
+    def segmentos_con(self, frase: str) -> list:
+        """Segmentos (en orden) que contienen `frase` según contiene_frase()."""
+        palabras = palabras_frase(frase)
+        out = []
+        for seg, en_seg in self.segmentos:
+            if palabras is not None and not en_seg.issuperset(palabras):
+                continue
+            if contiene_frase(seg, frase):
+                out.append(seg)
+        return out
+
+    # ----------------------------
+    # Secciones por cabecera
+    # ----------------------------
+    def seccion(self, cabecera: str, paradas: tuple) -> str:
+        """
+        Texto (vista nlp) desde la primera aparición de `cabecera` hasta antes de
+        "lo que ofrecemos" o de la primera de `paradas`. "" si la cabecera no aparece.
+        """
+        clave = ("seccion", cabecera, tuple(paradas))
+        if clave not in self._memo:
+            self._memo[clave] = self._seccion(cabecera, paradas)
+        return self._memo[clave]
+
+    def _seccion(self, cabecera, paradas):
+        m = re.search(rf"\b{re.escape(normalizar_para_nlp(cabecera.lower()))}\b", self.nlp)
+        if not m:
+            return ""
+        tail = self.nlp[m.end():]
+
+        # Corte fuerte: "lo que ofrecemos" (beneficios/modalidad no son requisitos)
+        stop_offer = _RE_LO_QUE_OFRECEMOS.search(tail)
+        if stop_offer:
+            tail = tail[:stop_offer.start()]
+
+        cut = None
+        for h in paradas:
+            mh = re.search(rf"\b{re.escape(normalizar_para_nlp(h.lower()))}\b", tail)
+            if mh:
+                pos = mh.start()
+                cut = pos if cut is None else min(cut, pos)
+        if cut is not None:
+            tail = tail[:cut]
+        return tail
+
+    # ----------------------------
+    # Memo de vistas propias de cada módulo
+    # ----------------------------
+    def memo(self, clave, funcion):
+        """Valor funcion() calculado una sola vez por estructura y clave."""
+        if clave not in self._memo:
+            self._memo[clave] = funcion()
+        return self._memo[clave]
+
+
+# ----------------------------
+# CACHÉ POR TEXTO
+# ----------------------------
+# Pocas entradas: en un análisis se consultan la oferta y alguna de sus vistas.
+ESTRUCTURAS_MAX = 8
+
+_ESTRUCTURAS = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def estructura_de(texto) -> EstructuraOferta:
+    """EstructuraOferta de `texto`, construida una vez y reutilizada mientras siga en caché."""
+    texto = texto or ""
+    with _LOCK:
+        estructura = _ESTRUCTURAS.get(texto)
+        if estructura is not None:
+            _ESTRUCTURAS.move_to_end(texto)
+            return estructura
+    estructura = EstructuraOferta(texto)
+    with _LOCK:
+        _ESTRUCTURAS[texto] = estructura
+        while len(_ESTRUCTURAS) > ESTRUCTURAS_MAX:
+            _ESTRUCTURAS.popitem(last=False)
+    return estructura
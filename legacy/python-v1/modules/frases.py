@@ -0,0 +1,513 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# frases.py - Búsqueda tolerante de frases con patrones compilados y cacheados
+# ==========================
+import re
+import threading
+from collections import OrderedDict
+
+# ----------------------------
+# PALABRAS (plegado compartido por el índice y el escáner)
+# ----------------------------
+# Una frase se ve como la secuencia de palabras \w+ de sus tokens, plegadas a minúsculas.
+# Si la regex de contiene_frase() casa, las palabras del tramo del texto son exactamente
+# esas (plegadas igual): índice y autómata generan candidatas y la regex las confirma.
+_RE_PALABRA = re.compile(r"\w+")
+
+# Alfabeto verificado: para estos caracteres, IGNORECASE equivale a comparar _plegar()
+# y no cambia el carácter de palabra/no palabra. Frases con otros caracteres, o que
+# empiezan/terminan en un carácter no-palabra ("c++", ".net"), se buscan siempre con
+# su regex (ni índice ni autómata).
+_ALFABETO_SEGURO = frozenset(
+    [chr(c) for c in range(32, 127)] + [chr(c) for c in range(0xC0, 0x100)]
+)
+_PLIEGUE_PALABRA = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+
+def _plegar(palabra: str) -> str:
+    if palabra.isascii():
+        return palabra.lower()
+    return palabra.translate(_PLIEGUE_PALABRA).casefold()
+
+
+def _palabras_frase(frase: str):
+    """Secuencia de palabras plegadas de la frase, o None si va por la ruta regex."""
+    tokens = frase.split()
+    if not tokens or not all(c in _ALFABETO_SEGURO for c in frase):
+        return None
+    if not (_RE_PALABRA.match(tokens[0]) and _RE_PALABRA.fullmatch(tokens[-1][-1])):
+        return None
+    palabras = [_plegar(p) for t in tokens for p in _RE_PALABRA.findall(t)]
+    return tuple(palabras) or None
+
+
+# ----------------------------
+# CACHÉ LRU DE PATRONES DE FRASE
+# ----------------------------
+# Clave: la frase tal como llega. Valor: (regex compilada, palabras plegadas); la regex
+# es None si la frase no tiene tokens y las palabras None si la frase no admite índice.
+# La caché interna de `re` tiene ~512 entradas y se vacía entera al llenarse; con cientos
+# de frases distintas en bucles anidados se recompilaba casi en cada llamada.
+CACHE_FRASES_MAX = 4096
+
+_CACHE_FRASES = OrderedDict()
+_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0, "indices": 0}
+_CACHE_LOCK = threading.Lock()
+
+
+def _compilar(frase: str):
+    tokens = [re.escape(t) for t in frase.strip().split()]
+    if not tokens:
+        return None, None
+    patron = re.compile(r"\b" + r"\W+".join(tokens) + r"\b", flags=re.IGNORECASE)
+    return patron, _palabras_frase(frase)
+
+
+def _entrada_frase(frase: str):
+    with _CACHE_LOCK:
+        try:
+            entrada = _CACHE_FRASES[frase]
+        except KeyError:
+            pass
+        else:
+            _CACHE_FRASES.move_to_end(frase)
+            _CACHE_STATS["hits"] += 1
+            return entrada
+        _CACHE_STATS["misses"] += 1
+
+    entrada = _compilar(frase)
+    with _CACHE_LOCK:
+        _CACHE_FRASES[frase] = entrada
+        while len(_CACHE_FRASES) > CACHE_FRASES_MAX:
+            _CACHE_FRASES.popitem(last=False)
+            _CACHE_STATS["evictions"] += 1
+    return entrada
+
+
+def patron_frase(frase: str):
+    """
+    Regex compilada de `frase`: tokens separados por \\W+ y anclados con \\b,
+    sin distinguir mayúsculas. Devuelve None si la frase está vacía.
+    """
+    return _entrada_frase(frase)[0]
+
+
+def stats_cache_frases() -> dict:
+    with _CACHE_LOCK:
+        stats = dict(_CACHE_STATS)
+        stats["tamano"] = len(_CACHE_FRASES)
+        stats["indices_vivos"] = sum(1 for i in _INDICES.values() if i is not None)
+    consultas = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / consultas, 4) if consultas else 0.0
+    return stats
+
+
+def limpiar_cache_frases():
+    with _CACHE_LOCK:
+        _CACHE_FRASES.clear()
+        _INDICES.clear()
+        for k in _CACHE_STATS:
+            _CACHE_STATS[k] = 0
+
+
+def palabras_frase(frase: str):
+    """Palabras plegadas de `frase` (cacheadas), o None si la frase va por la ruta regex."""
+    return _entrada_frase(frase)[1] if frase else None
+
+
+def palabras_texto(texto: str) -> frozenset:
+    """Conjunto de palabras plegadas de `texto` (prefiltro exacto para palabras_frase)."""
+    return frozenset(_plegar(p) for p in _RE_PALABRA.findall(texto or ""))
+
+
+# ----------------------------
+# ÍNDICE PALABRA -> POSICIONES (textos largos consultados muchas veces)
+# ----------------------------
+# El CV normalizado se consulta con cientos de frases por análisis. Un índice de sus
+# palabras hace que cada consulta cueste lo que las apariciones de la palabra más rara
+# de la frase, no lo que mide el CV. Se construye la segunda vez que se consulta un
+# mismo texto largo: un texto consultado una sola vez no paga el índice.
+INDICE_MIN_CHARS = 300
+INDICES_MAX = 16
+
+_INDICES = OrderedDict()     # texto -> IndicePalabras (o None: visto una vez)
+
+
+class IndicePalabras:
+    """Posiciones de cada palabra plegada de `texto` (mismas palabras que \\w+)."""
+
+    def __init__(self, texto: str):
+        self.texto = texto
+        self.spans = [m.span() for m in _RE_PALABRA.finditer(texto)]
+        self.palabras = tuple(_plegar(texto[a:b]) for a, b in self.spans)
+        self.posiciones = {}
+        for i, p in enumerate(self.palabras):
+            self.posiciones.setdefault(p, []).append(i)
+
+    def contiene(self, frase: str) -> bool:
+        """Mismo resultado que contiene_frase(self.texto, frase)."""
+        patron, palabras = _entrada_frase(frase)
+        if patron is None:
+            return False
+        if palabras is None:
+            return patron.search(self.texto) is not None
+        # Anclar en la palabra con menos apariciones (si falta alguna, no hay frase)
+        ancla, menor = 0, None
+        for j, p in enumerate(palabras):
+            pos = self.posiciones.get(p)
+            if pos is None:
+                return False
+            if menor is None or len(pos) < len(menor):
+                ancla, menor = j, pos
+        n = len(palabras)
+        for k in menor:
+            i = k - ancla
+            if i < 0 or self.palabras[i:i + n] != palabras:
+                continue
+            if patron.fullmatch(self.texto, self.spans[i][0], self.spans[i + n - 1][1]):
+                return True
+        return False
+
+    def cuantas(self, palabras) -> int:
+        """Cuántas de `palabras` aparecen como palabra completa del texto."""
+        return sum(1 for p in palabras if _plegar(p) in self.posiciones)
+
+
+def indice_de(texto: str) -> IndicePalabras:
+    """Índice de `texto` (se construye y se guarda en la caché si no existía)."""
+    with _CACHE_LOCK:
+        indice = _INDICES.get(texto)
+        if indice is not None:
+            _INDICES.move_to_end(texto)
+            return indice
+    indice = IndicePalabras(texto)
+    with _CACHE_LOCK:
+        _INDICES[texto] = indice
+        _INDICES.move_to_end(texto)
+        _CACHE_STATS["indices"] += 1
+        while len(_INDICES) > INDICES_MAX:
+            _INDICES.popitem(last=False)
+    return indice
+
+
+def _indice_reutilizable(texto: str):
+    """Índice de un texto largo a partir de su segunda consulta; None en otro caso."""
+    if len(texto) < INDICE_MIN_CHARS:
+        return None
+    with _CACHE_LOCK:
+        if texto not in _INDICES:
+            _INDICES[texto] = None
+            while len(_INDICES) > INDICES_MAX:
+                _INDICES.popitem(last=False)
+            return None
+    return indice_de(texto)
+
+
+# ----------------------------
+# BÚSQUEDA
+# ----------------------------
+def contiene_frase(texto: str, frase: str) -> bool:
+    """
+    Busca una 'frase' dentro de 'texto' tolerando NBSP, saltos, guiones invisibles,
+    y puntuación intermedia (un \\W+ entre tokens).
+    """
+    if not texto or not frase:
+        return False
+    indice = _indice_reutilizable(texto)
+    if indice is not None:
+        return indice.contiene(frase)
+    patron = patron_frase(frase)
+    return patron is not None and patron.search(texto) is not None
+
+
+# Caracteres no ASCII que IGNORECASE empareja con una letra ASCII y que lower() no
+# convierte en ella (el Kelvin sí: lower() ya da "k"). Con esta tabla, si la regex
+# de una frase ASCII casa, cada token de la frase aparece como subcadena del texto plegado.
+_PLIEGUE_ASCII = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017F": "s"})
+
+
+def _texto_plegado(texto: str) -> str:
+    if texto.isascii():
+        return texto.lower()
+    return texto.translate(_PLIEGUE_ASCII).lower()
+
+
+def _descartable(frase: str, plegado: str) -> bool:
+    """True si algún token ASCII de la frase no aparece en el texto: la regex no puede casar."""
+    for t in frase.split():
+        if t.isascii() and t.lower() not in plegado:
+            return True
+    return False
+
+
+def frases_presentes(texto: str, frases) -> list:
+    """
+    Versión por lotes de contiene_frase(): devuelve, en el orden de entrada, las
+    frases de `frases` que aparecen en `texto`. El texto se pliega una vez y las
+    frases cuyos tokens no están como subcadena se descartan sin ejecutar la regex.
+    """
+    if not texto:
+        return []
+    indice = _indice_reutilizable(texto)
+    if indice is not None:
+        return [f for f in frases if f and indice.contiene(f)]
+    plegado = _texto_plegado(texto)
+    encontradas = []
+    for frase in frases:
+        if not frase or _descartable(frase, plegado):
+            continue
+        patron = patron_frase(frase)
+        if patron is not None and patron.search(texto) is not None:
+            encontradas.append(frase)
+    return encontradas
+
+
+def contiene_alguna(texto: str, frases) -> bool:
+    """True si alguna de `frases` aparece en `texto` (se detiene en la primera)."""
+    if not texto:
+        return False
+    indice = _indice_reutilizable(texto)
+    if indice is not None:
+        return any(f and indice.contiene(f) for f in frases)
+    plegado = _texto_plegado(texto)
+    for frase in frases:
+        if not frase or _descartable(frase, plegado):
+            continue
+        patron = patron_frase(frase)
+        if patron is not None and patron.search(texto) is not None:
+            return True
+    return False
+
+
+# ----------------------------
+# ESCÁNER MULTI-FRASE (Aho-Corasick sobre palabras)
+# ----------------------------
+# Autómata construido una vez a partir de un diccionario de frases; una pasada por las
+# palabras del texto encuentra todas las frases candidatas y cada candidata se confirma
+# con su patrón de contiene_frase() sobre el tramo exacto. Resultado idéntico a llamar a
+# contiene_frase() frase por frase, pero sin recorrer el texto una vez por frase.
+class EscanerFrases:
+    """
+    Detector de muchas frases a la vez. `frases` es un dict {frase: origen} (o un
+    iterable de frases); buscar() devuelve (frase, inicio, fin, origen) por cada
+    aparición, con los índices de carácter en el texto original.
+    """
+
+    def __init__(self, frases):
+        if not isinstance(frases, dict):
+            frases = dict.fromkeys(frases)
+        self.origenes = {}
+        self._goto = [{}]          # nodo -> {palabra: nodo}
+        self._salida = [[]]        # nodo -> [(frase, nº palabras)]
+        self._fallo = [0]
+        self._regex = []           # frases fuera del alfabeto seguro
+        for frase, origen in frases.items():
+            if not frase or frase in self.origenes:
+                continue
+            self.origenes[frase] = origen
+            palabras = _palabras_frase(frase)
+            if palabras is None:
+                if frase.split():
+                    self._regex.append(frase)
+                continue
+            nodo = 0
+            for p in palabras:
+                siguiente = self._goto[nodo].get(p)
+                if siguiente is None:
+                    siguiente = len(self._goto)
+                    self._goto[nodo][p] = siguiente
+                    self._goto.append({})
+                    self._salida.append([])
+                    self._fallo.append(0)
+                nodo = siguiente
+            self._salida[nodo].append((frase, len(palabras)))
+        self._construir_fallos()
+
+    def _construir_fallos(self):
+        cola = list(self._goto[0].values())
+        i = 0
+        while i < len(cola):
+            nodo = cola[i]
+            i += 1
+            for palabra, hijo in self._goto[nodo].items():
+                f = self._fallo[nodo]
+                while f and palabra not in self._goto[f]:
+                    f = self._fallo[f]
+                destino = self._goto[f].get(palabra, 0)
+                self._fallo[hijo] = destino if destino != hijo else 0
+                self._salida[hijo] = self._salida[hijo] + self._salida[self._fallo[hijo]]
+                cola.append(hijo)
+
+    def buscar(self, texto: str) -> list:
+        if not texto:
+            return []
+        spans = [m.span() for m in _RE_PALABRA.finditer(texto)]
+        goto, fallo, salida = self._goto, self._fallo, self._salida
+        hallazgos = []
+        nodo = 0
+        for i, (ini, fin) in enumerate(spans):
+            palabra = _plegar(texto[ini:fin])
+            while nodo and palabra not in goto[nodo]:
+                nodo = fallo[nodo]
+            nodo = goto[nodo].get(palabra, 0)
+            for frase, n in salida[nodo]:
+                inicio = spans[i - n + 1][0]
+                if patron_frase(frase).fullmatch(texto, inicio, fin):
+                    hallazgos.append((frase, inicio, fin, self.origenes[frase]))
+        for frase in self._regex:
+            for m in patron_frase(frase).finditer(texto):
+                hallazgos.append((frase, m.start(), m.end(), self.origenes[frase]))
+        return hallazgos
+
+    def presentes(self, texto: str) -> set:
+        """Conjunto de frases que aparecen en `texto`."""
+        return {h[0] for h in self.buscar(texto)}
+
+
+# ----------------------------
+# ESCÁNER DE SUBCADENAS (literal, sin tolerancia)
+# ----------------------------
+# Para términos que se comparan con `t in texto` (reglas de requisitos). Los términos se
+# pliegan en un trie y el trie se escribe como UNA regex: el motor de re avanza carácter
+# a carácter por el texto y en cada posición baja por el trie, así el coste depende del
+# texto y de las apariciones, no del número de términos.
+# En cada posición la regex devuelve el término más largo que empieza ahí; los demás
+# términos que empiezan en esa posición son prefijos suyos (se precalculan).
+def _regex_trie(nodo: dict) -> str:
+    ramas = []
+    for c in sorted(k for k in nodo if k != ""):
+        ramas.append(re.escape(c) + _regex_trie(nodo[c]))
+    if not ramas:
+        return ""
+    cuerpo = ramas[0] if len(ramas) == 1 else "(?:" + "|".join(ramas) + ")"
+    if "" in nodo:
+        # un término termina aquí: lo que sigue es opcional (voraz => el más largo)
+        return "(?:" + cuerpo + ")?"
+    return cuerpo
+
+
+class EscanerSubcadenas:
+    """
+    Detector de muchas subcadenas literales a la vez. presentes(texto) devuelve el
+    conjunto de términos t con `t in texto`, en una sola pasada por el texto.
+    Los términos vacíos se ignoran (quien los use decide qué hacer con ellos).
+    """
+
+    def __init__(self, terminos):
+        self.terminos = frozenset(t for t in terminos if t)
+        trie = {}
+        for t in self.terminos:
+            nodo = trie
+            for c in t:
+                nodo = nodo.setdefault(c, {})
+            nodo[""] = True
+        # término más largo en una posición -> todos los términos que son prefijo suyo
+        self._prefijos = {
+            t: frozenset(t[:i] for i in range(1, len(t) + 1) if t[:i] in self.terminos)
+            for t in self.terminos
+        }
+        self._regex = re.compile("(?=(" + _regex_trie(trie) + "))") if self.terminos else None
+
+    def presentes(self, texto: str) -> set:
+        if not texto or self._regex is None:
+            return set()
+        encontrados, vistos = set(), set()
+        for m in self._regex.finditer(texto):
+            t = m.group(1)
+            if t not in vistos:
+                vistos.add(t)
+                encontrados |= self._prefijos[t]
+        return encontrados
+
+
+# ----------------------------
+# TABLAS DE EQUIVALENCIA (grupos de variantes)
+# ----------------------------
+# Una tabla {clave: variantes} se compila una vez: las variantes se normalizan al construir
+# y todas van a un solo escáner, así saber qué grupos aparecen en un texto es una pasada
+# por el texto en lugar de normalizar y buscar variante por variante en cada consulta.
+class GruposEquivalencia:
+    """
+    Tabla {clave: variantes} compilada. `normalizar` se aplica a cada variante al
+    construir (la misma normalización que ya tiene el texto consultado). Con
+    literal=True una variante aparece si es subcadena del texto (`v in texto`); si no,
+    con la tolerancia de contiene_frase().
+    - claves_en(texto): frozenset de claves con alguna variante presente
+    - tramos_en(texto): {clave: (ini, fin)} de su primera variante presente (en el orden
+      de la tabla), como patron_frase(v).search(texto); solo sin literal
+    El último texto consultado se recuerda: varias comprobaciones sobre el mismo CV
+    comparten la pasada.
+    """
+
+    def __init__(self, grupos: dict, normalizar=None, literal: bool = False):
+        self.literal = literal
+        self.variantes = {}     # clave -> variantes normalizadas (orden de la tabla, sin vacías)
+        self._claves = {}       # variante normalizada -> claves que la usan
+        for clave, variantes in grupos.items():
+            lista = []
+            for v in variantes:
+                v = normalizar(v) if normalizar is not None else v
+                if v and v not in lista:
+                    lista.append(v)
+                    self._claves.setdefault(v, []).append(clave)
+            self.variantes[clave] = tuple(lista)
+        if literal:
+            self._escaner = EscanerSubcadenas(self._claves)
+        else:
+            self._escaner = EscanerFrases(dict.fromkeys(self._claves))
+        self._ultimo = (None, frozenset())
+
+    def claves_en(self, texto: str) -> frozenset:
+        if not texto:
+            return frozenset()
+        ultimo = self._ultimo
+        if ultimo[0] == texto:
+            return ultimo[1]
+        claves = frozenset(c for v in self._escaner.presentes(texto) for c in self._claves[v])
+        self._ultimo = (texto, claves)
+        return claves
+
+    def tramos_en(self, texto: str) -> dict:
+        if not texto or self.literal:
+            return {}
+        primero = {}
+        for frase, ini, fin, _ in self._escaner.buscar(texto):
+            if frase not in primero or ini < primero[frase][0]:
+                primero[frase] = (ini, fin)
+        tramos = {}
+        for clave, variantes in self.variantes.items():
+            for v in variantes:
+                if v in primero:
+                    tramos[clave] = primero[v]
+                    break
+        return tramos
@@ -35,36 +35,21 @@
 import os
 import json
 import re
-import unicodedata
 from math import exp
-import spacy
+import time
+import numpy as np
+from modules import modelo_nlp, motor, snapshot_vocab
+from modules.modelo_nlp import procesar, procesar_lote
+from modules.contexto import doc_de
+from modules.normalizacion import quitar_marcas, sustituir_alias
 
 
 # ----------------------------
-# Carga robusta de spaCy (fallbacks)
+# Modelo spaCy (registro compartido, fallback lg -> md -> sm)
 # ----------------------------
+# Proxy perezoso: el modelo se carga en el primer uso (o con motor.warm_up())
+nlp = modelo_nlp.NLP
 
-# --- Carga robusta del modelo  ---
-nlp = None
-
-# 1) Intentar cargar por import del paquete 
-try:
-    import es_core_news_lg  # type: ignore
-    nlp = es_core_news_lg.load()
-except Exception:
-    try:
-        import es_core_news_md  # type: ignore
-        nlp = es_core_news_md.load()
-    except Exception:
-        try:
-            import es_core_news_sm  # type: ignore
-            nlp = es_core_news_sm.load()
-        except Exception as e:
-            raise RuntimeError(
-                "No se encontró un modelo de spaCy. Instala en el entorno:\n"
-                "  python -m spacy download es_core_news_sm\n"
-                f"Detalle: {e}"
-            )
 # ----------------------------
 # Stopwords locales
 # ----------------------------
@@ -84,10 +69,7 @@ def _strip_accents(s: str) -> str:
     """Elimina tildes y normaliza a forma ASCII básica."""
     if not s:
         return ""
-    return "".join(
-        c for c in unicodedata.normalize("NFD", s)
-        if unicodedata.category(c) != "Mn"
-    )
+    return quitar_marcas(s)
 
 def normalizar_simple(s: str) -> str:
     """
@@ -194,7 +176,27 @@ def _dedupe(seq):
     return list(dict.fromkeys(seq))
 
 def construir_diccionario_lemas():
-    global tech_skills, soft_skills, exp_terms
+    """
+    (Re)construye LEMA_A_PALABRA incluyendo skills_custom.json, junto con los
+    vectores de categorías y los términos protegidos (o los carga del snapshot).
+    Paso 'vocabulario' del motor: normalmente se construye solo en el primer uso.
+    """
+    motor.MOTOR.reconstruir("vocabulario")
+
+def asegurar_vocabulario():
+    """Garantiza que listas de skills y LEMA_A_PALABRA estén construidos."""
+    motor.asegurar("vocabulario")
+
+# Se incrementa en cada (re)construcción del vocabulario; sirve para invalidar
+# resultados memorizados que dependen de LEMA_A_PALABRA
+_VERSION_VOCAB = 0
+
+def version_vocabulario() -> int:
+    return _VERSION_VOCAB
+
+def _construir_diccionario_lemas():
+    global tech_skills, soft_skills, exp_terms, _VERSION_VOCAB
+    _VERSION_VOCAB += 1
 
     if os.path.exists(CUSTOM_SKILLS_FILE):
         with open(CUSTOM_SKILLS_FILE, "r", encoding="utf-8") as f:
@@ -228,10 +230,35 @@ def construir_diccionario_lemas():
     soft_skills[:] = _dedupe(soft_skills)
     exp_terms[:]   = _dedupe(exp_terms)
 
+    # Arranque en caliente: si nada de lo que determina el estado derivado cambió,
+    # se carga el snapshot (lemas + vectores de categorías + protegidos) sin re-analizar.
+    clave = _clave_snapshot()
+    datos = snapshot_vocab.cargar(clave)
+    if datos is not None:
+        try:
+            _aplicar_snapshot(datos)
+            print("⚡ [habilidades] Vocabulario derivado cargado desde snapshot.")
+            return
+        except Exception:
+            pass
+
+    _calcular_lemas()
+
+    t0 = time.perf_counter()
+    _calcular_categorias()
+    motor.MOTOR.marcar_listo("categorias", time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    _construir_protegidos()
+    motor.MOTOR.marcar_listo("protegidos", time.perf_counter() - t0)
+
+    snapshot_vocab.guardar(clave, _datos_snapshot())
+
+def _calcular_lemas():
     LEMA_A_PALABRA.clear()
     all_terms = tech_skills + soft_skills + exp_terms
     if all_terms:
-        doc = nlp(". ".join(all_terms))
+        doc = procesar(". ".join(all_terms), "lemas")
         for token in doc:
             if token.is_alpha:
                 lema = token.lemma_.lower()
@@ -241,6 +268,47 @@ def construir_diccionario_lemas():
         t = term.strip().lower()
         if t:
             LEMA_A_PALABRA.setdefault(t, set()).add(t)
+    _calcular_lexico(all_terms)
+
+# ----------------------------
+# Léxico de palabras sueltas: palabra -> (lema, POS, is_alpha)
+# ----------------------------
+# Cada palabra del vocabulario se analiza AISLADA (igual que procesar(palabra, "lemas")),
+# así las consultas de un solo token (_soft_match, es_skill_valida_string) se responden
+# sin pasar por spaCy. Solo entran palabras que spaCy tokeniza como un único token.
+LEXICO_PALABRAS = {}
+_LEXICO_STATS = {"hits": 0, "misses": 0}
+
+def _calcular_lexico(terminos):
+    palabras = sorted({w for t in terminos for w in t.strip().lower().split()})
+    LEXICO_PALABRAS.clear()
+    if not palabras:
+        return
+    for palabra, doc in zip(palabras, procesar_lote(palabras, "lemas")):
+        if len(doc) == 1:
+            tok = doc[0]
+            LEXICO_PALABRAS[palabra] = (tok.lemma_, tok.pos_, tok.is_alpha)
+
+def rasgos_palabra(texto: str):
+    """
+    (lema, POS, is_alpha) de `texto` si es una palabra del léxico; None si no lo es
+    (el llamador recurre a spaCy). Lleva la cuenta de aciertos para stats_lexico().
+    """
+    asegurar_vocabulario()
+    rasgos = LEXICO_PALABRAS.get(texto)
+    if rasgos is None:
+        _LEXICO_STATS["misses"] += 1
+    else:
+        _LEXICO_STATS["hits"] += 1
+    return rasgos
+
+def stats_lexico() -> dict:
+    """Consultas resueltas por el léxico (hits) frente a las que acabaron en spaCy (misses)."""
+    stats = dict(_LEXICO_STATS)
+    stats["tamano"] = len(LEXICO_PALABRAS)
+    consultas = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / consultas, 4) if consultas else 0.0
+    return stats
 
 # ============================
 # Ruido dinámico (autoaprendizaje)
@@ -413,29 +481,94 @@ PATTERNS = [
     re.compile(r"^(innovaci[oó]n|estrategia)\s+(tecnol[oó]gica)$"),
 ]
 
-def _build_category_docs():
-    corpora = {
-        "tecnicas": " ".join(sorted(set(tech_skills))),
-        "blandas": " ".join(sorted(set(soft_skills))),
-        "experiencia": " ".join(sorted(set(exp_terms))),
-    }
-    docs = {}
+# Dos referencias de categorías (centroides), como en el flujo original:
+# - "listas": listas vivas ya fusionadas con skills_custom.json
+#   (clasificar_skill, _categoria_por_similitud, tokens de categorizar_texto).
+# - "corpus": el de _similarity_to_corpora; parte de las listas semilla (antes de fusionar
+#   skills_custom.json) y solo tras guardar_skills_custom pasa a las listas completas.
+_LISTAS_SEMILLA = {
+    "tecnicas": list(tech_skills),
+    "blandas": list(soft_skills),
+    "experiencia": list(exp_terms),
+}
+_CORPUS_CON_CUSTOM = False
+
+def _listas_referencia(referencia: str) -> dict:
+    if referencia == "corpus" and not _CORPUS_CON_CUSTOM:
+        return _LISTAS_SEMILLA
+    return {"tecnicas": tech_skills, "blandas": soft_skills, "experiencia": exp_terms}
+
+def _build_category_vectors(listas: dict):
+    """Vector de referencia (vector, norma) por categoría; None si el corpus no tiene vector."""
+    corpora = {cat: " ".join(sorted(set(listas[cat]))) for cat in ("tecnicas", "blandas", "experiencia")}
+    vecs = {}
     for k, text in corpora.items():
-        d = nlp(text) if text.strip() else None
-        docs[k] = d if d is not None and getattr(d, "vector_norm", 0.0) else None
-    return docs
+        d = procesar(text, "vectores") if text.strip() else None
+        norma = getattr(d, "vector_norm", 0.0) if d is not None else 0.0
+        vecs[k] = (np.array(d.vector, dtype=np.float32), float(norma)) if norma else None
+    return vecs
+
+CATEGORIAS = ("tecnicas", "blandas", "experiencia")
+
+REFERENCIAS_CATEGORIAS = ("listas", "corpus")
+
+_CATEGORY_VECS = {ref: None for ref in REFERENCIAS_CATEGORIAS}
+# Centroides apilados por referencia: (nombres, matriz k x dim, normas k); solo categorías con vector
+_MATRIZ_CATEGORIAS = {ref: ((), None, None) for ref in REFERENCIAS_CATEGORIAS}
+
+def _fijar_categorias(referencia: str, vecs: dict):
+    _CATEGORY_VECS[referencia] = vecs
+    nombres = tuple(c for c in CATEGORIAS if vecs.get(c) is not None)
+    if nombres:
+        matriz = np.vstack([vecs[c][0] for c in nombres]).astype(np.float32)
+        normas = np.array([vecs[c][1] for c in nombres], dtype=np.float32)
+        _MATRIZ_CATEGORIAS[referencia] = (nombres, matriz, normas)
+    else:
+        _MATRIZ_CATEGORIAS[referencia] = ((), None, None)
+
+def _calcular_categorias():
+    calculados = []  # (listas, vecs): si ambas referencias coinciden se analiza una sola vez
+    for referencia in REFERENCIAS_CATEGORIAS:
+        listas = _listas_referencia(referencia)
+        vecs = next((v for l, v in calculados if l == listas), None)
+        if vecs is None:
+            vecs = _build_category_vectors(listas)
+            calculados.append((listas, vecs))
+        _fijar_categorias(referencia, vecs)
+
+def _construir_categorias():
+    asegurar_vocabulario()
+    _calcular_categorias()
+
+def matriz_categorias(referencia: str = "listas"):
+    """
+    Centroides de las categorías como matriz: (nombres, M[k x dim], normas[k]).
+    referencia: "listas" (listas fusionadas) o "corpus" (el de _similarity_to_corpora).
+    Se calculan una vez y solo se recalculan cuando cambian las listas de skills
+    (construir_diccionario_lemas / guardar_skills_custom).
+    """
+    motor.asegurar("categorias")
+    return _MATRIZ_CATEGORIAS[referencia]
 
-_CATEGORY_DOCS = _build_category_docs()
+def similitudes_categorias(vector, norma, referencia: str = "listas") -> dict:
+    """
+    {categoría: similitud coseno} de un vector contra cada centroide (misma
+    fórmula que Doc.similarity / Token.similarity), en el orden de CATEGORIAS.
+    Vacío si el vector es nulo.
+    """
+    nombres, matriz, normas = matriz_categorias(referencia)
+    if not norma or not nombres:
+        return {}
+    sims = (matriz @ np.asarray(vector, dtype=np.float32)) / (normas * np.float32(norma))
+    return {c: float(s) for c, s in zip(nombres, sims)}
 
 def _similarity_to_corpora(text: str) -> float:
-    d = nlp(text)
-    if not getattr(d, "vector_norm", 0.0):
+    d = procesar(text, "vectores")
+    norma = getattr(d, "vector_norm", 0.0)
+    if not norma:
         return 0.0
     best = 0.0
-    for ref in _CATEGORY_DOCS.values():
-        if ref is None or getattr(ref, "vector_norm", 0.0) == 0.0:
-            continue
-        s = d.similarity(ref)
+    for s in similitudes_categorias(d.vector, norma, "corpus").values():
         if s > best:
             best = s
     return best
@@ -490,7 +623,7 @@ def _skillness(frase_o_lemma: str) -> float:
         if txt.startswith(pfx + " "):
             if not _matches_patterns(txt):
                 return 0.0
-    doc = nlp(txt)
+    doc = procesar(txt, "chunks")
     if not doc:
         return 0.0
 
@@ -520,6 +653,7 @@ def _skillness(frase_o_lemma: str) -> float:
 # Autoaprendizaje (guardar skills)
 # ----------------------------
 def guardar_skills_custom(nuevas_skills):
+    global _CORPUS_CON_CUSTOM
     SCHEMA_KEYS = ["tecnicas","blandas","experiencia","pendiente"]
 
     if os.path.exists(CUSTOM_SKILLS_FILE):
@@ -540,6 +674,7 @@ def guardar_skills_custom(nuevas_skills):
         data = {k: loaded.get(k, []) for k in SCHEMA_KEYS}
 
     from modules.analisis_basico import categorizar_texto, normalizar_para_nlp
+    asegurar_vocabulario()
 
     for skill in nuevas_skills:
         skill_norm = normalizar_para_nlp(skill).lower().strip()
@@ -570,8 +705,8 @@ def guardar_skills_custom(nuevas_skills):
     with open(CUSTOM_SKILLS_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
-    global _CATEGORY_DOCS
-    _CATEGORY_DOCS = _build_category_docs()
+    _CORPUS_CON_CUSTOM = True
+    motor.MOTOR.invalidar("categorias")
 
     print("💾 [habilidades] Skills nuevas (aprendizaje) guardadas y listas para próximos análisis.")
 
@@ -579,22 +714,12 @@ def guardar_skills_custom(nuevas_skills):
 # Clasificar una skill por similitud
 # ----------------------------
 def clasificar_skill(skill):
-    doc_skill = nlp(skill)
+    asegurar_vocabulario()
+    doc_skill = procesar(skill, "vectores")
     if not getattr(doc_skill, "vector_norm", 0.0):
         return "tecnicas"
-    categorias = {
-        "tecnicas": " ".join(sorted(set(tech_skills))),
-        "blandas": " ".join(sorted(set(soft_skills))),
-        "experiencia": " ".join(sorted(set(exp_terms))),
-    }
     mejor_cat, mejor_score = None, 0.0
-    for cat, corpus in categorias.items():
-        if not corpus.strip():
-            continue
-        doc_lista = nlp(corpus)
-        if not getattr(doc_lista, "vector_norm", 0.0):
-            continue
-        s = doc_skill.similarity(doc_lista)
+    for cat, s in similitudes_categorias(doc_skill.vector, doc_skill.vector_norm).items():
         if s > mejor_score:
             mejor_score, mejor_cat = s, cat
     return mejor_cat or "tecnicas"
@@ -688,12 +813,62 @@ def build_protected_terms():
 
     return protected
 
-PROTECTED_TERMS = build_protected_terms()
+PROTECTED_TERMS = set()
+
+def _construir_protegidos():
+    PROTECTED_TERMS.clear()
+    PROTECTED_TERMS.update(build_protected_terms())
+
+# ----------------------------
+# Snapshot del estado derivado (ver snapshot_vocab.py)
+# ----------------------------
+def _clave_snapshot() -> str:
+    listas = {ref: _listas_referencia(ref) for ref in REFERENCIAS_CATEGORIAS}
+    archivos = list(dict.fromkeys([CUSTOM_SKILLS_FILE, _SKILLS_CUSTOM_PATH, _REQ_RULES_PATH]))
+    return snapshot_vocab.calcular_clave(listas, archivos, modelo_nlp.firma_modelo())
+
+def _datos_snapshot() -> dict:
+    return {
+        "lemas": {lema: sorted(palabras) for lema, palabras in LEMA_A_PALABRA.items()},
+        "categorias": {
+            referencia: {
+                cat: ([float(x) for x in ref[0]], ref[1]) if ref is not None else None
+                for cat, ref in (_CATEGORY_VECS[referencia] or {}).items()
+            }
+            for referencia in REFERENCIAS_CATEGORIAS
+        },
+        "protegidos": sorted(PROTECTED_TERMS),
+        "lexico": {palabra: list(rasgos) for palabra, rasgos in LEXICO_PALABRAS.items()},
+    }
+
+def _aplicar_snapshot(datos: dict):
+    lemas = {lema: set(palabras) for lema, palabras in datos["lemas"].items()}
+    categorias = {
+        referencia: {
+            cat: (np.array(ref[0], dtype=np.float32), float(ref[1])) if ref is not None else None
+            for cat, ref in datos["categorias"][referencia].items()
+        }
+        for referencia in REFERENCIAS_CATEGORIAS
+    }
+    protegidos = set(datos["protegidos"])
+    lexico = {palabra: tuple(rasgos) for palabra, rasgos in datos["lexico"].items()}
+
+    LEMA_A_PALABRA.clear()
+    LEMA_A_PALABRA.update(lemas)
+    for referencia, vecs in categorias.items():
+        _fijar_categorias(referencia, vecs)
+    PROTECTED_TERMS.clear()
+    PROTECTED_TERMS.update(protegidos)
+    LEXICO_PALABRAS.clear()
+    LEXICO_PALABRAS.update(lexico)
+    motor.MOTOR.marcar_listo("categorias")
+    motor.MOTOR.marcar_listo("protegidos")
 
 def is_protected_term(term: str) -> bool:
     t = (term or "").strip().lower()
     if not t:
         return False
+    motor.asegurar("protegidos")
     # Protección exacta (término o frase)
     if t in PROTECTED_TERMS:
         return True
@@ -729,40 +904,32 @@ EXCLUDE_TERMS = set({
     "institucion","institución","fundacion","fundación","colombia"
 })
 
-# Fusión con dinámicos aprendidos
-try:
-    EXCLUDE_TERMS |= dynamic_exclude_terms(threshold=NOISE_THRESHOLD)
-except Exception:
-    pass
+def _fusionar_exclusiones():
+    """Fusión con dinámicos aprendidos (lee noise_terms.json; paso 'exclusiones' del motor)."""
+    try:
+        EXCLUDE_TERMS.update(dynamic_exclude_terms(threshold=NOISE_THRESHOLD))
+    except Exception:
+        pass
 
-# Protección explícita de términos competenciales clave
-EXCLUDE_TERMS -= PROTECTED
+    # Protección explícita de términos competenciales clave
+    EXCLUDE_TERMS.difference_update(PROTECTED)
 
 
 def _normalize_local_alias(texto: str) -> str:
-    _ALIAS_REGEX_LOCAL = [
-        (r"(?i)fin[\-\s]?tech", "fintech"),
-        (r"(?i)ciber[\-\s]?seguridad", "ciberseguridad"),
-        (r"(?i)big[\-\s]?data", "big data"),
-        (r"(?i)machine[\-\s]?learning", "machine learning"),
-        (r"(?i)\bservicio\s+sla\b", "cumplimiento de sla"),
-        (r"(?i)\bacuerdos?\s+de\s+servicio\b", "cumplimiento de sla"),
-    ]
-    t = texto or ""
-    for patron, repl in _ALIAS_REGEX_LOCAL:
-        t = re.sub(patron, repl, t)
-    return t
-
-def detectar_nuevas_habilidades(texto_oferta, umbral_longitud=4, top_k=12):
+    """Alias del ámbito "local" de la tabla única (modules/normalizacion.py), en una pasada."""
+    return sustituir_alias(texto or "", "local")
+
+def detectar_nuevas_habilidades(texto_oferta, umbral_longitud=4, top_k=12, ctx=None):
     """
     Extrae candidatos de "nuevas habilidades" desde el texto de la oferta.
     Corregido el orden de evaluación y endurecido el filtro de ruido.
+    ctx (ContextoAnalisis, opcional): reutiliza los Docs del análisis en curso.
     """
     if not texto_oferta:
         return []
 
     texto_norm = _normalize_local_alias(texto_oferta.lower())
-    doc = nlp(texto_norm)
+    doc = doc_de(texto_norm, "chunks", ctx)
     candidatos = {}
 
     # 1) Frases nominales (compuestos útiles)
@@ -795,7 +962,7 @@ def detectar_nuevas_habilidades(texto_oferta, umbral_longitud=4, top_k=12):
             continue
 
         # 4. Frases sin verbo o solo con verbos auxiliares
-        frase_doc = nlp(frase)
+        frase_doc = procesar(frase, "lemas")
         verbs = [t.lemma_.lower() for t in frase_doc if t.pos_ == "VERB"]
         if verbs and all(v in {"ser", "estar", "tener", "haber"} for v in verbs):
             _noise_mark(frase)
@@ -826,7 +993,7 @@ def detectar_nuevas_habilidades(texto_oferta, umbral_longitud=4, top_k=12):
         head_ok = False
         try:
             # Analizar de nuevo para obtener head noun
-            doc_tmp = nlp(frase)
+            doc_tmp = procesar(frase, "chunks")
             for ch in doc_tmp.noun_chunks:
                 if _head_is_professional(ch):
                     head_ok = True
@@ -839,7 +1006,7 @@ def detectar_nuevas_habilidades(texto_oferta, umbral_longitud=4, top_k=12):
             continue
 
         # tokens validados
-        toks_validos = [t for t in nlp(frase) if t.is_alpha and t.lemma_.lower() not in STOPWORDS]
+        toks_validos = [t for t in procesar(frase, "lemas") if t.is_alpha and t.lemma_.lower() not in STOPWORDS]
         if not toks_validos:
             continue
 
@@ -902,7 +1069,7 @@ def frase_en_texto(frase: str, texto: str) -> bool:
         return False
 
     # Contar cuántos tokens clave de la frase aparecen en el texto
-    texto_tokens = t.split()
+    texto_tokens = set(t.split())
     hits = sum(1 for w in tokens if w in texto_tokens)
 
     # Regla:
@@ -915,3 +1082,12 @@ def frase_en_texto(frase: str, texto: str) -> bool:
     needed = max(2, (len(tokens) + 1) // 2)
     return hits >= needed
 
+
+
+# ----------------------------
+# Pasos del motor (se construyen en el primer uso o con motor.warm_up())
+# ----------------------------
+motor.MOTOR.registrar_paso("vocabulario", _construir_diccionario_lemas)
+motor.MOTOR.registrar_paso("categorias", _construir_categorias)
+motor.MOTOR.registrar_paso("protegidos", _construir_protegidos)
+motor.MOTOR.registrar_paso("exclusiones", _fusionar_exclusiones)
@@ -0,0 +1,585 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+
+# ==========================
+# hechos.py - Hechos de la oferta y del CV (años, inglés, formación, sectores) extraídos en una pasada
+# ==========================
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from modules.estructura_oferta import estructura_de, _RE_SEGMENTO
+from modules.frases import GruposEquivalencia
+from modules.normalizacion import TextoNormalizado, limpiar_texto, normalizar_para_nlp
+
+# ----------------------------
+# MARCADORES DE REQUISITO DURO / DESEABLE
+# ----------------------------
+HARD_MARKERS = {
+    "obligatorio", "obligatoria", "mandatorio", "mandatoria",
+    "indispensable", "imprescindible", "debe", "deberá", "debera",
+    "requisito excluyente", "excluyente", "mínimo", "minimo", "must",
+    "required","mandatory","essential","must have","required experience",
+    "mandatory requirement", "essential requirement", "must have experience",
+    "must have skill", "required skill", "mandatory skill", "essential skill"
+}
+
+SOFT_MARKERS = {
+    "preferiblemente", "deseable", "idealmente", "se valora", "se valorara",
+    "nice to have", "opcional", "plus", "sera un plus", "será un plus",
+    "valorable", "se aprecia", "se apreciara", "seria un plus", "sería un plus",
+    "se considerara", "se considerará", "considerar[áa]", "seria deseable", "sería deseable"
+}
+
+
+def _alternativa(marcadores) -> re.Pattern:
+    # Una búsqueda de la alternancia equivale a any(m in texto for m in marcadores)
+    return re.compile("|".join(re.escape(m) for m in sorted(set(marcadores))))
+
+_RE_DURO = _alternativa(HARD_MARKERS)
+_RE_BLANDO = _alternativa(SOFT_MARKERS)
+# Los mismos marcadores sin tildes ni signos (texto ya pasado por limpiar_texto)
+_RE_DURO_PLANO = _alternativa(p for p in map(limpiar_texto, HARD_MARKERS) if p)
+_RE_BLANDO_PLANO = _alternativa(p for p in map(limpiar_texto, SOFT_MARKERS) if p)
+
+
+def marcador_duro(texto: str) -> bool:
+    """True si `texto` contiene alguno de HARD_MARKERS (como subcadena)."""
+    return _RE_DURO.search(texto) is not None
+
+def marcador_blando(texto: str) -> bool:
+    """True si `texto` contiene alguno de SOFT_MARKERS (como subcadena)."""
+    return _RE_BLANDO.search(texto) is not None
+
+
+# ----------------------------
+# SECTORES / ÁREAS
+# ----------------------------
+SECTOR_EQUIV = {
+    "financiero": {"financiero", "banca", "banco", "banking", "pagos", "switch", "transaccional", "tarjetas"},
+    "infraestructura": {"infraestructura", "obras", "obra", "construccion", "construcción", "transporte masivo", "civil"},
+    "educativo": {"educativo", "educación", "educacion", "universidad", "docencia", "moodle", "lms"},
+    "tecnologia": {"tecnologia", "tecnología", "ti", "it", "software", "saas", "cloud", "digital"},
+    "manufactura": {"manufactura", "planta", "produccion", "producción", "fabrica", "fábrica", "consumo masivo"},
+    "salud": {"salud", "hospital", "clinica", "clínica", "medico", "médico", "farmaceutica", "farmacéutica", "biotecnologia", "biotecnología"},
+    "logistica": {"logistica", "logística", "supply chain", "cadena de suministro"},
+    "comercial": {"comercial", "ventas", "marketing", "negocios", "cliente"},
+    "publico": {"público", "publico", "gobierno", "estado", "administración pública", "administracion publica"},
+    "energia": {"energía", "energia", "petroleo", "petróleo", "gas", "eléctrico", "electrico", "mineria", "minería"},
+    "turismo": {"turismo", "hotel", "hospitalidad", "viajes", "agencia de viajes"},
+    "legal": {"legal", "abogacia", "abogacía", "juridico", "jurídico", "derecho"},
+    "retail": {"retail", "comercio", "minorista", "mayorista", "cadena de tiendas"},
+    "agroindustria": {"agroindustria", "agricola", "agrícola", "ganaderia", "ganadería", "campo"},
+    "medios y entretenimiento": {"medios", "entretenimiento", "audiovisual", "publicidad", "cine", "musica", "música"},
+    "telecomunicaciones": {"telecomunicaciones", "telecom", "telefonia", "telefonía", "internet", "redes"},
+    "consultoria": {"consultoria", "consultoría", "asesoria", "asesoría", "consulting"},
+    "logistica y transporte": {"logistica", "logística", "transporte", "envios", "envíos", "cadena de suministro"},
+    "sector publico": {"público", "publico", "gobierno", "estado", "administración pública", "administracion publica"},
+    "farmaceutico y biotecnología": {"farmaceutico", "farmacéutico", "biotecnologia", "biotecnología", "salud"},
+    "produccion": {"produccion", "producción", "manufactura", "planta", "fabrica", "fábrica", "industrial"},
+    "textil": {"textil", "confeccion", "moda", "ropa", "vestimenta"},
+    "alimentacion y bebidas": {"alimentacion", "alimentación", "bebidas", "food and beverage", "food & beverage", "restauracion", "restauración"},
+    "consumo masivo": {"consumo masivo", "retail", "comercio", "minorista", "mayorista", "cadena de tiendas"},
+    "servicios profesionales": {"servicios profesionales", "consultoria", "consultoría", "asesoria", "asesoría", "consulting"},
+    "servicios": {"servicios", "atencion al cliente", "atención al cliente", "customer service"},
+    "BPO": {"bpo", "business process outsourcing", "tercerizacion de procesos", "tercerización de procesos"},
+    "cajas de compensacion": {"cajas de compensacion", "cajas de compensación", "beneficios sociales"},
+    "gobierno y administracion publica": {"gobierno", "administracion publica", "administración pública", "estado"}
+}
+
+def _palabras_clave(kws) -> re.Pattern:
+    # \b(?:kw1|kw2|...)\b casa si y solo si casa alguna \bkw\b por separado
+    return re.compile(r"\b(?:" + "|".join(re.escape(kw) for kw in sorted(kws)) + r")\b")
+
+# Una regex por sector (en el orden de SECTOR_EQUIV) y un prefiltro con todas las palabras
+_RE_SECTORES = [(clave, _palabras_clave(kws)) for clave, kws in SECTOR_EQUIV.items()]
+_RE_ALGUN_SECTOR = _palabras_clave(set().union(*SECTOR_EQUIV.values()))
+_RE_POR_SECTOR = dict(_RE_SECTORES)
+
+
+def sectores_en(texto: str) -> list:
+    """Claves de SECTOR_EQUIV (en su orden) con alguna palabra clave en `texto`."""
+    if not _RE_ALGUN_SECTOR.search(texto):
+        return []
+    return [clave for clave, rx in _RE_SECTORES if rx.search(texto)]
+
+def sector_en(texto: str, clave: str) -> bool:
+    """True si `texto` menciona alguna palabra clave del sector `clave`."""
+    rx = _RE_POR_SECTOR.get(clave)
+    return rx is not None and rx.search(texto) is not None
+
+
+# ----------------------------
+# PATRONES (oferta)
+# ----------------------------
+EN_LEVELS = {"a1": 1, "a2": 2, "b1": 3, "b2": 4, "c1": 5, "c2": 6}
+
+_RE_INGLES = re.compile(r"\b(ingles|ingl[eé]s|english)\b")
+_RE_NIVEL_CEFR = re.compile(r"\b(a1|a2|b1|b2|c1|c2)\b")
+
+# Años mínimos (vista plana: sin tildes, "anos")
+_RE_ANOS_EMPRESA = re.compile(r"\b\d{1,2}\s+anos\s+en\s+(el\s+)?(mercado|industria|sector)\b")
+_RE_SENAL_EXPERIENCIA = re.compile(r"\b(experiencia|minim|minimo|anos\s+de\s+experiencia|roles?\s+similares?|cargos?\s+similares?)\b")
+_RE_ANOS_MINIMOS = [re.compile(p) for p in (
+    r"\bminim[oa]\s+(\d{1,2})\s+anos\b",
+    r"\bmas\s+de\s+(\d{1,2})\s+anos\b",
+    r"\b\d{1,2}\s*\+\s*anos\b",
+    r"\b\+(\d{1,2})\s+anos\b",
+    r"\bexperiencia\s+minim[oa]\s+de\s+(\d{1,2})\s+a\s+(\d{1,2})\s+anos\b",
+    r"\bminimo\s+(\d{1,2})\s+a\s+(\d{1,2})\s+anos\b",
+    r"\b(\d{1,2})\s+anos\s+de\s+experiencia\b",
+    r"\bexperiencia\s+de\s+(\d{1,2})\s+anos\b",
+    r"\bexperiencia\s+superior\s+a\s+(\d{1,2})\s+anos\b",
+    r"\bal\s+menos\s+(\d{1,2})\s+anos\b",
+    r"\b(\d{1,2})\s*[\-–]\s*(\d{1,2})\s+anos\b",
+    r"\bminim[oa]\s+de\s+(\d{1,2})\s+anos\b",
+)]
+_RE_NUMERO_CORTO = re.compile(r"\b\d{1,2}\b")
+
+# Años por dominio (por segmento de la vista nlp; el primero que casa manda)
+_RE_ANOS_DOMINIO = [re.compile(p) for p in (
+    r"\bexperiencia\s+minim[oa]\s+de\s+(\d{1,2})\s+a\s+(\d{1,2})\s+anos\b",
+    r"\bminim[oa]\s+(\d{1,2})\s+anos\b",
+    r"\bmas\s+de\s+(\d{1,2})\s+anos\b",
+    r"\b\+(\d{1,2})\s+anos\b",
+)]
+_RE_ANOS_EN = re.compile(r"\banos\s+en\s+([a-z0-9áéíóúñü\s\-]{3,50})\b")
+
+# Formación
+_RE_MAESTRIA_OBLIGATORIA = re.compile(r"\bobligatori[oa]\b.{0,80}\bmaestr[ií]a\b.{0,20}\ben\b\s+([a-z0-9áéíóúñü\s]{3,60})")
+_RE_MAESTRIA_EN = re.compile(r"\bmaestr[ií]a\b.{0,20}\ben\b\s+([a-z0-9áéíóúñü\s]{3,60})")
+_RE_DERECHO = re.compile(r"\b(profesional\s+en\s+derecho|abogado|abogad[oa]|derecho)\b")
+
+
+def _dedupe(items) -> list:
+    out, seen = [], set()
+    for x in items:
+        if x not in seen:
+            out.append(x)
+            seen.add(x)
+    return out
+
+
+# ----------------------------
+# HECHOS DE LA OFERTA
+# ----------------------------
+class HechosOferta:
+    """
+    Hechos de una oferta que consultan las reglas de requisitos.
+    analisis_basico (vistas nlp / plana):
+    - anios_minimos (int | None), anios_minimos_duro (bool)
+    - anios_por_dominio: tupla de {"years", "domain", "hard", "raw"}
+    - ingles: {"min_level", "hard"} | None
+    - maestrias: tupla de "Formación requerida: maestría en <campo>"
+    - sectores: tupla de "Sector requerido: <clave>" / "Sector deseable: <clave>"
+    - requiere_derecho (bool)
+    Es de solo lectura: se comparte entre todas las consultas de la misma oferta.
+    """
+
+    __slots__ = (
+        "anios_minimos", "anios_minimos_duro", "anios_por_dominio", "ingles",
+        "maestrias", "sectores", "requiere_derecho",
+    )
+
+    def __init__(self):
+        self.anios_minimos = None
+        self.anios_minimos_duro = False
+        self.anios_por_dominio = ()
+        self.ingles = None
+        self.maestrias = ()
+        self.sectores = ()
+        self.requiere_derecho = False
+
+
+def hechos_oferta(texto) -> HechosOferta:
+    """HechosOferta de `texto`, extraídos una vez por oferta (memo de su EstructuraOferta)."""
+    estructura = estructura_de(texto)
+    return estructura.memo("hechos", lambda: extraer_hechos_oferta(estructura))
+
+
+def extraer_hechos_oferta(estructura) -> HechosOferta:
+    """
+    Extrae todos los hechos de la oferta: un recorrido por los segmentos de la vista nlp
+    (maestrías, sectores, años por dominio, inglés) más las búsquedas que necesitan el
+    texto completo (años mínimos, maestría obligatoria, derecho).
+    """
+    h = HechosOferta()
+    texto = estructura.texto
+    if not texto:
+        return h
+
+    o = estructura.nlp
+    trozos = estructura.trozos
+
+    maestrias = []
+    for m in _RE_MAESTRIA_OBLIGATORIA.finditer(o):
+        # recortar campo a máximo 6 palabras para evitar capturas largas
+        campo = " ".join(m.group(1).split()[:6]).strip()
+        if campo:
+            maestrias.append(f"Formación requerida: maestría en {campo}")
+
+    sectores, por_dominio = [], []
+    ingles = None
+    for i, trozo in enumerate(trozos):
+        seg = trozo.strip()
+        if not seg:
+            continue
+        # los marcadores no empiezan ni terminan en espacio: da igual el trozo recortado o no
+        duro = marcador_duro(seg)
+        claves = None
+
+        # maestría en X + marcador duro en el mismo segmento
+        if duro and "maestr" in trozo and " en " in trozo:
+            m2 = _RE_MAESTRIA_EN.search(trozo)
+            if m2:
+                campo = " ".join(m2.group(1).split()[:6]).strip()
+                if campo:
+                    maestrias.append(f"Formación requerida: maestría en {campo}")
+
+        # Sector: solo con exigencia (marcador duro) o mención de sector/industria
+        if duro or "sector" in seg or "industria" in seg:
+            claves = sectores_en(seg)
+            if claves:
+                # si hay soft markers y NO hay hard markers => deseable
+                tipo = "deseable" if (not duro and marcador_blando(seg)) else "requerido"
+                sectores.extend(f"Sector {tipo}: {clave}" for clave in claves)
+
+        # Años por dominio ("mínimo 5 años en sector financiero", "+5 años en SAP")
+        if "anos" in seg:
+            y = None
+            for rx in _RE_ANOS_DOMINIO:
+                m = rx.search(seg)
+                if m:
+                    y = int(m.group(1))
+                    break
+            if y is not None:
+                if claves is None:
+                    claves = sectores_en(seg)
+                dom = claves[0] if claves else None
+                if dom is None:
+                    m2 = _RE_ANOS_EN.search(seg)
+                    if m2:
+                        dom = m2.group(1).strip()
+                        if len(dom.split()) > 6:
+                            dom = " ".join(dom.split()[:6])
+                por_dominio.append({
+                    "years": y,
+                    "domain": dom or "",
+                    "hard": duro,
+                    "raw": f"Experiencia requerida: mínimo {y} años en {dom}" if dom else f"Experiencia requerida: mínimo {y} años"
+                })
+
+        # Inglés con nivel (A1-C2)
+        if _RE_INGLES.search(seg):
+            m = _RE_NIVEL_CEFR.search(seg)
+            if m:
+                cand = _nivel_ingles(m.group(1).lower(), seg, trozos, i)
+                ingles = _mejor_nivel(ingles, cand)
+
+    h.maestrias = tuple(_dedupe(maestrias))
+    h.sectores = tuple(_dedupe(sectores))
+    h.anios_por_dominio = tuple(_dedupe_dominios(por_dominio))
+    h.ingles = ingles
+    h.requiere_derecho = bool(_RE_DERECHO.search(o))
+
+    h.anios_minimos = _anios_minimos(texto.plano)
+    if h.anios_minimos:
+        h.anios_minimos_duro = _anios_duros(texto.plano)
+    return h
+
+
+def _nivel_ingles(level, seg, trozos, i) -> dict:
+    # Marcadores sin tildes (PDFs traen "mínimo" con unicode raro)
+    seg_plain = limpiar_texto(seg)
+    seg_soft = _RE_BLANDO_PLANO.search(seg_plain) is not None
+    seg_hard = (
+        "minimo" in seg_plain
+        or "mandatorio" in seg_plain
+        or "obligatorio" in seg_plain
+        or _RE_DURO_PLANO.search(seg_plain) is not None
+    )
+
+    # Contexto inmediato (segmento anterior/siguiente): "Inglés C1. Obligatorio."
+    prev_plain = limpiar_texto(trozos[i - 1].strip()) if i > 0 else ""
+    next_plain = limpiar_texto(trozos[i + 1].strip()) if i + 1 < len(trozos) else ""
+    ctx_hard = any(
+        "minimo" in p or _RE_DURO_PLANO.search(p) is not None for p in (prev_plain, next_plain)
+    )
+    ctx_soft = any(_RE_BLANDO_PLANO.search(p) is not None for p in (prev_plain, next_plain))
+
+    # Hard (en el segmento o su contexto) gana aunque también haya "deseable";
+    # sin señales => soft (conservador)
+    if seg_hard or ctx_hard:
+        hard = True
+    elif seg_soft or ctx_soft:
+        hard = False
+    else:
+        hard = False
+    return {"min_level": level, "hard": hard}
+
+
+def _mejor_nivel(best, cand):
+    # el mayor nivel encontrado (por si aparece B2 y luego C1); a igual nivel, el duro
+    if best is None:
+        return cand
+    n_cand = EN_LEVELS.get(cand["min_level"], 0)
+    n_best = EN_LEVELS.get(best["min_level"], 0)
+    if n_cand > n_best or (n_cand == n_best and cand["hard"] and not best["hard"]):
+        return cand
+    return best
+
+
+def _dedupe_dominios(items) -> list:
+    uniq, seen = [], set()
+    for d in items:
+        k = (d["years"], d["domain"], d["hard"])
+        if k not in seen:
+            uniq.append(d)
+            seen.add(k)
+    return uniq
+
+
+def _anios_minimos(o: str):
+    # Guardarraíl: la antigüedad de la empresa ("10 años en el mercado") no es experiencia requerida
+    o = _RE_ANOS_EMPRESA.sub(" ", o)
+
+    # Si hay "años" pero NO hay señales de experiencia/candidato, no hay requisito
+    if ("anos" in o) and not _RE_SENAL_EXPERIENCIA.search(o):
+        return None
+
+    mins = []
+    for rx in _RE_ANOS_MINIMOS:
+        for m in rx.finditer(o):
+            g = [x for x in m.groups() if x]
+            if g:
+                # rango "3 a 5" -> tomamos 3
+                mins.append(int(g[0]))
+    return min(mins) if mins else None
+
+
+def _anios_duros(plano: str) -> bool:
+    # hard si un segmento con años también trae HARD_MARKERS
+    for seg in _RE_SEGMENTO.split(plano):
+        if ("anos" in seg or "años" in seg) and _RE_NUMERO_CORTO.search(seg) and marcador_duro(seg):
+            return True
+    return False
+
+
+# ----------------------------
+# FORMACIÓN (equivalencias que se buscan en el CV)
+# ----------------------------
+# Equivalencias escalables: cada clave representa un "concepto" y lista variantes aceptables en CV
+ACADEMIC_EQUIV = {
+    
+    "ingenieria de sistemas": {
+        "ingenieria de sistemas", "ingeniería de sistemas",
+        "ingeniero de sistemas", "ingeniera de sistemas",
+        "ingeniero sistemas", "ingeniera sistemas",
+        "ingenieria sistemas", "ingeniería sistemas",
+        "ing de sistemas", "ing. de sistemas",
+        "ing sistemas", "ing. sistemas",
+        "ing en sistemas", "ing. en sistemas",
+        "sistemas"  # (lo dejamos porque en este caso lo usan como afín típico)
+    },
+
+    "informatica": {
+        "informatica", "informática",
+        # Afines que deben aceptar cuando piden "informática o afines"
+        "ingenieria de sistemas", "ingeniería de sistemas",
+        "ingeniero de sistemas", "ingeniera de sistemas",
+        "ingeniero sistemas", "ingeniera sistemas",
+        "ing de sistemas", "ing. de sistemas",
+        "ing sistemas", "ing. sistemas",
+        "sistemas",
+        # otros afines típicos
+        "ingenieria de software", "ingeniería de software",
+        "ingenieria informatica", "ingeniería informática"
+    },
+
+    "mba": {
+        "mba", "master en administracion", "máster en administración",
+        "maestria en administracion", "maestría en administración",
+        "master of business administration"
+    },
+    "arquitectura empresarial": {"arquitectura empresarial"},
+    "transformacion digital": {"transformacion digital", "transformación digital"},
+    "gestion de proyectos": {"gestion de proyectos", "gestión de proyectos", "project management"},
+    "sistemas de informacion": {"sistemas de informacion", "sistemas de información"},
+}
+
+# Variantes ya normalizadas como el CV (vista nlp), en orden estable, en un solo escáner
+_FORMACION = GruposEquivalencia({
+    clave: sorted({normalizar_para_nlp(v.lower()) for v in variantes})
+    for clave, variantes in ACADEMIC_EQUIV.items()
+})
+
+
+# ----------------------------
+# PATRONES (CV)
+# ----------------------------
+_RE_ANOS_CV = re.compile(r"\b(\d{1,2})\s+anos\b")
+_RE_ANO_CALENDARIO = re.compile(r"\b(19\d{2}|20\d{2})\b")
+_RE_RANGO_FECHAS = re.compile(
+    r"\b(19\d{2}|20\d{2})\s*(?:-|–|a|al|hasta)\s*(19\d{2}|20\d{2}|actualidad|actual|presente|present|hoy)\b"
+)
+_RE_ANOS_O_EXPERIENCIA = re.compile(r"(\d+)\s*años|\bexperienci[ae]\b", re.IGNORECASE)
+
+
+# ----------------------------
+# HECHOS DEL CV
+# ----------------------------
+class HechosCV:
+    """
+    Hechos de un CV que consultan las reglas de requisitos.
+    Vista nlp:
+    - menciones_anios: tupla de X de cada "X años"
+    - anios_calendario: tupla de años YYYY (19xx / 20xx) en orden de aparición
+    - rangos_fechas: tupla de (inicio, fin | None si sigue vigente, (ini, fin) del tramo)
+    - ingles: nivel CEFR ("b2", "c1"...) o None
+    - sector(clave) / formacion(clave): tramo (ini, fin) de la primera evidencia o None;
+      se calculan la primera vez que se piden (formacion: todas las claves a la vez)
+    Vista nfkc (requisitos):
+    - anios_o_experiencia: "X años" o "experiencia"
+    """
+
+    __slots__ = (
+        "texto", "menciones_anios", "anios_calendario", "rangos_fechas", "ingles",
+        "anios_o_experiencia",
+        "_sectores", "_formacion",
+    )
+
+    def __init__(self, texto):
+        self.texto = TextoNormalizado(texto)
+        self.menciones_anios = ()
+        self.anios_calendario = ()
+        self.rangos_fechas = ()
+        self.ingles = None
+        self.anios_o_experiencia = False
+        self._sectores = {}
+        self._formacion = None
+
+    @property
+    def nlp(self) -> str:
+        return self.texto.nlp
+
+    def anios_estimados(self):
+        """
+        Años de experiencia estimados:
+            1) el mayor "X años" explícito;
+            2) si no, el tramo entre el primer y el último año calendario (hasta 60);
+            3) con un solo año calendario, hoy - año.
+        """
+        if self.menciones_anios:
+            return max(self.menciones_anios)
+        years = self.anios_calendario
+        if len(years) >= 2:
+            y_min, y_max = min(years), max(years)
+            # cap razonable para evitar “saltos” raros
+            if 0 < (y_max - y_min) <= 60:
+                return (y_max - y_min)
+        if len(years) == 1:
+            return max(0, datetime.now().year - years[0])
+        return None
+
+    def sector(self, clave: str):
+        if clave not in self._sectores:
+            rx = _RE_POR_SECTOR.get(clave)
+            m = rx.search(self.nlp) if rx is not None else None
+            self._sectores[clave] = m.span() if m else None
+        return self._sectores[clave]
+
+    def tiene_sector(self, clave: str) -> bool:
+        return self.sector(clave) is not None
+
+    def formacion(self, clave: str):
+        """Tramo de la primera variante de ACADEMIC_EQUIV[clave] presente en el CV (o None)."""
+        if self._formacion is None:
+            # todas las claves en una pasada del escáner
+            self._formacion = _FORMACION.tramos_en(self.nlp)
+        return self._formacion.get(clave)
+
+
+def extraer_hechos_cv(texto) -> HechosCV:
+    """Extrae los hechos del CV: un recorrido por la vista nlp y otro por la vista nfkc."""
+    h = HechosCV(texto)
+    if not h.texto:
+        return h
+
+    cv = h.nlp
+    h.menciones_anios = tuple(int(x) for x in _RE_ANOS_CV.findall(cv))
+    h.anios_calendario = tuple(int(y) for y in _RE_ANO_CALENDARIO.findall(cv))
+    h.rangos_fechas = tuple(
+        (int(m.group(1)), int(m.group(2)) if m.group(2).isdigit() else None, m.span())
+        for m in _RE_RANGO_FECHAS.finditer(cv)
+    )
+    h.ingles = _nivel_ingles_cv(cv)
+
+    cv_nfkc = h.texto.nfkc
+    h.anios_o_experiencia = _RE_ANOS_O_EXPERIENCIA.search(cv_nfkc) is not None
+    return h
+
+
+def _nivel_ingles_cv(cv: str):
+    # primero un segmento donde aparezcan "ingles/english" y un nivel
+    if _RE_INGLES.search(cv):
+        for seg in _RE_SEGMENTO.split(cv):
+            if _RE_INGLES.search(seg):
+                m = _RE_NIVEL_CEFR.search(seg)
+                if m:
+                    return m.group(1).lower()
+    # fallback global: un nivel suelto (menos confiable)
+    m = _RE_NIVEL_CEFR.search(cv)
+    return m.group(1).lower() if m else None
+
+
+# Caché por texto: el mismo CV se consulta contra varias ofertas y reglas
+HECHOS_CV_MAX = 8
+
+_HECHOS_CV = OrderedDict()
+_LOCK_CV = threading.Lock()
+
+
+def hechos_cv(texto) -> HechosCV:
+    """HechosCV de `texto`, extraídos una vez y reutilizados mientras sigan en caché."""
+    texto = texto or ""
+    with _LOCK_CV:
+        h = _HECHOS_CV.get(texto)
+        if h is not None:
+            _HECHOS_CV.move_to_end(texto)
+            return h
+    h = extraer_hechos_cv(texto)
+    with _LOCK_CV:
+        _HECHOS_CV[texto] = h
+        while len(_HECHOS_CV) > HECHOS_CV_MAX:
+            _HECHOS_CV.popitem(last=False)
+    return h
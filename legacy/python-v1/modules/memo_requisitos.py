@@ -0,0 +1,292 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# memo_requisitos.py - Caché de evaluaciones de requisitos (oferta + CV + versión de reglas/código)
+# ==========================
+# El mismo CV se evalúa una y otra vez contra la misma oferta (reanálisis desde el menú).
+# evaluate_requirements y detectar_requisitos_excluyentes_inteligente guardan aquí su
+# resultado con la clave (hash oferta, hash CV, versión de reglas, versión de código y
+# modelo): un acierto devuelve una copia sin repetir el barrido de regex y reglas.
+# - Nivel en memoria: LRU acotada (MEMO_MAX).
+# - Nivel en disco (opcional, activar_disco()): JSON acotado (DISCO_MAX) que sobrevive
+#   entre sesiones; escritura atómica como el snapshot de vocabulario.
+# Efectos: el aprendizaje (learn_requirement) que hizo la evaluación original se anota
+# y se repite en cada acierto, así requirements_learned.json cuenta igual que sin caché.
+import os
+import re
+import sys
+import json
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+FORMATO_MEMO = 1
+
+MEMO_MAX = 64
+DISCO_MAX = 256
+
+
+# --- Rutas amigables para ejecutable (PyInstaller) y desarrollo ---
+def _user_data_dir():
+    try:
+        if getattr(sys, 'frozen', False):
+            base = os.path.join(os.environ.get("APPDATA", os.path.expanduser("~")), "ATS-Advisor")
+            os.makedirs(base, exist_ok=True)
+            return base
+    except Exception:
+        pass
+    return os.path.dirname(__file__)
+
+MEMO_FILE = os.path.join(_user_data_dir(), "requisitos_memo.json")
+
+# Puntos de entrada de la evaluación: la versión de código cubre estos módulos y todo
+# lo que importan de modules/ (transitivamente), leído de las propias fuentes.
+_MODULOS_EVALUACION = ("requisitos.py", "analisis_basico.py", "memo_requisitos.py")
+_RE_IMPORT_MODULES = re.compile(
+    r"^[ \t]*from[ \t]+modules(?:\.(\w+))?[ \t]+import[ \t]+(\([^)]*\)|[^\n#]+)", re.M
+)
+
+_MEMO = OrderedDict()
+_LOCK = threading.Lock()
+_STATS = {"hits": 0, "hits_disco": 0, "misses": 0, "evictions": 0}
+_DISCO = {"activo": False, "entradas": None}
+_VERSION_CODIGO = []
+_ANOTACIONES = threading.local()
+
+
+# ----------------------------
+# CLAVE
+# ----------------------------
+def _hash_texto(texto) -> str:
+    return hashlib.sha1(str(texto or "").encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _importados(fuente: str):
+    """Nombres de archivo de los módulos de modules/ que importa una fuente."""
+    nombres = []
+    for m in _RE_IMPORT_MODULES.finditer(fuente):
+        if m.group(1):
+            nombres.append(m.group(1))
+        else:
+            for parte in m.group(2).strip("() \t\r\n").split(","):
+                parte = parte.split(" as ")[0].strip()
+                if parte.isidentifier():
+                    nombres.append(parte)
+    return [f"{n}.py" for n in nombres]
+
+
+def version_codigo() -> str:
+    """
+    Hash del código de evaluación: contenido de _MODULOS_EVALUACION y de los módulos que
+    importan, recorridos en orden (en el ejecutable, donde no hay fuentes, el tamaño y
+    fecha del propio ejecutable). Se calcula una vez.
+    """
+    if not _VERSION_CODIGO:
+        h = hashlib.sha1(f"formato:{FORMATO_MEMO}".encode("utf-8"))
+        base = os.path.dirname(__file__)
+        pendientes = list(_MODULOS_EVALUACION)
+        vistos = set()
+        while pendientes:
+            nombre = pendientes.pop(0)
+            if nombre in vistos:
+                continue
+            vistos.add(nombre)
+            h.update(f"|{nombre}:".encode("utf-8"))
+            try:
+                with open(os.path.join(base, nombre), "rb") as f:
+                    contenido = f.read()
+            except OSError:
+                h.update(b"<ausente>")
+                continue
+            h.update(contenido)
+            pendientes.extend(_importados(contenido.decode("utf-8", "replace")))
+        if getattr(sys, 'frozen', False):
+            try:
+                st = os.stat(sys.executable)
+                h.update(f"|exe:{st.st_size}:{st.st_mtime_ns}".encode("utf-8"))
+            except OSError:
+                pass
+        _VERSION_CODIGO.append(h.hexdigest())
+    return _VERSION_CODIGO[0]
+
+
+def _clave(nombre: str, texto_oferta, texto_cv, version: tuple) -> str:
+    partes = (nombre, _hash_texto(texto_oferta), _hash_texto(texto_cv)) + tuple(str(v) for v in version)
+    return hashlib.sha1("|".join(partes).encode("utf-8")).hexdigest()
+
+
+# ----------------------------
+# EFECTOS (aprendizaje)
+# ----------------------------
+def anotar(*efecto):
+    """Anota un efecto (p. ej. phrase, inc de learn_requirement) en las evaluaciones en curso."""
+    for lista in getattr(_ANOTACIONES, "pila", ()):
+        lista.append(list(efecto))
+
+
+# ----------------------------
+# CONSULTA
+# ----------------------------
+def memoizado(nombre: str, texto_oferta, texto_cv, version: tuple, calcular, repetir):
+    """
+    Resultado de calcular() para (nombre, oferta, CV, version), guardado en caché.
+    En un acierto se llama repetir(efectos) con lo anotado durante el cálculo original.
+    Siempre devuelve una copia: quien llama puede modificar el resultado.
+    """
+    clave = _clave(nombre, texto_oferta, texto_cv, version)
+
+    with _LOCK:
+        entrada = _MEMO.get(clave)
+        if entrada is not None:
+            _MEMO.move_to_end(clave)
+            _STATS["hits"] += 1
+    if entrada is None:
+        entrada = _leer_disco(clave)
+        if entrada is not None:
+            with _LOCK:
+                _STATS["hits_disco"] += 1
+                _guardar_memoria(clave, entrada)
+
+    if entrada is not None:
+        resultado, efectos = entrada
+        repetir(efectos)
+        return copy.deepcopy(resultado)
+
+    pila = getattr(_ANOTACIONES, "pila", None)
+    if pila is None:
+        pila = _ANOTACIONES.pila = []
+    efectos = []
+    pila.append(efectos)
+    try:
+        resultado = calcular()
+    finally:
+        pila.pop()
+
+    entrada = (copy.deepcopy(resultado), efectos)
+    with _LOCK:
+        _STATS["misses"] += 1
+        _guardar_memoria(clave, entrada)
+    _escribir_disco(clave, entrada)
+    return resultado
+
+
+def _guardar_memoria(clave, entrada):
+    _MEMO[clave] = entrada
+    _MEMO.move_to_end(clave)
+    while len(_MEMO) > MEMO_MAX:
+        _MEMO.popitem(last=False)
+        _STATS["evictions"] += 1
+
+
+def stats_memo() -> dict:
+    with _LOCK:
+        stats = dict(_STATS)
+        stats["tamano"] = len(_MEMO)
+        stats["disco"] = _DISCO["activo"]
+    consultas = stats["hits"] + stats["hits_disco"] + stats["misses"]
+    stats["hit_rate"] = round((stats["hits"] + stats["hits_disco"]) / consultas, 4) if consultas else 0.0
+    return stats
+
+
+def limpiar_memo(disco: bool = False):
+    """Vacía el nivel en memoria (y el archivo en disco si disco=True)."""
+    with _LOCK:
+        _MEMO.clear()
+        for k in _STATS:
+            _STATS[k] = 0
+        if disco:
+            _DISCO["entradas"] = None
+    if disco:
+        try:
+            os.remove(MEMO_FILE)
+        except OSError:
+            pass
+
+
+# ----------------------------
+# NIVEL EN DISCO (opcional)
+# ----------------------------
+def activar_disco(activo: bool = True):
+    """Activa (o desactiva) el nivel en disco: requisitos_memo.json junto a los datos de usuario."""
+    with _LOCK:
+        _DISCO["activo"] = bool(activo)
+
+
+def _entradas_disco():
+    # Se carga una vez; un archivo ilegible o de otro formato se ignora
+    if _DISCO["entradas"] is None:
+        entradas = OrderedDict()
+        try:
+            with open(MEMO_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("formato") == FORMATO_MEMO:
+                for clave, valor in (data.get("entradas") or {}).items():
+                    entradas[clave] = (valor["resultado"], valor["efectos"])
+        except Exception:
+            entradas = OrderedDict()
+        _DISCO["entradas"] = entradas
+    return _DISCO["entradas"]
+
+
+def _leer_disco(clave):
+    with _LOCK:
+        if not _DISCO["activo"]:
+            return None
+        entrada = _entradas_disco().get(clave)
+        return copy.deepcopy(entrada) if entrada is not None else None
+
+
+def _escribir_disco(clave, entrada):
+    """Escritura atómica (archivo temporal + replace). Un fallo de disco no es fatal."""
+    with _LOCK:
+        if not _DISCO["activo"]:
+            return
+        entradas = _entradas_disco()
+        entradas[clave] = entrada
+        entradas.move_to_end(clave)
+        while len(entradas) > DISCO_MAX:
+            entradas.popitem(last=False)
+        data = {
+            "formato": FORMATO_MEMO,
+            "entradas": {k: {"resultado": r, "efectos": e} for k, (r, e) in entradas.items()},
+        }
+        tmp = MEMO_FILE + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, MEMO_FILE)
+        except Exception:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
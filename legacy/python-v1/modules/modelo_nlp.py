@@ -0,0 +1,366 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# modelo_nlp.py - Registro único del modelo spaCy (compartido por todos los módulos)
+# ==========================
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+# ----------------------------
+# CADENA DE MODELOS (lg -> md -> sm)
+# ----------------------------
+MODELOS_ES = [
+    ("lg", "es_core_news_lg"),
+    ("md", "es_core_news_md"),
+    ("sm", "es_core_news_sm"),
+]
+
+_NLP = None
+_INFO = {}
+_ERROR = None
+_LOCK = threading.Lock()
+
+
+def _rss_pico_bytes():
+    """Pico de memoria residente del proceso (None si la plataforma no lo expone)."""
+    try:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reporta KB; macOS reporta bytes
+        return int(pico) if sys.platform == "darwin" else int(pico) * 1024
+    except Exception:
+        return None
+
+
+def _cargar_modelo(nombre):
+    """Intenta primero el import del paquete (PyInstaller) y luego spacy.load."""
+    try:
+        modulo = __import__(nombre)
+        return modulo.load()
+    except Exception:
+        import spacy
+        return spacy.load(nombre)
+
+
+def get_nlp(obligatorio: bool = True):
+    """
+    Devuelve el modelo spaCy del proceso, cargándolo una sola vez (lg -> md -> sm).
+    - obligatorio=True: si no hay ningún modelo instalado lanza RuntimeError.
+    - obligatorio=False: devuelve None (p. ej. para desactivar la comparación semántica).
+    """
+    global _NLP, _ERROR
+    if _NLP is not None:
+        return _NLP
+
+    with _LOCK:
+        if _NLP is None and _ERROR is None:
+            rss_antes = _rss_pico_bytes()
+            t0 = time.perf_counter()
+            ultimo_error = None
+            for nivel, nombre in MODELOS_ES:
+                try:
+                    modelo = _cargar_modelo(nombre)
+                except Exception as e:
+                    ultimo_error = e
+                    continue
+                rss_despues = _rss_pico_bytes()
+                _INFO.clear()
+                _INFO.update({
+                    "nivel": nivel,
+                    "modelo": nombre,
+                    "version": modelo.meta.get("version", ""),
+                    "segundos_carga": round(time.perf_counter() - t0, 3),
+                    "rss_delta_bytes": (
+                        rss_despues - rss_antes
+                        if rss_antes is not None and rss_despues is not None else None
+                    ),
+                })
+                if nivel != "lg":
+                    print(f"ℹ️ [modelo] Usando {nombre} (fallback).")
+                _NLP = modelo
+                break
+            if _NLP is None:
+                _ERROR = ultimo_error
+
+    if _NLP is None and obligatorio:
+        raise RuntimeError(
+            "No se encontró un modelo de spaCy. Instala en el entorno:\n"
+            "  python -m spacy download es_core_news_sm\n"
+            f"Detalle: {_ERROR}"
+        )
+    return _NLP
+
+
+def modelo_cargado() -> bool:
+    return _NLP is not None
+
+
+def nivel_modelo():
+    """'lg' | 'md' | 'sm' según el modelo activo; None si aún no se ha cargado."""
+    return _INFO.get("nivel")
+
+
+def firma_modelo() -> str:
+    """'nombre@versión' del modelo activo (lo carga si hace falta); útil como clave de caché."""
+    get_nlp()
+    return f"{_INFO.get('modelo', '')}@{_INFO.get('version', '')}"
+
+
+def _version_paquete(nombre):
+    """Versión instalada del paquete del modelo según sus metadatos (None si no está)."""
+    try:
+        from importlib import metadata
+        return metadata.version(nombre)
+    except Exception:
+        return None
+
+
+def firma_modelo_instalado() -> str:
+    """
+    'nombre@versión' del modelo que usa (o usará) el proceso, SIN forzar la carga:
+    - cargado: nombre del modelo activo
+    - sin cargar: primer paquete instalado de la cadena lg -> md -> sm
+    La versión sale solo de los metadatos del paquete, así la firma es la misma antes y
+    después de cargar. "" si no hay modelo disponible o no hay metadatos (ejecutable).
+    """
+    if _NLP is None and _ERROR is not None:
+        return ""
+    nombres = [_INFO.get("modelo", "")] if _NLP is not None else [n for _, n in MODELOS_ES]
+    for nombre in nombres:
+        version = _version_paquete(nombre)
+        if version is not None:
+            return f"{nombre}@{version}"
+    return ""
+
+
+def info_modelo() -> dict:
+    """
+    Resumen del modelo activo: nivel, nombre, versión, tiempo de carga y memoria.
+    - vectores_bytes: tamaño de la tabla de vectores estáticos (0 en 'sm').
+    - rss_delta_bytes: crecimiento del pico de RSS durante la carga (aproximado).
+    No fuerza la carga: si el modelo no está cargado devuelve {"cargado": False}.
+    """
+    if _NLP is None:
+        return {"cargado": False}
+    info = dict(_INFO)
+    info["cargado"] = True
+    info["componentes"] = list(_NLP.pipe_names)
+    try:
+        vectores = _NLP.vocab.vectors
+        info["vectores_forma"] = tuple(vectores.shape)
+        info["vectores_bytes"] = int(getattr(vectores.data, "nbytes", 0))
+    except Exception:
+        info["vectores_forma"] = (0, 0)
+        info["vectores_bytes"] = 0
+    info["memoria_bytes"] = max(info["vectores_bytes"], info.get("rss_delta_bytes") or 0)
+    return info
+
+
+# ----------------------------
+# PERFILES DE PROCESAMIENTO (componentes desactivados por llamada)
+# ----------------------------
+# - "lemas":    lemma_, pos_, is_alpha (sin parser ni NER)
+# - "vectores": solo tokenización + vectores estáticos (similitud)
+# - "chunks":   noun_chunks (necesita parser); sin NER
+# - "completo": pipeline entero
+PERFILES = {
+    "completo": (),
+    "chunks": ("ner",),
+    "lemas": ("parser", "ner"),
+    "vectores": None,
+}
+
+_DESACTIVAR = {}
+
+
+def _tiene_vectores(modelo) -> bool:
+    try:
+        return modelo.vocab.vectors.shape[0] > 0
+    except Exception:
+        return False
+
+
+def _componentes_desactivados(modelo, perfil: str) -> list:
+    if perfil not in PERFILES:
+        raise ValueError(f"Perfil spaCy desconocido: {perfil}")
+    if perfil not in _DESACTIVAR:
+        excluir = PERFILES[perfil]
+        if excluir is None:
+            # Sin vectores estáticos (modelo 'sm') la similitud sale del tensor de tok2vec
+            excluir = [c for c in modelo.pipe_names if c != "tok2vec"]
+        _DESACTIVAR[perfil] = [c for c in excluir if c in modelo.pipe_names]
+    return _DESACTIVAR[perfil]
+
+
+def _analizar(modelo, texto: str, perfil: str):
+    if perfil == "vectores" and _tiene_vectores(modelo):
+        return modelo.make_doc(texto)
+    return modelo(texto, disable=_componentes_desactivados(modelo, perfil))
+
+
+# ----------------------------
+# CACHÉ LRU DE DOCS (frases cortas repetidas)
+# ----------------------------
+# Clave: (texto tal como llega, ya normalizado por el llamador; perfil).
+# Los textos largos (CV/oferta completos) no se cachean aquí.
+CACHE_DOCS_MAX = 4096
+CACHE_DOCS_MAX_CHARS = 300
+
+# Un Doc de un perfil más completo sirve también para uno más ligero
+_PERFILES_COMPATIBLES = {
+    "vectores": ("vectores", "lemas", "chunks", "completo"),
+    "lemas": ("lemas", "chunks", "completo"),
+    "chunks": ("chunks", "completo"),
+    "completo": ("completo",),
+}
+
+_CACHE_DOCS = OrderedDict()
+_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0, "omitidos": 0}
+_CACHE_LOCK = threading.Lock()
+
+
+def _cache_buscar(texto: str, perfil: str):
+    with _CACHE_LOCK:
+        for p in _PERFILES_COMPATIBLES[perfil]:
+            doc = _CACHE_DOCS.get((texto, p))
+            if doc is not None:
+                _CACHE_DOCS.move_to_end((texto, p))
+                _CACHE_STATS["hits"] += 1
+                return doc
+        _CACHE_STATS["misses"] += 1
+    return None
+
+
+def _cache_guardar(texto: str, perfil: str, doc):
+    with _CACHE_LOCK:
+        _CACHE_DOCS[(texto, perfil)] = doc
+        _CACHE_DOCS.move_to_end((texto, perfil))
+        while len(_CACHE_DOCS) > CACHE_DOCS_MAX:
+            _CACHE_DOCS.popitem(last=False)
+            _CACHE_STATS["evictions"] += 1
+
+
+def _cacheable(texto) -> bool:
+    return isinstance(texto, str) and len(texto) <= CACHE_DOCS_MAX_CHARS
+
+
+def stats_cache_docs() -> dict:
+    with _CACHE_LOCK:
+        stats = dict(_CACHE_STATS)
+        stats["tamano"] = len(_CACHE_DOCS)
+    consultas = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / consultas, 4) if consultas else 0.0
+    return stats
+
+
+def limpiar_cache_docs():
+    with _CACHE_LOCK:
+        _CACHE_DOCS.clear()
+        for k in _CACHE_STATS:
+            _CACHE_STATS[k] = 0
+
+
+def procesar(texto: str, perfil: str = "completo"):
+    """
+    Analiza `texto` ejecutando solo los componentes que necesita el perfil.
+    Las frases cortas se sirven desde la caché LRU: cada frase distinta se analiza
+    una vez por proceso (y por perfil).
+    """
+    if perfil not in PERFILES:
+        raise ValueError(f"Perfil spaCy desconocido: {perfil}")
+    modelo = get_nlp()
+    if not _cacheable(texto):
+        with _CACHE_LOCK:
+            _CACHE_STATS["omitidos"] += 1
+        return _analizar(modelo, texto, perfil)
+
+    doc = _cache_buscar(texto, perfil)
+    if doc is None:
+        doc = _analizar(modelo, texto, perfil)
+        _cache_guardar(texto, perfil, doc)
+    return doc
+
+
+def procesar_lote(textos, perfil: str = "lemas", batch_size: int = 64):
+    """
+    Versión por lotes de procesar() (nlp.pipe); conserva el orden de entrada.
+    Solo los textos que no están en caché pasan por el pipeline.
+    """
+    if perfil not in PERFILES:
+        raise ValueError(f"Perfil spaCy desconocido: {perfil}")
+    modelo = get_nlp()
+    textos = list(textos)
+    docs = [None] * len(textos)
+    pendientes = []
+    for i, t in enumerate(textos):
+        if _cacheable(t):
+            doc = _cache_buscar(t, perfil)
+        else:
+            doc = None
+            with _CACHE_LOCK:
+                _CACHE_STATS["omitidos"] += 1
+        if doc is None:
+            pendientes.append(i)
+        else:
+            docs[i] = doc
+
+    if pendientes:
+        if perfil == "vectores" and _tiene_vectores(modelo):
+            nuevos = [modelo.make_doc(textos[i]) for i in pendientes]
+        else:
+            nuevos = modelo.pipe([textos[i] for i in pendientes],
+                                 disable=_componentes_desactivados(modelo, perfil),
+                                 batch_size=batch_size)
+        for i, doc in zip(pendientes, nuevos):
+            docs[i] = doc
+            if _cacheable(textos[i]):
+                _cache_guardar(textos[i], perfil, doc)
+    return docs
+
+
+class _ModeloPerezoso:
+    """
+    Se comporta como el objeto Language de spaCy (nlp(texto), nlp.pipe, nlp.vocab...)
+    pero no carga el modelo hasta el primer uso. Permite importar los módulos
+    sin pagar el coste de carga.
+    """
+
+    def __call__(self, *args, **kwargs):
+        return get_nlp()(*args, **kwargs)
+
+    def __getattr__(self, nombre):
+        return getattr(get_nlp(), nombre)
+
+
+NLP = _ModeloPerezoso()
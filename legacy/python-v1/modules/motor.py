@@ -0,0 +1,129 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# motor.py - Inicialización perezosa del motor (warm-up explícito + tiempos por paso)
+# ==========================
+import threading
+import time
+
+from modules import modelo_nlp
+
+
+class MotorATS:
+    """
+    Estado pesado del análisis (modelo, vocabulario, corpus de categorías, ...).
+    Cada paso se construye la primera vez que alguien lo necesita (asegurar)
+    o todos de una vez con warm_up(). Los módulos registran sus pasos al importarse;
+    registrar no ejecuta nada.
+    """
+
+    def __init__(self):
+        self._pasos = {}          # nombre -> función constructora (en orden de registro)
+        self._listos = set()
+        self._tiempos = {}        # nombre -> segundos de la última construcción
+        self._lock = threading.RLock()
+
+    def registrar_paso(self, nombre: str, constructor):
+        with self._lock:
+            self._pasos[nombre] = constructor
+
+    def _ejecutar(self, nombre: str):
+        constructor = self._pasos[nombre]
+        t0 = time.perf_counter()
+        constructor()
+        self._tiempos[nombre] = round(time.perf_counter() - t0, 3)
+        self._listos.add(nombre)
+
+    def asegurar(self, nombre: str):
+        """Construye el paso solo si aún no está listo (primer uso)."""
+        if nombre in self._listos:
+            return
+        with self._lock:
+            if nombre not in self._listos:
+                self._ejecutar(nombre)
+
+    def reconstruir(self, nombre: str):
+        """Vuelve a construir el paso aunque ya estuviera listo (p. ej. tras guardar skills)."""
+        with self._lock:
+            self._ejecutar(nombre)
+
+    def marcar_listo(self, nombre: str, segundos: float = 0.0):
+        """Registra como listo un paso construido por otra vía (p. ej. desde snapshot)."""
+        with self._lock:
+            self._tiempos[nombre] = round(segundos, 3)
+            self._listos.add(nombre)
+
+    def invalidar(self, nombre: str):
+        """Marca el paso como pendiente; se reconstruye en el próximo uso."""
+        with self._lock:
+            self._listos.discard(nombre)
+
+    def esta_listo(self, nombre: str = None) -> bool:
+        if nombre is not None:
+            return nombre in self._listos
+        return all(p in self._listos for p in self._pasos)
+
+    def warm_up(self, verbose: bool = False) -> dict:
+        """
+        Construye todos los pasos pendientes en orden de registro.
+        Devuelve {paso: segundos} (0.0 en los pasos que ya estaban listos).
+        """
+        tiempos = {}
+        with self._lock:
+            for nombre in list(self._pasos):
+                if nombre in self._listos:
+                    tiempos[nombre] = 0.0
+                    continue
+                self._ejecutar(nombre)
+                tiempos[nombre] = self._tiempos[nombre]
+                if verbose:
+                    print(f"⏱️ [motor] {nombre}: {tiempos[nombre]:.2f} s")
+        return tiempos
+
+    def tiempos(self) -> dict:
+        """Segundos empleados por cada paso ya construido (warm-up o primer uso)."""
+        return dict(self._tiempos)
+
+
+MOTOR = MotorATS()
+MOTOR.registrar_paso("modelo", modelo_nlp.get_nlp)
+
+
+def warm_up(verbose: bool = False) -> dict:
+    """Paga de una vez el coste de inicialización (modelo + estado derivado)."""
+    # Los módulos registran sus pasos al importarse
+    from modules import analisis_basico  # noqa: F401
+    return MOTOR.warm_up(verbose=verbose)
+
+
+def asegurar(nombre: str):
+    MOTOR.asegurar(nombre)
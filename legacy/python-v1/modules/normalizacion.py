@@ -0,0 +1,456 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# normalizacion.py - Limpieza/normalización de texto y vistas normalizadas de CV y oferta
+# ==========================
+import re
+import unicodedata
+from functools import cached_property
+
+
+# ----------------------------
+# TABLAS PRECALCULADAS (una pasada por carácter con str.translate)
+# ----------------------------
+_RE_NO_PALABRA = re.compile(r'[^\w\s]')
+
+
+class _TablaTraduccion(dict):
+    """
+    Tabla para str.translate que se rellena sola: cada code point se clasifica
+    (unicodedata / regex) la primera vez que aparece y desde entonces es una
+    consulta de diccionario en C.
+    """
+
+    def __init__(self, borrar):
+        super().__init__()
+        self._borrar = borrar
+
+    def __missing__(self, cp):
+        valor = None if self._borrar(chr(cp)) else cp
+        self[cp] = valor
+        return valor
+
+
+# Marcas combinantes (tildes, diéresis... tras NFD)
+_SIN_MARCAS = _TablaTraduccion(lambda c: unicodedata.category(c) == "Mn")
+# limpiar_texto: marcas combinantes + todo lo que no sea palabra ni espacio
+_LIMPIEZA = _TablaTraduccion(
+    lambda c: unicodedata.category(c) == "Mn" or _RE_NO_PALABRA.match(c) is not None
+)
+
+# Espacios y guiones invisibles → espacio / guion normal (todos fuera de ASCII).
+# Son raros en un CV: un replace solo cuando el carácter aparece es más rápido
+# que traducir carácter a carácter con una tabla.
+_INVISIBLES = (
+    ("\u00A0", " "),   # NBSP
+    ("\u2007", " "),   # Figure space
+    ("\u202F", " "),   # Narrow NBSP
+    ("\u200B", " "),   # Zero width space
+    ("\u200C", " "),
+    ("\u200D", " "),
+    ("\u2060", " "),
+    ("\u2011", "-"),   # Non-breaking hyphen → hyphen normal
+    ("\u2013", "-"),   # En dash → hyphen normal
+    ("\u2014", "-"),   # Em dash → hyphen normal
+)
+
+
+def quitar_marcas(texto: str) -> str:
+    """NFD sin marcas combinantes ('gestión' → 'gestion'); el texto ASCII se devuelve tal cual."""
+    texto = texto or ""
+    if texto.isascii():
+        return texto
+    return unicodedata.normalize("NFD", texto).translate(_SIN_MARCAS)
+
+
+# ----------------------------
+# LIMPIEZA / NORMALIZACIÓN
+# ----------------------------
+def limpiar_texto(texto):
+    """Minúsculas, sin tildes y sin signos (solo palabras y espacios)."""
+    texto = (texto or "").lower()
+    if not texto.isascii():
+        texto = unicodedata.normalize('NFD', texto)
+    return texto.translate(_LIMPIEZA)
+
+LIGATURES = {"\ufb01": "fi", "\ufb02": "fl"}
+
+
+# ----------------------------
+# TABLA ÚNICA DE ALIAS (declarativa; una regex compilada por ámbito)
+# ----------------------------
+# (patrón, reemplazo literal, ámbitos). Ámbitos:
+# - "nlp":    normalizar_para_nlp (todo el análisis)
+# - "local":  habilidades._normalize_local_alias (oferta en detectar_nuevas_habilidades)
+# - "siglas": analisis_basico.expandir_siglas (antes de categorizar_texto)
+# Cada ámbito se aplica en UNA pasada; el resultado es el mismo que aplicar sus reglas
+# una tras otra en este orden (ver `python -m modules.normalizacion`).
+REGLAS_ALIAS = [
+    (r"(?i)fin[\-\s]?tech", "fintech", ("nlp", "local")),
+    (r"(?i)ciber[\-\s]?seguridad", "ciberseguridad", ("nlp", "local")),
+    (r"(?i)big[\-\s]?data", "big data", ("nlp", "local")),
+    (r"(?i)machine[\-\s]?learning", "machine learning", ("nlp", "local")),
+    (r"(?i)\bservicio\s+sla\b", "cumplimiento de sla", ("nlp", "local")),
+    # (?!...): "acuerdos de servicio sla" lo resuelve antes la regla de "servicio sla"
+    (r"(?i)\bacuerdos?\s+de\s+servicio\b(?!\s+sla\b)", "cumplimiento de sla", ("nlp", "local")),
+    (r"(?i)\bproject\s+management\b", "gestión de proyectos", ("nlp",)),
+    (r"(?i)\bagile\b", "metodologías ágiles", ("nlp",)),
+    # variantes comunes con comas y 'y'
+    (r"(?i)\btic\s*,\s*tac\s*y\s*tep\b", "tic tac tep", ("siglas",)),
+    (r"(?i)\btic\s*,\s*tac\s*,\s*tep\b", "tic tac tep", ("siglas",)),
+    (r"(?i)\btic\s+y\s+tac\s+y\s+tep\b", "tic tac tep", ("siglas",)),
+]
+
+AMBITOS_ALIAS = ("nlp", "local", "siglas")
+
+
+def _validar_reglas_alias(reglas):
+    """Valida la tabla al importar: un error aquí es un error de la tabla, no del texto."""
+    vistos = set()
+    for regla in reglas:
+        if len(regla) != 3:
+            raise ValueError(f"Regla de alias mal formada: {regla!r}")
+        patron, repl, ambitos = regla
+        try:
+            compilado = re.compile(patron)
+        except re.error as e:
+            raise ValueError(f"Regla de alias inválida {patron!r}: {e}") from e
+        if compilado.match(""):
+            raise ValueError(f"Regla de alias que casa con texto vacío: {patron!r}")
+        if not isinstance(repl, str) or "\\" in repl:
+            raise ValueError(f"Reemplazo de alias no literal en {patron!r}: {repl!r}")
+        if not ambitos or any(a not in AMBITOS_ALIAS for a in ambitos):
+            raise ValueError(f"Ámbito de alias desconocido en {patron!r}: {ambitos!r}")
+        if patron in vistos:
+            raise ValueError(f"Regla de alias duplicada: {patron!r}")
+        vistos.add(patron)
+
+
+def _compilar_alias(tabla):
+    """
+    Une todos los alias en una sola regex (una alternativa con grupo por alias) y
+    devuelve (regex, {índice de grupo: reemplazo}). Un solo recorrido del texto en
+    lugar de un re.sub por alias.
+    Si todos los alias empiezan por letra, se antepone un lookahead con esas
+    letras para que el motor descarte rápido las posiciones que no pueden casar.
+    """
+    partes, reemplazos, iniciales = [], {}, set()
+    grupo = 1
+    for patron, repl in tabla:
+        cuerpo = patron[4:] if patron.startswith("(?i)") else patron
+        flags = "i" if patron.startswith("(?i)") else "-i"
+        partes.append(f"((?{flags}:{cuerpo}))")
+        reemplazos[grupo] = repl
+        grupo += 1 + re.compile(cuerpo).groups
+        inicio = cuerpo[2:] if cuerpo.startswith(r"\b") else cuerpo
+        iniciales.add(inicio[:1].lower() if inicio[:1].isalpha() and flags == "i" else None)
+    prefijo = ""
+    if iniciales and None not in iniciales:
+        prefijo = "(?i:(?=[" + "".join(sorted(iniciales)) + "]))"
+    return re.compile(prefijo + "(?:" + "|".join(partes) + ")"), reemplazos
+
+
+def reglas_alias(ambito: str) -> list:
+    """[(patrón, reemplazo)] de un ámbito, en el orden de la tabla."""
+    return [(p, r) for p, r, ambitos in REGLAS_ALIAS if ambito in ambitos]
+
+
+_validar_reglas_alias(REGLAS_ALIAS)
+_ALIAS_POR_AMBITO = {a: _compilar_alias(reglas_alias(a)) for a in AMBITOS_ALIAS}
+
+# Compatibilidad: lista de alias de normalizar_para_nlp
+ALIAS_REGEX = reglas_alias("nlp")
+
+# Atajo para el camino caliente (normalizar_para_nlp)
+_ALIAS_NLP, _ALIAS_NLP_REEMPLAZOS = _ALIAS_POR_AMBITO["nlp"]
+
+
+def _reemplazo_alias_nlp(m):
+    return _ALIAS_NLP_REEMPLAZOS[m.lastindex]
+
+
+def sustituir_alias(texto: str, ambito: str = "nlp") -> str:
+    """Aplica los alias de `ambito` en una sola pasada."""
+    try:
+        regex, reemplazos = _ALIAS_POR_AMBITO[ambito]
+    except KeyError:
+        raise ValueError(f"Ámbito de alias desconocido: {ambito}") from None
+    return regex.sub(lambda m: reemplazos[m.lastindex], texto or "")
+
+
+def normalizar_para_nlp(texto: str) -> str:
+    """
+    Normaliza texto para análisis:
+    - NFKC (caracteres “raros” → normales)
+    - Sustituye NBSP/guiones suaves/zero-width por espacio
+    - Colapsa múltiple espacio
+    - Aplica alias (fin-tech → fintech, etc.)
+    """
+    texto = texto or ""
+    # Normalización de compatibilidad (acentos/ligaduras invisibles coherentes)
+    texto = unicodedata.normalize("NFKC", texto)
+
+    # Espacios y guiones invisibles → espacio normal (solo si el texto no es ASCII)
+    if not texto.isascii():
+        for origen, destino in _INVISIBLES:
+            if origen in texto:
+                texto = texto.replace(origen, destino)
+
+    # Slashes pegados → separar
+    texto = texto.replace("/", " / ")
+
+    # Aplicar alias específicos (todos en una sola pasada)
+    texto = _ALIAS_NLP.sub(_reemplazo_alias_nlp, texto)
+
+    # Colapsar múltiple espacio (split() usa la misma definición de espacio que \s)
+    return " ".join(texto.split())
+
+
+# ----------------------------
+# TEXTO NORMALIZADO (vistas perezosas de CV / oferta)
+# ----------------------------
+class TextoNormalizado(str):
+    """
+    Texto completo de un CV o de una oferta que guarda sus vistas normalizadas.
+    Cada vista se calcula la primera vez que se pide y se reutiliza después, así un
+    CV largo se normaliza un número constante de veces por análisis.
+    Es un str: cualquier función que reciba texto lo sigue aceptando tal cual.
+
+    Vistas:
+    - minusculas:     texto.lower()
+    - nlp:            normalizar_para_nlp(texto.lower())
+    - plano:          limpiar_texto(normalizar_para_nlp(texto.lower()))  (sin tildes ni signos)
+    - plano_literal:  limpiar_texto(texto)  (sin alias ni normalización NLP)
+    - nfkc:           NFKC(texto).lower()  (vista de requisitos)
+    - lineas:         texto.splitlines()
+    Otras normalizaciones propias de un módulo: derivada(clave, funcion).
+    """
+
+    def __new__(cls, texto=""):
+        if isinstance(texto, TextoNormalizado):
+            return texto
+        return super().__new__(cls, texto or "")
+
+    @cached_property
+    def minusculas(self) -> str:
+        return str.lower(self)
+
+    @cached_property
+    def nlp(self) -> str:
+        return normalizar_para_nlp(self.minusculas)
+
+    @cached_property
+    def plano(self) -> str:
+        return limpiar_texto(self.nlp)
+
+    @cached_property
+    def plano_literal(self) -> str:
+        return limpiar_texto(self.minusculas)
+
+    @cached_property
+    def nfkc(self) -> str:
+        return unicodedata.normalize("NFKC", str(self)).lower()
+
+    @cached_property
+    def lineas(self) -> list:
+        return str.splitlines(self)
+
+    def derivada(self, clave: str, funcion):
+        """Vista adicional funcion(texto), calculada una sola vez por clave."""
+        vistas = self.__dict__.setdefault("_derivadas", {})
+        if clave not in vistas:
+            vistas[clave] = funcion(str(self))
+        return vistas[clave]
+
+
+# Accesos a las vistas: aceptan str o TextoNormalizado (con str se calculan al vuelo)
+def vista_minusculas(texto) -> str:
+    if isinstance(texto, TextoNormalizado):
+        return texto.minusculas
+    return (texto or "").lower()
+
+def vista_nlp(texto) -> str:
+    if isinstance(texto, TextoNormalizado):
+        return texto.nlp
+    return normalizar_para_nlp((texto or "").lower())
+
+def vista_plana(texto) -> str:
+    if isinstance(texto, TextoNormalizado):
+        return texto.plano
+    return limpiar_texto(normalizar_para_nlp((texto or "").lower()))
+
+def vista_plana_literal(texto) -> str:
+    if isinstance(texto, TextoNormalizado):
+        return texto.plano_literal
+    return limpiar_texto((texto or "").lower())
+
+def vista_nfkc(texto) -> str:
+    if isinstance(texto, TextoNormalizado):
+        return texto.nfkc
+    return unicodedata.normalize("NFKC", texto or "").lower()
+
+def vista_lineas(texto) -> list:
+    if isinstance(texto, TextoNormalizado):
+        return texto.lineas
+    return (texto or "").splitlines()
+
+def vista_derivada(texto, clave: str, funcion):
+    if isinstance(texto, TextoNormalizado):
+        return texto.derivada(clave, funcion)
+    return funcion(texto)
+
+
+# ----------------------------
+# VERIFICACIÓN Y MICRO-BENCHMARK:  python -m modules.normalizacion
+# ----------------------------
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Implementaciones anteriores (un .replace por carácter, un re.sub por alias,
+    # unicodedata.category por carácter): referencia de equivalencia y de velocidad
+    _ALIAS_REGEX_SECUENCIAL = [
+        (r"(?i)fin[\-\s]?tech", "fintech"),
+        (r"(?i)ciber[\-\s]?seguridad", "ciberseguridad"),
+        (r"(?i)big[\-\s]?data", "big data"),
+        (r"(?i)machine[\-\s]?learning", "machine learning"),
+        (r"(?i)\bservicio\s+sla\b", "cumplimiento de sla"),
+        (r"(?i)\bacuerdos?\s+de\s+servicio\b", "cumplimiento de sla"),
+        (r"(?i)\bproject\s+management\b", "gestión de proyectos"),
+        (r"(?i)\bagile\b", "metodologías ágiles"),
+    ]
+    # habilidades._normalize_local_alias y analisis_basico.expandir_siglas (antes de la tabla única)
+    _ALIAS_LOCAL_SECUENCIAL = _ALIAS_REGEX_SECUENCIAL[:6]
+    _SIGLAS_SECUENCIAL = [
+        (r"(?i)\btic\s*,\s*tac\s*y\s*tep\b", "tic tac tep"),
+        (r"(?i)\btic\s*,\s*tac\s*,\s*tep\b", "tic tac tep"),
+        (r"(?i)\btic\s+y\s+tac\s+y\s+tep\b", "tic tac tep"),
+    ]
+
+    def _alias_secuencial(tabla, texto):
+        for patron, repl in tabla:
+            texto = re.sub(patron, repl, texto)
+        return texto
+
+    def _alias_local_ref(texto):
+        return _alias_secuencial(_ALIAS_LOCAL_SECUENCIAL, texto)
+
+    def _siglas_ref(texto):
+        return _alias_secuencial(_SIGLAS_SECUENCIAL, texto)
+
+    def alias_local(texto):
+        return sustituir_alias(texto, "local")
+
+    def alias_siglas(texto):
+        return sustituir_alias(texto, "siglas")
+
+    def _limpiar_texto_ref(texto):
+        texto = (texto or "").lower()
+        texto = ''.join(c for c in unicodedata.normalize('NFD', texto)
+                        if unicodedata.category(c) != 'Mn')
+        return re.sub(r'[^\w\s]', '', texto)
+
+    def _quitar_marcas_ref(texto):
+        if not texto:
+            return ""
+        return "".join(c for c in unicodedata.normalize("NFD", texto)
+                       if unicodedata.category(c) != "Mn")
+
+    def _normalizar_para_nlp_ref(texto):
+        texto = unicodedata.normalize("NFKC", texto or "")
+        for origen, destino in (("\u00A0", " "), ("\u2007", " "), ("\u202F", " "),
+                                ("\u200B", " "), ("\u200C", " "), ("\u200D", " "),
+                                ("\u2060", " "), ("\u2011", "-"), ("\u2013", "-"),
+                                ("\u2014", "-")):
+            texto = texto.replace(origen, destino)
+        texto = texto.replace("/", " / ")
+        texto = _alias_secuencial(_ALIAS_REGEX_SECUENCIAL, texto)
+        return re.sub(r"\s+", " ", texto).strip()
+
+    # Corpus aleatorio: palabras, alias (con mayúsculas/guiones/saltos), signos,
+    # tildes compuestas y descompuestas, espacios invisibles, compatibilidad Unicode
+    _PIEZAS = [
+        "gestión", "análisis", "año", "pingüino", "niño", "CAFÉ", "e\u0301xito", "n\u0303",
+        "fin", "tech", "Fin-Tech", "fintech", "ciber", "seguridad", "Ciber Seguridad",
+        "big", "data", "BigData", "machine", "learning", "Machine-Learning",
+        "servicio", "sla", "SLA", "servicio sla", "acuerdos de servicio", "acuerdo de servicio sla",
+        "acuerdos de servicio slas", "project", "management", "Project Management",
+        "agile", "Agile", "agiles", "agile/scrum", "ſervicio", "Kgb", "İstanbul", "straße",
+        "ﬁnanzas", "ＡＢＣ", "\u2460", "x\u00B2", "C++", "C#", "node.js", "e-mail",
+        "\u00A0", "\u2007", "\u202F", "\u200B", "\u200C", "\u200D", "\u2060", "\u2011",
+        "\u2013", "\u2014", "\x1c", "\x85", "\u2028", "\u3000", "/", "//", " ", "  ", "\n", "\t", "\r\n", ",", ".", ":", ";", "(", ")",
+        "\u2022", "-", "_", "'", "\"", "¿", "?", "¡", "!", "%", "$", "2024", "3+", "\U0001F600", "\u2713",
+        "tic", "TAC", "tep", "y", "tic, tac y tep", "TIC , TAC , TEP", "tic y tac y tep", "tic,tac,",
+    ]
+
+    def _texto_aleatorio(rng):
+        return "".join(rng.choice(_PIEZAS) + rng.choice(["", " ", " ", "\n"])
+                       for _ in range(rng.randint(0, 60)))
+
+    rng = random.Random(2026)
+    casos = [_texto_aleatorio(rng) for _ in range(20000)]
+    pares = ((normalizar_para_nlp, _normalizar_para_nlp_ref),
+             (limpiar_texto, _limpiar_texto_ref),
+             (quitar_marcas, _quitar_marcas_ref),
+             (alias_local, _alias_local_ref),
+             (alias_siglas, _siglas_ref))
+    fallos = 0
+    for texto in casos:
+        for nueva, ref in pares:
+            if nueva(texto) != ref(texto):
+                fallos += 1
+                if fallos <= 5:
+                    print(f"\u274C {nueva.__name__}: {texto!r}")
+    print(f"Equivalencia: {len(casos)} textos aleatorios x {len(pares)} funciones, {fallos} diferencias.")
+
+    # Micro-benchmark: texto tipo CV (mayoritariamente ASCII con tildes) y corpus aleatorio
+    _CV = ("Gerente de proyectos con más de 10 años de experiencia en Fin-Tech, "
+           "ciber seguridad y Big Data. Gestión de portafolio, metodologías Agile/Scrum, "
+           "acuerdos de servicio (SLA) y Project Management.\u00A0Inglés B2. "
+           "Recursos TIC, TAC y TEP.\n") * 2000
+    _ALEATORIO = "".join(casos[:3000])
+
+    def _mb_por_segundo(funcion, texto, repeticiones=3):
+        mejor = None
+        for _ in range(repeticiones):
+            t0 = time.perf_counter()
+            funcion(texto)
+            dt = time.perf_counter() - t0
+            mejor = dt if mejor is None else min(mejor, dt)
+        return len(texto.encode("utf-8")) / mejor / 1e6
+
+    print("\nThroughput (MB/s)             antes     después")
+    for nombre, texto in (("CV", _CV), ("aleatorio", _ALEATORIO)):
+        for nueva, ref in pares:
+            antes = _mb_por_segundo(ref, texto)
+            despues = _mb_por_segundo(nueva, texto)
+            print(f"{nueva.__name__:<20} {nombre:<9} {antes:8.1f}  {despues:8.1f}")
@@ -31,34 +31,21 @@
 # ==========================
 # requisitos.py - Motor genérico de requisitos (reglas en JSON)  (v2: canonicalización de bullets)
 # ==========================
-import os, json, re, unicodedata
+import os, json, re, unicodedata, hashlib, threading
 from typing import Optional, Dict, List
-import spacy  # ✅ nuevo
+from modules import modelo_nlp, memo_requisitos
+from modules.normalizacion import vista_nfkc
+from modules.hechos import hechos_cv
+from modules.estructura_oferta import estructura_de
+from modules.frases import EscanerSubcadenas
 
-# --- Loader perezoso de spaCy para este módulo (requisitos) ---
-_REQ_NLP = None
 
 def _get_req_nlp():
     """
-    Carga un modelo de spaCy en español (lg/md/sm) solo una vez, y lo reutiliza.
-    Si falla todo, devuelve None y la comparación semántica se desactiva.
+    Devuelve el modelo spaCy compartido del proceso (registro en modelo_nlp).
+    Si no hay ningún modelo instalado devuelve None y la comparación semántica se desactiva.
     """
-    global _REQ_NLP
-    if _REQ_NLP is not None:
-        return _REQ_NLP
-
-    try:
-        _REQ_NLP = spacy.load("es_core_news_lg")
-    except Exception:
-        try:
-            _REQ_NLP = spacy.load("es_core_news_md")
-        except Exception:
-            try:
-                _REQ_NLP = spacy.load("es_core_news_sm")
-            except Exception:
-                _REQ_NLP = None
-
-    return _REQ_NLP
+    return modelo_nlp.get_nlp(obligatorio=False)
 
 
 # --- soporte paths para EXE (PyInstaller) + AppData ---
@@ -452,6 +439,200 @@ def _cv_mentions_domain(cv_low: str, domain_label: str) -> bool:
     anchors = DOMAIN_SYNONYMS.get(domain_label, [])
     return any(a in cv_low for a in anchors)
 
+# Dominio de la línea con experience_regex: mapeo de palabras clave → etiqueta amigable
+DOMAIN_MAP = [
+    (re.compile(pat, flags=re.IGNORECASE), label) for pat, label in (
+        (r"(servicios\s+compartidos|shared\s+services|ssc)", "servicios compartidos (ssc)"),
+        (r"(mercadeo|marketing)", "mercadeo/marketing"),
+        (r"(comercial|ventas)", "área comercial/ventas"),
+        (r"(log[ií]stic[ao]|supply\s+chain|cadena\s+de\s+suministro)", "logística/cadena de suministro"),
+        (r"(sector\s+salud|hospital|cl[ií]nica|ips)", "sector salud"),
+        (r"(financier[oa]|banca|entidad\s+financiera)", "sector financiero"),
+    )
+]
+
+
+# ---- Hotfixes declarativos (reglas "domain_years" y "credential_required") ----
+# Se evalúan antes de las reglas con trigger_any, en el orden del JSON; las de
+# "phase": "post_experience" van después del chequeo de experience_regex.
+#
+# domain_years: "mínimo X años en <dominio>"
+#   offer_regex (opcional): la oferta debe mencionar el dominio
+#   years_regex: años exigidos en group(1); cv_regex + cv_years_regex: evidencia en el CV
+#   role_regex / role_message (opcional): sin años, un cargo explícito del dominio también exige evidencia
+#   message (opcional): plantilla con {years} y {label}
+# credential_required: profesión / título / licencia
+#   scope_regex (opcional): la oferta se mira solo en su group(1); scope_source "raw" lo busca
+#   en el texto tal cual; scope_fallback usa toda la oferta si no se aísla
+#   offer_any / offer_regex: alguno debe aparecer; require_any: además, alguno de estos
+#   cv_any / cv_regex: evidencia en el CV; once: no repetir el label si ya está en no_cumple
+_YEARS_REGEX_DOMINIO = r"(?:m[ií]n(?:imo)?|al\s+menos|experiencia\s+de)\s*(\d+)\s*a[nñ]os"
+_CV_YEARS_REGEX_DOMINIO = r"(\d+)\s*a[nñ]os|\bexperienci[ae]\b"
+_ENFERMERIA_REGEX = r"\benfermer[oa]s?\b|\benfermer[ií]a\b"
+_TITULO_MERCADEO = "Título requerido: Profesional en Mercadeo/Administración/Economía/Ingeniería Industrial (o afines)"
+_CARRERAS_MERCADEO_CV = [
+    "mercadeo", "marketing",
+    "administración", "administracion",
+    "economía", "economia",
+    "ingeniería industrial", "ingenieria industrial"
+]
+_CARRERAS_MERCADEO_OFERTA = [
+    "profesional en mercadeo", "profesional en marketing",
+    "profesional en administración", "profesional en administracion",
+    "profesional en economía", "profesional en economia",
+    "profesional en ingeniería industrial", "profesional en ingenieria industrial",
+]
+
+HOTFIX_RULES = [
+    # Ofertas que redactan la experiencia mínima en una sola frase: "Mínimo X años ... mercadeo"
+    {
+        "id": "hotfix_exp_mercadeo",
+        "label": "mercadeo/marketing",
+        "type": "domain_years",
+        "years_regex": r"(?:mínimo|minimo)\s*(\d+)\s*años[^.\n]*\b(mercadeo|marketing)\b",
+        "cv_regex": [r"\b(mercadeo|marketing)\b"],
+        "cv_years_regex": r"(\d+)\s*años|\bexperienci[ae]\b"
+    },
+    # "Nivel Educativo: Profesional en Mercadeo/Administración/Economía/Ing. Industrial"
+    {
+        "id": "hotfix_nivel_educativo_mercadeo",
+        "label": _TITULO_MERCADEO,
+        "type": "credential_required",
+        "scope_regex": r"nivel\s+educativo\s*:\s*([^.\n]+)",
+        "offer_any": _CARRERAS_MERCADEO_OFERTA + ["carreras afines"],
+        "cv_any": _CARRERAS_MERCADEO_CV
+    },
+    # Cargo/rol de enfermería en la oferta
+    {
+        "id": "hotfix_enfermeria",
+        "label": "Título/Licencia en Enfermería requerido",
+        "type": "credential_required",
+        "offer_any": [
+            "enfermera jefe", "enfermera líder", "enfermera lider", "enfermera coordinadora",
+            "enfermera", "enfermero", "enfermería", "enfermeria",
+            "profesional de enfermería", "profesional de enfermeria"
+        ],
+        "offer_regex": [_ENFERMERIA_REGEX],
+        "cv_any": [
+            "enfermera", "enfermero", "enfermería", "enfermeria",
+            "licenciatura en enfermería", "licenciatura en enfermeria",
+            "colegio de enfermería", "colegio de enfermeria",
+            "rn "  # Registered Nurse (si aparece en CV importado)
+        ],
+        "cv_regex": [_ENFERMERIA_REGEX]
+    },
+    # "Enfermera Jefe con posgrado en Auditoría en Salud / Salud Pública / Epidemiología"
+    {
+        "id": "hotfix_enfermeria_posgrado_salud",
+        "label": "Título/Licencia en Enfermería requerido",
+        "type": "credential_required",
+        "scope_regex": r"requerimientos\s*([\s\S]+?)\n\n",
+        "scope_source": "raw",
+        "scope_fallback": True,
+        "offer_any": ["enfermera"],
+        "offer_regex": [r"\benfermer[oa]\b"],
+        "require_any": [
+            "auditoría en salud", "auditoria en salud",
+            "salud pública", "salud publica",
+            "epidemiología", "epidemiologia"
+        ],
+        "cv_any": [
+            "licenciatura en enfermería", "licenciatura en enfermeria",
+            "colegio de enfermería", "colegio de enfermeria", " rn "
+        ],
+        "cv_regex": [_ENFERMERIA_REGEX],
+        "once": True
+    },
+    # Dominios con experiencia mínima (Comercial, RRHH, Auditoría, Logística/SC, Analítica/BI/Datos)
+    {
+        "id": "hotfix_exp_comercial",
+        "label": "área comercial/ventas",
+        "type": "domain_years",
+        "offer_regex": [
+            r"\b(gerente|director|jefe)\s+comercial\b", r"\bcomercial(es)?\b", r"\bventas?\b",
+            r"\bt[eé]cnicas\s+de\s+venta\b", r"\bventa\s+consultiva\b", r"\bpipeline\b", r"\bembudo\b"
+        ],
+        "years_regex": _YEARS_REGEX_DOMINIO,
+        "cv_regex": [
+            r"\bcomercial(es)?\b", r"\bventas?\b", r"\bventa\s+consultiva\b", r"\bcrm\b",
+            r"\bpipeline\b", r"\bembudo\b", r"\bforecast\b", r"\bcuota(s)?\b"
+        ],
+        "cv_years_regex": _CV_YEARS_REGEX_DOMINIO,
+        # sin años: un cargo fuerte (Gerente/Director/Jefe Comercial) sin evidencias también excluye
+        "role_regex": r"\b(gerente|director|jefe)\s+comercial\b",
+        "role_message": "Experiencia requerida en área comercial/ventas no evidenciada"
+    },
+    {
+        "id": "hotfix_exp_rrhh",
+        "label": "recursos humanos",
+        "type": "domain_years",
+        "offer_regex": [
+            r"\brecursos\s+humanos\b", r"\brrhh\b", r"\btalento\s+humano\b",
+            r"\bgesti[oó]n\s+humana\b", r"\bselecci[oó]n\b", r"\breclutamiento\b"
+        ],
+        "years_regex": _YEARS_REGEX_DOMINIO,
+        "cv_regex": [
+            r"\brecursos\s+humanos\b", r"\brrhh\b", r"\btalento\s+humano\b",
+            r"\bselecci[oó]n\b", r"\breclutamiento\b", r"\bgesti[oó]n\s+humana\b"
+        ],
+        "cv_years_regex": _CV_YEARS_REGEX_DOMINIO
+    },
+    {
+        "id": "hotfix_exp_auditoria",
+        "label": "auditoría",
+        "type": "domain_years",
+        "offer_regex": [r"\bauditor[ií]a\b", r"\bauditor(es)?\b", r"\baudit\b"],
+        "years_regex": _YEARS_REGEX_DOMINIO,
+        "cv_regex": [
+            r"\bauditor[ií]a\b", r"\bauditor(es)?\b", r"\bcontrol\s+interno\b",
+            r"\briesgos?\b", r"\bniif\b", r"\bifrs\b"
+        ],
+        "cv_years_regex": _CV_YEARS_REGEX_DOMINIO
+    },
+    {
+        "id": "hotfix_exp_logistica",
+        "label": "logística/cadena de suministro",
+        "type": "domain_years",
+        "offer_regex": [
+            r"\blog[ií]stic[ao]\b", r"\bsupply\s*chain\b", r"\bcadena\s+de\s+suministro\b",
+            r"\balmac[eé]n\b", r"\binventari[oa]s\b", r"\bdistribuci[oó]n\b",
+            r"\bcentros?\s+de\s+distribuci[oó]n\b"
+        ],
+        "years_regex": _YEARS_REGEX_DOMINIO,
+        "cv_regex": [
+            r"\blog[ií]stic[ao]\b", r"\bsupply\s*chain\b", r"\bcadena\s+de\s+suministro\b",
+            r"\bwms\b", r"\btms\b", r"\binventari[oa]s\b", r"\bdistribuci[oó]n\b"
+        ],
+        "cv_years_regex": _CV_YEARS_REGEX_DOMINIO
+    },
+    {
+        "id": "hotfix_exp_analitica",
+        "label": "analítica/BI/datos",
+        "type": "domain_years",
+        "offer_regex": [
+            r"\banal[ií]tic[ao]\b", r"\banalytics\b", r"\bbusiness\s+intelligence\b", r"\bbi\b",
+            r"\bdatos\b", r"\bdata\b", r"\bpower\s*bi\b", r"\btableau\b", r"\blooker\b", r"\betl\b"
+        ],
+        "years_regex": _YEARS_REGEX_DOMINIO,
+        "cv_regex": [
+            r"\banal[ií]tic[ao]\b", r"\banalytics\b", r"\bbusiness\s+intelligence\b", r"\bbi\b",
+            r"\bdatos\b", r"\bdata\b", r"\bsql\b", r"\bpython\b", r"\bpower\s*bi\b", r"\btableau\b",
+            r"\blooker\b", r"\betl\b"
+        ],
+        "cv_years_regex": _CV_YEARS_REGEX_DOMINIO
+    },
+    # "Profesional en Mercadeo/Administración/Economía/Ing. Industrial" en cualquier parte de la oferta
+    {
+        "id": "hotfix_titulo_mercadeo",
+        "label": _TITULO_MERCADEO,
+        "type": "credential_required",
+        "phase": "post_experience",
+        "offer_any": _CARRERAS_MERCADEO_OFERTA,
+        "cv_any": _CARRERAS_MERCADEO_CV
+    },
+]
+HOTFIX_TYPES = {"domain_years", "credential_required"}
+
 
 def load_rules():
     data = _load_json(RULES_FILE, DEFAULT_RULES)
@@ -830,6 +1011,14 @@ def load_rules():
         pass
 
 
+    # --- PATCH I: hotfixes declarativos (mercadeo, nivel educativo, enfermería, dominios, título) ---
+    try:
+        for hotfix in HOTFIX_RULES:
+            _ensure_rule(dict(hotfix))
+    except Exception:
+        pass
+
+
         # --- PATCH LÓGICO: NIIF / IFRS solo si la oferta lo pide explícitamente ---
     try:
         for r in rules:
@@ -850,8 +1039,11 @@ def load_rules():
 
 def save_rules(data):
     _save_json(RULES_FILE, data)
+    limpiar_cache_reglas()
 
 def learn_requirement(phrase: str, inc: int = 1):
+    # anotado para repetirlo cuando la evaluación salga de memo_requisitos
+    memo_requisitos.anotar(phrase, inc)
     phrase = _norm(phrase)
     if not phrase or len(phrase) < 3:
         return
@@ -859,6 +1051,295 @@ def learn_requirement(phrase: str, inc: int = 1):
     learned[phrase] = int(learned.get(phrase, 0)) + int(inc)
     _save_json(LEARNED_FILE, learned)
 
+# ---------------- reglas compiladas (caché) ----------------
+class ReglaCompilada:
+    """
+    Una regla de requirements_rules.json lista para evaluar: términos ya pasados por
+    NFKC + lower y level_regex compilada. `regla` es el dict original (respaldo semántico).
+    """
+
+    __slots__ = ("regla", "tipo", "label", "trig", "trig_buscar", "cv_buscar",
+                 "require_buscar", "level_regex", "level_synonyms")
+
+    def __init__(self, regla: dict):
+        self.regla = regla
+        self.tipo = regla.get("type")
+        self.label = regla.get("label")
+        # trig: términos tal como los usa _is_requirement_context;
+        # *_buscar: los que se buscan como subcadena (NFKC + lower otra vez, como hacía any_in)
+        self.trig = [_nfkc(x).lower() for x in regla.get("trigger_any", [])]
+        self.trig_buscar = _terminos_buscar(self.trig)
+        self.cv_buscar = _terminos_buscar([_nfkc(x).lower() for x in regla.get("cv_any", [])])
+        self.require_buscar = _terminos_buscar([_nfkc(x).lower() for x in regla.get("require_any", [])])
+        self.level_regex = _compilar_nivel(regla.get("level_regex"))
+        self.level_synonyms = regla.get("level_synonyms") or {}
+
+
+class ReglaHotfix:
+    """
+    Regla "domain_years" / "credential_required" lista para evaluar: cada lista de
+    regex unida en una sola alternancia IGNORECASE (una búsqueda por texto en lugar
+    de una por patrón) y los términos de subcadena ya pasados por NFKC + lower.
+    """
+
+    __slots__ = ("regla", "tipo", "label", "fase", "offer_regex", "years_regex", "cv_regex",
+                 "cv_years_regex", "role_regex", "role_message", "message", "scope_regex",
+                 "scope_raw", "scope_fallback", "offer_any", "require_any", "cv_any", "once")
+
+    def __init__(self, regla: dict, compilar):
+        self.regla = regla
+        self.tipo = regla.get("type")
+        self.label = regla.get("label") or ""
+        self.fase = regla.get("phase") or "pre_experience"
+        # compilar(): patrón (o lista de patrones) -> regex compartida entre reglas
+        self.offer_regex = compilar(regla.get("offer_regex"))
+        self.years_regex = compilar(regla.get("years_regex"))
+        self.cv_regex = compilar(regla.get("cv_regex"))
+        self.cv_years_regex = compilar(regla.get("cv_years_regex"))
+        self.role_regex = compilar(regla.get("role_regex"))
+        self.role_message = regla.get("role_message")
+        self.message = regla.get("message") or "Experiencia mínima requerida: {years} años en {label}"
+        self.scope_regex = compilar(regla.get("scope_regex"))
+        self.scope_raw = regla.get("scope_source") == "raw"
+        self.scope_fallback = bool(regla.get("scope_fallback"))
+        self.offer_any = _terminos_buscar([_nfkc(x).lower() for x in regla.get("offer_any", [])])
+        self.require_any = _terminos_buscar([_nfkc(x).lower() for x in regla.get("require_any", [])])
+        self.cv_any = _terminos_buscar([_nfkc(x).lower() for x in regla.get("cv_any", [])])
+        self.once = bool(regla.get("once"))
+
+    def evaluar(self, busquedas, texto_oferta) -> Optional[str]:
+        """Texto para no_cumple si la oferta lo exige y el CV no lo evidencia; si no, None."""
+        if self.tipo == "domain_years":
+            return self._evaluar_anios(busquedas)
+        return self._evaluar_credencial(busquedas, texto_oferta)
+
+    def _evaluar_anios(self, b) -> Optional[str]:
+        # ¿La oferta menciona este dominio?
+        if self.offer_regex is not None and not b.oferta_tiene(self.offer_regex):
+            return None
+        m = b.oferta_tiene(self.years_regex)
+        if m:
+            if b.cv_tiene(self.cv_regex) and b.cv_tiene(self.cv_years_regex):
+                return None
+            return self.message.format(years=int(m.group(1)), label=self.label)
+        if self.role_regex is not None and b.oferta_tiene(self.role_regex) and not b.cv_tiene(self.cv_regex):
+            return self.role_message
+        return None
+
+    def _evaluar_credencial(self, b, texto_oferta) -> Optional[str]:
+        texto = None  # None: toda la oferta (búsquedas compartidas)
+        if self.scope_regex is not None:
+            m = self.scope_regex.search((texto_oferta or "") if self.scope_raw else b.oferta)
+            if m:
+                texto = m.group(1).lower()
+            elif not self.scope_fallback:
+                return None
+        en = b.oferta if texto is None else texto
+        pide = any(t in en for t in self.offer_any) or (
+            self.offer_regex is not None and (
+                b.oferta_tiene(self.offer_regex) if texto is None else self.offer_regex.search(texto)
+            )
+        )
+        if not pide:
+            return None
+        if self.require_any and not any(t in en for t in self.require_any):
+            return None
+        if any(k in b.cv for k in self.cv_any) or b.cv_tiene(self.cv_regex):
+            return None
+        return self.label
+
+
+class _BusquedasHotfix:
+    """Resultados de regex sobre la oferta y el CV de una evaluación: cada patrón se busca una vez."""
+
+    __slots__ = ("oferta", "cv", "_oferta", "_cv")
+
+    def __init__(self, oferta: str, cv: str):
+        self.oferta = oferta
+        self.cv = cv
+        self._oferta = {}
+        self._cv = {}
+
+    def oferta_tiene(self, rx):
+        if rx is None:
+            return None
+        if rx not in self._oferta:
+            self._oferta[rx] = rx.search(self.oferta)
+        return self._oferta[rx]
+
+    def cv_tiene(self, rx):
+        if rx is None:
+            return None
+        if rx not in self._cv:
+            self._cv[rx] = rx.search(self.cv)
+        return self._cv[rx]
+
+
+class ReglasCompiladas:
+    """
+    Resultado de load_rules() compilado una vez: reglas declarativas (con el autómata
+    de sus triggers), hotfixes declarativos, experience_regex y términos de la captura
+    libre (prefijos, cabeceras, viñetas) ya normalizados.
+    """
+
+    def __init__(self, datos: dict):
+        self.datos = datos
+        reglas = datos.get("rules", [])
+        self.reglas = [ReglaCompilada(r) for r in reglas if r.get("type") not in HOTFIX_TYPES]
+        # Hotfixes por fase, en el orden del JSON (una regex inválida descarta la regla)
+        self._patrones: Dict[str, re.Pattern] = {}
+        self.hotfixes: Dict[str, List[ReglaHotfix]] = {"pre_experience": [], "post_experience": []}
+        for r in reglas:
+            if r.get("type") in HOTFIX_TYPES:
+                try:
+                    hotfix = ReglaHotfix(r, self._compilar)
+                except (re.error, TypeError):
+                    continue
+                self.hotfixes.setdefault(hotfix.fase, []).append(hotfix)
+        # Autómata de triggers: término -> reglas que lo usan (un término vacío dispara siempre)
+        self._por_termino: Dict[str, List[int]] = {}
+        self._siempre: List[int] = []
+        for i, r in enumerate(self.reglas):
+            for t in r.trig_buscar:
+                if t:
+                    self._por_termino.setdefault(t, []).append(i)
+                elif not self._siempre or self._siempre[-1] != i:
+                    self._siempre.append(i)
+        self.escaner_triggers = EscanerSubcadenas(self._por_termino)
+        rex = datos.get("experience_regex")
+        self.experiencia_regex = re.compile(rex, flags=re.IGNORECASE) if rex else None
+        self.prefijos = [_nfkc(p).lower() for p in (datos.get("knowledge_prefixes", []) or [])]
+        self.cabeceras = [_nfkc(h).lower() for h in (datos.get("knowledge_section_headers", []) or [])]
+        self.bullets = datos.get("bullet_markers", ["•","-","*","·"])
+
+
+    def candidatas(self, oferta: str) -> list:
+        """
+        Reglas (en su orden) con algún trigger presente en `oferta`: una pasada del
+        autómata en lugar de recorrer los términos de cada regla.
+        """
+        idx = set(self._siempre)
+        for t in self.escaner_triggers.presentes(oferta):
+            idx.update(self._por_termino[t])
+        return [self.reglas[i] for i in sorted(idx)]
+
+    def _compilar(self, patrones):
+        # Lista -> (?:p1)|(?:p2)|...: una búsqueda de la alternancia equivale a any(search)
+        if not patrones:
+            return None
+        if not isinstance(patrones, str):
+            patrones = "|".join(f"(?:{p})" for p in patrones)
+        rx = self._patrones.get(patrones)
+        if rx is None:
+            rx = self._patrones[patrones] = re.compile(patrones, flags=re.IGNORECASE)
+        return rx
+
+    def aplicar_hotfixes(self, fase: str, texto_oferta: str, busquedas, no_cumple: List[str]):
+        """Añade a no_cumple lo que marquen los hotfixes de `fase` (en su orden)."""
+        for hotfix in self.hotfixes.get(fase, ()):
+            try:
+                falta = hotfix.evaluar(busquedas, texto_oferta)
+            except Exception:
+                continue
+            if falta and not (hotfix.once and falta in no_cumple):
+                no_cumple.append(falta)
+
+
+def _terminos_buscar(terminos: List[str]) -> List[str]:
+    buscar = [_nfkc(t).lower() for t in terminos]
+    return terminos if buscar == terminos else buscar
+
+
+def _compilar_nivel(patron):
+    # Una level_regex inválida se deja como texto: falla al usarse, como antes
+    if not patron:
+        return patron
+    try:
+        return re.compile(patron)
+    except re.error:
+        return patron
+
+
+# Se recompila solo si cambia el archivo de reglas: primero se mira (mtime, tamaño)
+# y, si cambió, el hash del contenido (un guardado sin cambios no recompila)
+_REGLAS_CACHE = {"firma": None, "hash": None, "reglas": None}
+_REGLAS_LOCK = threading.Lock()
+_REGLAS_STATS = {"compilaciones": 0, "reutilizadas": 0}
+
+
+def _firma_reglas():
+    try:
+        st = os.stat(RULES_FILE)
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _hash_reglas():
+    try:
+        with open(RULES_FILE, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def reglas_compiladas() -> ReglasCompiladas:
+    """
+    Reglas de load_rules() compiladas y cacheadas en memoria; se invalidan cuando
+    cambia el mtime/tamaño y el contenido de requirements_rules.json.
+    """
+    firma = _firma_reglas()
+    with _REGLAS_LOCK:
+        cache = _REGLAS_CACHE
+        if cache["reglas"] is not None:
+            if firma == cache["firma"]:
+                _REGLAS_STATS["reutilizadas"] += 1
+                return cache["reglas"]
+            h = _hash_reglas()
+            if h is not None and h == cache["hash"]:
+                cache["firma"] = firma
+                _REGLAS_STATS["reutilizadas"] += 1
+                return cache["reglas"]
+
+        reglas = ReglasCompiladas(load_rules())
+        # load_rules() puede (re)escribir el archivo: la firma se toma después
+        cache.update(firma=_firma_reglas(), hash=_hash_reglas(), reglas=reglas)
+        _REGLAS_STATS["compilaciones"] += 1
+        return reglas
+
+
+def version_evaluacion() -> tuple:
+    """
+    Versión de lo que decide una evaluación (parte de la clave de memo_requisitos):
+    hash del archivo de reglas, versión del código y modelo spaCy instalado.
+    No carga el modelo: un acierto de la caché no debe pagar la carga de spaCy.
+    """
+    reglas_compiladas()
+    with _REGLAS_LOCK:
+        h = _REGLAS_CACHE["hash"]
+    return (h or "reglas-por-defecto", memo_requisitos.version_codigo(),
+            modelo_nlp.firma_modelo_instalado() or "sin-modelo")
+
+
+def repetir_aprendizaje(efectos):
+    """Repite los learn_requirement() anotados de una evaluación servida desde la caché."""
+    try:
+        for phrase, inc in efectos:
+            learn_requirement(phrase, inc)
+    except Exception:
+        pass
+
+
+def limpiar_cache_reglas():
+    with _REGLAS_LOCK:
+        _REGLAS_CACHE.update(firma=None, hash=None, reglas=None)
+
+
+def stats_reglas() -> dict:
+    with _REGLAS_LOCK:
+        return dict(_REGLAS_STATS)
+
+
 # ---------- Canonicalización de bullets / frases libres ----------
 _CANON_MAP = [
     # (si contiene TODOS estos términos) -> etiqueta corta
@@ -882,6 +1363,31 @@ _SEP_CUT = r"[:;\.\-–—]"
 def _nfkc(s: str) -> str:
     return unicodedata.normalize("NFKC", s or "")
 
+# Palabras que indican contexto de requisito/exclusión
+_REQ_MARKERS = [
+    "requisito", "requisitos", "requerido", "requerida",
+    "indispensable", "imprescindible",
+    "obligatorio", "obligatoria",
+    "debe ", "deben ", "deberá", "debera",
+    "excluyente", "excluyentes",
+    "must", "must have", "se requiere", "se solicitará", "se solicitara"
+]
+
+# Cabeceras típicas bajo las cuales suele listarse lo requerido
+_HEADER_MARKERS = [
+    "requisitos", "perfil requerido", "perfil del cargo",
+    "lo que buscamos", "lo que esperamos", "perfil del puesto"
+]
+
+
+def _marcas_lineas(estructura) -> list:
+    """[(línea, tiene marcador de requisito, tiene cabecera)] una vez por oferta."""
+    return [
+        (line, any(t in line for t in _REQ_MARKERS), any(t in line for t in _HEADER_MARKERS))
+        for line in estructura.lineas_minusculas
+    ]
+
+
 def _is_requirement_context(oferta_text: str, trigger_terms: List[str]) -> bool:
     """
     Devuelve True si alguno de los términos de trigger aparece en un contexto
@@ -890,49 +1396,30 @@ def _is_requirement_context(oferta_text: str, trigger_terms: List[str]) -> bool:
     Usa:
       - palabras tipo: requisito, requerido, indispensable, obligatorio, debe, excluyente, etc.
       - cercanía a cabeceras como 'Requisitos', 'Perfil requerido', etc.
+    Las líneas y sus marcadores salen de EstructuraOferta (calculados una vez por oferta).
     """
     if not oferta_text or not trigger_terms:
         return False
 
-    oferta_low = oferta_text.lower()
-    lines = oferta_low.splitlines()
-
-    # Palabras que indican contexto de requisito/exclusión
-    req_markers = [
-        "requisito", "requisitos", "requerido", "requerida",
-        "indispensable", "imprescindible",
-        "obligatorio", "obligatoria",
-        "debe ", "deben ", "deberá", "debera",
-        "excluyente", "excluyentes",
-        "must", "must have", "se requiere", "se solicitará", "se solicitara"
-    ]
-
-    # Cabeceras típicas bajo las cuales suele listarse lo requerido
-    header_markers = [
-        "requisitos", "perfil requerido", "perfil del cargo",
-        "lo que buscamos", "lo que esperamos", "perfil del puesto"
-    ]
-
-    def line_has_any(line: str, terms: List[str]) -> bool:
-        return any(t in line for t in terms)
+    estructura = estructura_de(oferta_text)
+    if not any(t in estructura.texto.minusculas for t in trigger_terms):
+        return False
+    lines = estructura.memo("marcas_requisito", lambda: _marcas_lineas(estructura))
 
-    for idx, raw_line in enumerate(lines):
+    for idx, (raw_line, _req, _cab) in enumerate(lines):
         
         if not any(t in raw_line for t in trigger_terms):
             continue
 
         # 1) Si en la misma línea ya hay marcadores de requisito → contexto claro
-        if line_has_any(raw_line, req_markers):
-            return True
-
         # 2) Revisar línea anterior y siguiente, por si el marcador está justo al lado
         for j in range(max(0, idx - 1), min(len(lines) - 1, idx + 1) + 1):
-            if line_has_any(lines[j], req_markers):
+            if lines[j][1]:
                 return True
 
         # 3) Revisar algunas líneas hacia atrás buscando una cabecera tipo "Requisitos"
         for k in range(max(0, idx - 4), idx):
-            if line_has_any(lines[k], header_markers):
+            if lines[k][2]:
                 return True
 
     # Si ningún patrón de contexto se cumplió, asumimos que NO es requisito excluyente
@@ -969,19 +1456,26 @@ def _canonicalize_requirement(area_raw: str) -> str:
         return short
     return t[:60]
 
-def _cv_contains(cv_low: str, tag: str) -> bool:
+def _cv_normalizado(cv_low: str) -> str:
+    """Normalización simple del CV para _cv_contains (sin puntuación rara)."""
+    return re.sub(r"[^a-záéíóúñü0-9\s]", " ", cv_low)
+
+
+def _cv_contains(cv_low: str, tag: str, cv_n: str = None) -> bool:
     """
     Búsqueda tolerante:
         - Match directo por substring (tag completo)
         - Para acrónimos/siglas (MBA, PMP, ITIL, COBIT...), basta 1 hit
         - Para frases normales, exige >=2 tokens relevantes
+    cv_n: _cv_normalizado(cv_low) ya calculado (bucles sobre muchas etiquetas).
     """
     tag = (tag or "").strip().lower()
     if not tag:
         return False
 
     # normalización simple para comparar sin puntuación rara
-    cv_n = re.sub(r"[^a-záéíóúñü0-9\s]", " ", cv_low)
+    if cv_n is None:
+        cv_n = _cv_normalizado(cv_low)
     tag_n = re.sub(r"[^a-záéíóúñü0-9\s]", " ", tag)
 
     if tag_n in cv_n:
@@ -1002,7 +1496,68 @@ def _cv_contains(cv_low: str, tag: str) -> bool:
 
 
 
-def _semantic_requirement_match(rule: dict, cv_text: str) -> bool:
+# Verbos vacíos que no cuentan como evidencia semántica
+_LEMAS_VACIOS = {"ser", "estar", "tener", "hacer", "poder", "deber"}
+
+# Lemas relevantes por tupla de triggers: se calculan una vez por proceso
+_LEMAS_TRIGGERS: Dict[tuple, frozenset] = {}
+
+
+def _lemas_relevantes(doc) -> set:
+    out = set()
+    for tok in doc:
+        if not tok.is_alpha:
+            continue
+        lem = tok.lemma_.lower()
+        # Filtramos verbos vacíos y cosas muy cortas
+        if len(lem) < 3:
+            continue
+        if lem in _LEMAS_VACIOS:
+            continue
+        out.add(lem)
+    return out
+
+
+def _lemas_trigger(triggers: List[str]) -> frozenset:
+    """Lemas relevantes del texto representativo de la regla (todos los triggers unidos)."""
+    clave = tuple(triggers)
+    if clave not in _LEMAS_TRIGGERS:
+        try:
+            # Solo se leen lemas: perfil sin parser ni NER
+            doc_trig = modelo_nlp.procesar(" ".join(triggers).lower(), "lemas")
+            lemas = frozenset(_lemas_relevantes(doc_trig)) if doc_trig else frozenset()
+        except Exception:
+            # Error transitorio del modelo: no se memoriza
+            return frozenset()
+        _LEMAS_TRIGGERS[clave] = lemas
+    return _LEMAS_TRIGGERS[clave]
+
+
+def _lemas_cv_semanticos(cv_text: str, ctx=None) -> set:
+    """
+    Lemas relevantes del CV completo para el respaldo semántico.
+    evaluate_requirements lo calcula una sola vez por llamada; con ctx se comparte
+    además entre las llamadas del mismo análisis.
+    """
+    if _get_req_nlp() is None:
+        return set()
+    cv_text = (cv_text or "").strip().lower()
+    if not cv_text:
+        return set()
+
+    def _calc():
+        try:
+            doc_cv = ctx.doc(cv_text, "lemas") if ctx is not None else modelo_nlp.procesar(cv_text, "lemas")
+        except Exception:
+            return set()
+        return _lemas_relevantes(doc_cv) if doc_cv else set()
+
+    if ctx is not None:
+        return ctx.memo(("lemas_requisitos", cv_text), _calc)
+    return _calc()
+
+
+def _semantic_requirement_match(rule: dict, cv_text: str, ctx=None, lemas_cv=None) -> bool:
     """
     Verifica de forma genérica si el requisito está cubierto por el CV usando lemas.
     Idea: si al menos un lema relevante de los 'trigger_any' de la regla
@@ -1013,278 +1568,72 @@ def _semantic_requirement_match(rule: dict, cv_text: str) -> bool:
       trigger_any: ["metodologías ágiles", "agile", "scrum", "kanban"]
       CV: "proyectos ágiles", "transformación ágil"
       => comparten el lema 'ágil' → se da por cumplido.
+
+    lemas_cv: lemas del CV ya calculados (evaluate_requirements los pasa para no
+    analizar el CV una vez por regla); si es None se calculan aquí.
     """
     nlp = _get_req_nlp()
     if nlp is None:
         return False
 
-    cv_text = (cv_text or "").strip()
-    if not cv_text:
+    if not (cv_text or "").strip():
         return False
 
     triggers = rule.get("trigger_any", []) or []
     if not triggers:
         return False
 
-    try:
-        # Texto representativo del requisito (uniendo todos los triggers)
-        doc_trig = nlp(" ".join(triggers).lower())
-        # CV completo
-        doc_cv = nlp(cv_text.lower())
-    except Exception:
+    lem_trig = _lemas_trigger(triggers)
+    if not lem_trig:
         return False
 
-    if not doc_trig or not doc_cv:
+    if lemas_cv is None:
+        lemas_cv = _lemas_cv_semanticos(cv_text, ctx)
+    if not lemas_cv:
         return False
 
-    def _lemmas_relevantes(doc):
-        out = set()
-        for tok in doc:
-            if not tok.is_alpha:
-                continue
-            lem = tok.lemma_.lower()
-            # Filtramos verbos vacíos y cosas muy cortas
-            if len(lem) < 3:
-                continue
-            if lem in {"ser", "estar", "tener", "hacer", "poder", "deber"}:
-                continue
-            out.add(lem)
-        return out
-
-    lem_trig = _lemmas_relevantes(doc_trig)
-    lem_cv   = _lemmas_relevantes(doc_cv)
-
-    if not lem_trig or not lem_cv:
-        return False
-
-    inter = lem_trig.intersection(lem_cv)
-
     # Si hay al menos un lema en común, asumimos que el dominio está presente
-    return len(inter) >= 1
+    return not lem_trig.isdisjoint(lemas_cv)
 
 
 
 
 # ---------------- evaluación principal ----------------
-def evaluate_requirements(texto_oferta: str, texto_cv: str):
-    """Evalúa requisitos usando reglas JSON. Devuelve dict {cumple, no_cumple, alerta}."""
-    oferta = _nfkc(texto_oferta or "").lower()
-    cv = _nfkc(texto_cv or "").lower()
-    cfg = load_rules()
-    rules = cfg.get("rules", [])
+def evaluate_requirements(texto_oferta: str, texto_cv: str, ctx=None):
+    """
+    Evalúa requisitos usando reglas JSON. Devuelve dict {cumple, no_cumple, alerta}.
+    ctx (ContextoAnalisis, opcional): reutiliza los lemas del CV del análisis en curso.
+    Memoizado por (oferta, CV, version_evaluacion()) en memo_requisitos.
+    """
+    return memo_requisitos.memoizado(
+        "evaluate_requirements", texto_oferta, texto_cv, version_evaluacion(),
+        lambda: _evaluar_requisitos(texto_oferta, texto_cv, ctx), repetir_aprendizaje
+    )
+
+
+def _evaluar_requisitos(texto_oferta: str, texto_cv: str, ctx=None):
+    oferta = vista_nfkc(texto_oferta)
+    cv = vista_nfkc(texto_cv)
+    compiladas = reglas_compiladas()  # load_rules() compilado; se relee solo si cambia el JSON
 
     cumple: List[str] = []
     no_cumple: List[str] = []
     no_cumple_soft: List[str] = []  # (deseables / blandos)
     alerta = False                  # (se recalcula al final)
+    lemas_cv_sem = None             # lemas del CV para el respaldo semántico (perezoso)
 
 
-    def any_in(text, terms):
-        return any((_nfkc(t).lower() in text) for t in (terms or []))
-
-    # --- HOTFIX mercadeo/marketing: "Mínimo X años ... mercadeo/marketing" ---
-    # Motivo: hay ofertas que redactan la experiencia mínima en una sola frase;
-    # este hotfix dispara exclusión si el CV no evidencia dominio + experiencia.
-    try:
-        m_mkt = re.search(r"(?:mínimo|minimo)\s*(\d+)\s*años[^.\n]*\b(mercadeo|marketing)\b", oferta, flags=re.IGNORECASE)
-        if m_mkt:
-            years_req = int(m_mkt.group(1))
-            cv_has_domain = re.search(r"\b(mercadeo|marketing)\b", cv, flags=re.IGNORECASE)
-            cv_has_years = re.search(r"(\d+)\s*años|\bexperienci[ae]\b", cv, flags=re.IGNORECASE)
-            if not (cv_has_domain and cv_has_years):
-                no_cumple.append(f"Experiencia mínima requerida: {years_req} años en mercadeo/marketing")
-    except Exception:
-        pass
-
-    # --- Refuerzo "Nivel Educativo: Profesional en Mercadeo/Administración/Economía/Ing. Industrial" ---
-    # Dispara exclusión si el CV no tiene ninguna de estas carreras (detección simple por palabras ancla).
-    try:
-        educ_line = re.search(r"nivel\s+educativo\s*:\s*([^.\n]+)", oferta, flags=re.IGNORECASE)
-        if educ_line:
-            educ_text = educ_line.group(1)
-            triggers = [
-                "profesional en mercadeo", "profesional en marketing",
-                "profesional en administración", "profesional en administracion",
-                "profesional en economía", "profesional en economia",
-                "profesional en ingeniería industrial", "profesional en ingenieria industrial",
-                "carreras afines"
-            ]
-            if any(t in educ_text for t in triggers):
-                cv_any = [
-                    "mercadeo", "marketing",
-                    "administración", "administracion",
-                    "economía", "economia",
-                    "ingeniería industrial", "ingenieria industrial"
-                ]
-                if not any(k in cv for k in cv_any):
-                    no_cumple.append("Título requerido: Profesional en Mercadeo/Administración/Economía/Ingeniería Industrial (o afines)")
-    except Exception:
-        pass    
-
-
-    # --- HOTFIX ENFERMERÍA (profesión/título requerido) ---
-    # Si la oferta menciona cargo/rol de enfermería y el CV no lo evidencia, excluye explícitamente.
-    try:
-        nurse_triggers = [
-            "enfermera jefe", "enfermera líder", "enfermera lider", "enfermera coordinadora",
-            "enfermera", "enfermero", "enfermería", "enfermeria",
-            "profesional de enfermería", "profesional de enfermeria"
-        ]
-        oferta_pide_enfermeria = any(t in oferta for t in nurse_triggers) or bool(
-            re.search(r"\benfermer[oa]s?\b|\benfermer[ií]a\b", oferta, flags=re.IGNORECASE)
-        )
-
-        if oferta_pide_enfermeria:
-            nurse_cv_any = [
-                "enfermera", "enfermero", "enfermería", "enfermeria",
-                "licenciatura en enfermería", "licenciatura en enfermeria",
-                "colegio de enfermería", "colegio de enfermeria",
-                "rn "  # Registered Nurse (si aparece en CV importado)
-            ]
-            cv_evidencia_enfermeria = any(k in cv for k in nurse_cv_any) or bool(
-                re.search(r"\benfermer[oa]s?\b|\benfermer[ií]a\b", cv, flags=re.IGNORECASE)
-            )
-            if not cv_evidencia_enfermeria:
-                no_cumple.append("Título/Licencia en Enfermería requerido")
-    except Exception:
-        pass
-
-
-    # --- Refuerzo específico: Requerimientos con posgrado en Salud (sobre base ENFERMERÍA) ---
-    try:
-        # Detecta frases del tipo: "Enfermera Jefe con posgrado en Auditoría en Salud / Salud Pública / Epidemiología"
-        req_line = re.search(r"requerimientos\s*([\s\S]+?)\n\n", texto_oferta, flags=re.IGNORECASE)
-        req_block = req_line.group(1).lower() if req_line else oferta  # usa todo si no aislamos el bloque
-        if ("enfermera" in req_block or re.search(r"\benfermer[oa]\b", req_block)) and (
-            "auditoría en salud" in req_block or "auditoria en salud" in req_block
-            or "salud pública" in req_block or "salud publica" in req_block
-            or "epidemiología" in req_block or "epidemiologia" in req_block
-        ):
-            # aquí reforzamos la profesión si falta en CV:
-            if not (re.search(r"\benfermer[oa]s?\b|\benfermer[ií]a\b", cv, flags=re.IGNORECASE) or
-                    any(k in cv for k in ["licenciatura en enfermería", "licenciatura en enfermeria",
-                                          "colegio de enfermería", "colegio de enfermeria", " rn "])):
-                if "Título/Licencia en Enfermería requerido" not in no_cumple:
-                    no_cumple.append("Título/Licencia en Enfermería requerido")
-    except Exception:
-        pass
-
-
-    # --- HOTFIX DOMINIOS CON EXPERIENCIA MÍNIMA (Comercial, RRHH, Auditoría, Logística/SC, Analítica/BI/Datos) ---
-    # Si la oferta exige X años en un dominio y el CV no lo evidencia, excluye.
-    # Además: para Comercial, si el cargo es explícito (Gerente/Director Comercial) pero el CV no evidencia dominio, también excluye.
-    try:
-        domains = [
-            {
-                "label": "área comercial/ventas",
-                "offer_patterns": [
-                    r"\b(gerente|director|jefe)\s+comercial\b", r"\bcomercial(es)?\b", r"\bventas?\b",
-                    r"\bt[eé]cnicas\s+de\s+venta\b", r"\bventa\s+consultiva\b", r"\bpipeline\b", r"\bembudo\b"
-                ],
-                "cv_patterns": [
-                    r"\bcomercial(es)?\b", r"\bventas?\b", r"\bventa\s+consultiva\b", r"\bcrm\b",
-                    r"\bpipeline\b", r"\bembudo\b", r"\bforecast\b", r"\bcuota(s)?\b"
-                ],
-                "strong_role_only": True  # además del chequeo con años, dispara si hay rol fuerte sin evidencias
-            },
-            {
-                "label": "recursos humanos",
-                "offer_patterns": [
-                    r"\brecursos\s+humanos\b", r"\brrhh\b", r"\btalento\s+humano\b",
-                    r"\bgesti[oó]n\s+humana\b", r"\bselecci[oó]n\b", r"\breclutamiento\b"
-                ],
-                "cv_patterns": [
-                    r"\brecursos\s+humanos\b", r"\brrhh\b", r"\btalento\s+humano\b",
-                    r"\bselecci[oó]n\b", r"\breclutamiento\b", r"\bgesti[oó]n\s+humana\b"
-                ],
-                "strong_role_only": False
-            },
-            {
-                "label": "auditoría",
-                "offer_patterns": [
-                    r"\bauditor[ií]a\b", r"\bauditor(es)?\b", r"\baudit\b"
-                ],
-                "cv_patterns": [
-                    r"\bauditor[ií]a\b", r"\bauditor(es)?\b", r"\bcontrol\s+interno\b",
-                    r"\briesgos?\b", r"\bniif\b", r"\bifrs\b"
-                ],
-                "strong_role_only": False
-            },
-            {
-                "label": "logística/cadena de suministro",
-                "offer_patterns": [
-                    r"\blog[ií]stic[ao]\b", r"\bsupply\s*chain\b", r"\bcadena\s+de\s+suministro\b",
-                    r"\balmac[eé]n\b", r"\binventari[oa]s\b", r"\bdistribuci[oó]n\b",
-                    r"\bcentros?\s+de\s+distribuci[oó]n\b"
-                ],
-                "cv_patterns": [
-                    r"\blog[ií]stic[ao]\b", r"\bsupply\s*chain\b", r"\bcadena\s+de\s+suministro\b",
-                    r"\bwms\b", r"\btms\b", r"\binventari[oa]s\b", r"\bdistribuci[oó]n\b"
-                ],
-                "strong_role_only": False
-            },
-            {
-                "label": "analítica/BI/datos",
-                "offer_patterns": [
-                    r"\banal[ií]tic[ao]\b", r"\banalytics\b", r"\bbusiness\s+intelligence\b", r"\bbi\b",
-                    r"\bdatos\b", r"\bdata\b", r"\bpower\s*bi\b", r"\btableau\b", r"\blooker\b", r"\betl\b"
-                ],
-                "cv_patterns": [
-                    r"\banal[ií]tic[ao]\b", r"\banalytics\b", r"\bbusiness\s+intelligence\b", r"\bbi\b",
-                    r"\bdatos\b", r"\bdata\b", r"\bsql\b", r"\bpython\b", r"\bpower\s*bi\b", r"\btableau\b",
-                    r"\blooker\b", r"\betl\b"
-                ],
-                "strong_role_only": False
-            },
-        ]
-
-        oferta_low = oferta  # ya viene normalizada a minúsculas por _norm()
-        # 1) Reglas con años de experiencia (mínimo/al menos/experiencia de X años ...)
-        for d in domains:
-            # ¿La oferta menciona este dominio?
-            offer_mentions = any(re.search(p, oferta_low, flags=re.IGNORECASE) for p in d["offer_patterns"])
-            if not offer_mentions:
-                continue
-
-            # ¿Indica años mínimos?
-            m_years = re.search(
-                r"(?:m[ií]n(?:imo)?|al\s+menos|experiencia\s+de)\s*(\d+)\s*a[nñ]os",
-                oferta_low, flags=re.IGNORECASE
-            )
-
-            if m_years:
-                years_req = int(m_years.group(1))
-                # Evidencia en CV
-                cv_has_domain = any(re.search(p, cv, flags=re.IGNORECASE) for p in d["cv_patterns"])
-                cv_has_years  = re.search(r"(\d+)\s*a[nñ]os|\bexperienci[ae]\b", cv, flags=re.IGNORECASE)
-                if not (cv_has_domain and cv_has_years):
-                    no_cumple.append(f"Experiencia mínima requerida: {years_req} años en {d['label']}")
-            else:
-                # 2) Solo para Comercial: si hay rol fuerte (Gerente/Director/Jefe Comercial) y CV no evidencia dominio
-                if d.get("strong_role_only"):
-                    strong_role = re.search(r"\b(gerente|director|jefe)\s+comercial\b", oferta_low, flags=re.IGNORECASE)
-                    if strong_role:
-                        cv_has_domain = any(re.search(p, cv, flags=re.IGNORECASE) for p in d["cv_patterns"])
-                        if not cv_has_domain:
-                            no_cumple.append("Experiencia requerida en área comercial/ventas no evidenciada")
-    except Exception:
-        pass
-
+    # Hechos del CV (una sola pasada por texto, compartida con analisis_basico)
+    hechos_del_cv = hechos_cv(texto_cv)
 
+    # Hotfixes declarativos (mercadeo, nivel educativo, enfermería, dominios con años):
+    # reglas "domain_years" / "credential_required" del JSON, ya compiladas
+    busquedas = _BusquedasHotfix(oferta, cv)
+    compiladas.aplicar_hotfixes("pre_experience", texto_oferta, busquedas, no_cumple)
 
     # 1) Experiencia mínima (con dominio)
-    rex = cfg.get("experience_regex")
+    rex = compiladas.experiencia_regex
     if rex:
-        # Dominio: mapeo de palabras clave → etiqueta amigable
-        domain_map = [
-            (r"(servicios\s+compartidos|shared\s+services|ssc)", "servicios compartidos (ssc)"),
-            (r"(mercadeo|marketing)", "mercadeo/marketing"),
-            (r"(comercial|ventas)", "área comercial/ventas"),
-            (r"(log[ií]stic[ao]|supply\s+chain|cadena\s+de\s+suministro)", "logística/cadena de suministro"),
-            (r"(sector\s+salud|hospital|cl[ií]nica|ips)", "sector salud"),
-            (r"(financier[oa]|banca|entidad\s+financiera)", "sector financiero"),
-        ]
-
         lines = oferta.splitlines() or [oferta]
         extracted_domain = None
         required_years = None
@@ -1292,7 +1641,7 @@ def evaluate_requirements(texto_oferta: str, texto_cv: str):
         # Busca 'Mínimo X años...' en cada línea, sin sensibilidad a mayúsculas
         for raw in lines:
             low = raw.lower()
-            m = re.search(rex, low, flags=re.IGNORECASE)
+            m = rex.search(low)
             if not m:
                 continue
             try:
@@ -1302,8 +1651,8 @@ def evaluate_requirements(texto_oferta: str, texto_cv: str):
 
             # intenta atar el dominio usando el resto de la línea
             dom = None
-            for pat, label in domain_map:
-                if re.search(pat, low, flags=re.IGNORECASE):
+            for rx_dom, label in DOMAIN_MAP:
+                if rx_dom.search(low):
                     dom = label
                     break
 
@@ -1314,18 +1663,17 @@ def evaluate_requirements(texto_oferta: str, texto_cv: str):
 
         if extracted_domain and required_years is not None:
             # Evidencia de dominio + experiencia en CV
-            dom_hint = any(re.search(pat, cv, flags=re.IGNORECASE)
-                           for pat, label in domain_map if label == extracted_domain)
-            has_years = bool(re.search(r"(\d+)\s*años|\bexperienci[ae]\b", cv, flags=re.IGNORECASE))
+            dom_hint = any(rx_dom.search(cv) for rx_dom, label in DOMAIN_MAP if label == extracted_domain)
+            has_years = hechos_del_cv.anios_o_experiencia
             if not (dom_hint and has_years):
                 no_cumple.append(f"Experiencia mínima requerida: {required_years} años en {extracted_domain}")
         else:
             # sin dominio explícito; usa el comportamiento general
-            m = re.search(rex, oferta, flags=re.IGNORECASE)
+            m = rex.search(oferta)
             if m:
                 try:
                     years = int(m.group(2))
-                    if not re.search(r"(\d+\s*años)|\bexperienci[ae]\b", cv, flags=re.IGNORECASE):
+                    if not hechos_del_cv.anios_o_experiencia:
                         no_cumple.append(f"Experiencia mínima requerida: {years} años")
                 except Exception:
                     pass
@@ -1340,49 +1688,28 @@ def evaluate_requirements(texto_oferta: str, texto_cv: str):
     except Exception:
         pass
 
-    try:
-    # Dispara si la oferta exige "Profesional en Mercadeo/Administración/Economía/Ing. Industrial"
-        degree_triggers = [
-            "profesional en mercadeo", "profesional en marketing",
-            "profesional en administración", "profesional en administracion",
-            "profesional en economía", "profesional en economia",
-            "profesional en ingeniería industrial", "profesional en ingenieria industrial",
-        ]
-        degree_cv_any = [
-            "mercadeo", "marketing",
-            "administración", "administracion",
-            "economía", "economia",
-            "ingeniería industrial", "ingenieria industrial"
-        ]
-        oferta_has_degree = any(t in oferta for t in degree_triggers)
-        if oferta_has_degree:
-            if not any(k in cv for k in degree_cv_any):
-                no_cumple.append("Título requerido: Profesional en Mercadeo/Administración/Economía/Ingeniería Industrial (o afines)")
-    except Exception:
-        pass
+    # Hotfixes que van tras la experiencia (título "Profesional en Mercadeo/...")
+    compiladas.aplicar_hotfixes("post_experience", texto_oferta, busquedas, no_cumple)
 
     # 2) Reglas declarativas (idiomas/sectores/herramientas/conocimiento/profesión)
-    for rule in rules:
-        rtype = rule.get("type")
-        trig = [ _nfkc(x).lower() for x in rule.get("trigger_any", []) ]
-        cv_need = [ _nfkc(x).lower() for x in rule.get("cv_any", []) ]
-
-        # ¿La oferta pide esto?
-        if not trig or not any_in(oferta, trig):
-            continue
+    # ¿La oferta pide esto? Solo las reglas con algún trigger en la oferta (autómata)
+    for compilada in compiladas.candidatas(oferta):
+        rule = compilada.regla
+        rtype = compilada.tipo
+        trig = compilada.trig
 
         # Evidencia fuerte opcional (evita falsos positivos)
-        require_any = [ _nfkc(x).lower() for x in rule.get("require_any", []) ]
-        if require_any and not any_in(oferta, require_any):
+        require_any = compilada.require_buscar
+        if require_any and not any(t in oferta for t in require_any):
             continue
 
         # ===== Idiomas =====
         if rtype == "language":
-            lvl_regex = rule.get("level_regex")
-            lvl_syn   = rule.get("level_synonyms") or {}
+            lvl_regex = compilada.level_regex
+            lvl_syn   = compilada.level_synonyms
 
             req_level = extract_level(oferta, lvl_regex, lvl_syn)
-            cv_mentions = any_in(cv, trig)
+            cv_mentions = any(t in cv for t in compilada.trig_buscar)
             cv_level    = extract_level(cv, lvl_regex, lvl_syn) if cv_mentions else None
 
             if not cv_mentions:
@@ -1396,9 +1723,11 @@ def evaluate_requirements(texto_oferta: str, texto_cv: str):
                         no_cumple.append(f"Nivel de {base.lower()} no evidenciado")
             continue
 
-        if not any_in(cv, cv_need):
-            # intentar semántico
-            if _semantic_requirement_match(rule, cv):
+        if not any(t in cv for t in compilada.cv_buscar):
+            # intentar semántico (lemas del CV: una sola vez por evaluación)
+            if lemas_cv_sem is None:
+                lemas_cv_sem = _lemas_cv_semanticos(cv, ctx)
+            if _semantic_requirement_match(rule, cv, ctx=ctx, lemas_cv=lemas_cv_sem):
                 continue
             no_cumple.append(rule["label"])
         else:
@@ -1410,9 +1739,9 @@ def evaluate_requirements(texto_oferta: str, texto_cv: str):
 
 
     # 3) Captura libre: viñetas/prefijos → CANONICALIZACIÓN
-    prefixes = [ _nfkc(p).lower() for p in (cfg.get("knowledge_prefixes", []) or []) ]
-    headers  = [ _nfkc(h).lower() for h in (cfg.get("knowledge_section_headers", []) or []) ]
-    bullets  = cfg.get("bullet_markers", ["•","-","*","·"])
+    prefixes = compiladas.prefijos
+    headers  = compiladas.cabeceras
+    bullets  = compiladas.bullets
 
     if prefixes:
         lines = oferta.splitlines()
@@ -1530,10 +1859,11 @@ def evaluate_requirements(texto_oferta: str, texto_cv: str):
             "otros", "otras", "indispensable", "mandatorio", "obligatorio"
         }
 
+        cv_n = _cv_normalizado(cv)
         for tag in canon_hard:
             if tag in _STOP_TAGS or len(tag) < 4:
                 continue
-            if not _cv_contains(cv, tag):
+            if not _cv_contains(cv, tag, cv_n):
                 no_cumple.append(f"Conocimiento requerido: {tag}")
 
 
@@ -0,0 +1,104 @@
+# ==========================================================
+#  ATS Advisor
+#Herramienta tecnológica de análisis y mejora de postulaciones laborales
+#
+#Desarrollado por Carlos Emilio López (clopezci@hotmail.com)
+#Proyecto independiente con propósito educativo y social
+#Año: 2025-2026
+# ----------------------------------------------------------
+#  Descripción:
+#  ATS Advisor es una herramienta educativa de código abierto
+#  diseñada inicialmente como proyecto académico de fin de máster y posteriormente
+# como herramienta de uso general y apoyo social. Evalúa
+#  la compatibilidad entre una hoja de vida (CV) y una oferta
+#  laboral, simulando el funcionamiento de un sistema ATS.
+#
+#  Propiedad Intelectual:
+#  © 2025 - 2026 Carlos Emilio López
+#  Licencia de uso: Código abierto con fines educativos,
+#  investigación, y mejora libre bajo reconocimiento de autoría.
+#
+#  Descargo de responsabilidad:
+#  Este software se proporciona "tal cual", sin garantía de
+#  precisión o adecuación comercial. El autor
+#  no se hacen responsables del uso indebido ni de decisiones
+#  tomadas con base en sus resultados. Los usuarios pueden
+#  modificar y adaptar el código respetando la autoría original.
+#
+#  Contacto:
+#  Carlos Emilio López - clopezci@hotmail.com
+# ==========================================================
+
+# ==========================
+# snapshot_vocab.py - Snapshot de arranque en caliente del vocabulario derivado
+# ==========================
+# Guarda LEMA_A_PALABRA, vectores de categorías y términos protegidos en un JSON
+# con una clave (hash) de todo lo que los determina: listas de skills,
+# archivos de skills/reglas y modelo spaCy. Si la clave coincide al arrancar,
+# se cargan directamente y se evita volver a analizar los corpus.
+import os
+import json
+import hashlib
+
+FORMATO_SNAPSHOT = 3
+
+
+# --- Rutas amigables para ejecutable (PyInstaller) y desarrollo ---
+def _user_data_dir():
+    try:
+        import sys
+        if getattr(sys, 'frozen', False):
+            base = os.path.join(os.environ.get("APPDATA", os.path.expanduser("~")), "ATS-Advisor")
+            os.makedirs(base, exist_ok=True)
+            return base
+    except Exception:
+        pass
+    return os.path.dirname(__file__)
+
+SNAPSHOT_FILE = os.path.join(_user_data_dir(), "vocab_snapshot.json")
+
+
+def calcular_clave(listas: dict, archivos: list, modelo: str) -> str:
+    """
+    Hash SHA-256 de:
+    - listas de skills ya fusionadas (orden incluido),
+    - contenido binario de los archivos (skills_custom.json, requirements_rules.json...),
+    - nombre y versión del modelo spaCy.
+    """
+    h = hashlib.sha256()
+    h.update(f"formato:{FORMATO_SNAPSHOT}|modelo:{modelo}".encode("utf-8"))
+    h.update(json.dumps(listas, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+    for ruta in archivos:
+        h.update(f"|{os.path.basename(ruta)}:".encode("utf-8"))
+        try:
+            with open(ruta, "rb") as f:
+                h.update(f.read())
+        except OSError:
+            h.update(b"<ausente>")
+    return h.hexdigest()
+
+
+def cargar(clave: str):
+    """Devuelve los datos del snapshot si existe y su clave coincide; si no, None."""
+    try:
+        with open(SNAPSHOT_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    if not isinstance(data, dict) or data.get("clave") != clave:
+        return None
+    return data.get("datos")
+
+
+def guardar(clave: str, datos: dict):
+    """Escritura atómica (archivo temporal + replace). Un fallo de disco no es fatal."""
+    tmp = SNAPSHOT_FILE + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"clave": clave, "datos": datos}, f, ensure_ascii=False)
+        os.replace(tmp, SNAPSHOT_FILE)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass